@@ -7,6 +7,7 @@ import streamlit as st
 from src.state import NewsState
 from src.graph.workflow import news_workflow
 from src.utils.formatters import content_formatter
+from src.rag.retention import retention_job
 import os
 
 # Page configuration
@@ -229,6 +230,10 @@ if st.button("🚀 Generate News Story", type="primary", use_container_width=Tru
         st.error("❌ Please configure your API keys in the .env file")
     else:
         try:
+            # Evict stale articles and compact the vector store while the app runs; started
+            # on the first generation so importing the app never opens Chroma (no-op afterwards)
+            retention_job.get().start()
+            
             # Initialize state
             initial_state = NewsState(
                 topic=topic,
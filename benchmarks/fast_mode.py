@@ -0,0 +1,123 @@
+"""
+Fast-mode benchmark: fused research + editorial-angle call vs. the two-node path.
+Runs the researcher's extraction and the editor on the same articles against
+the local mock server, once as two sequential calls and once as a single
+fused call, and reports latency and token use.
+
+Usage:
+    python benchmarks/fast_mode.py [--runs 10] [--latency 0.4] [--articles 8]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.http_pool import _free_port, _wait_for_port  # noqa: E402
+
+PARAGRAPH = ("{company} said on Tuesday that its new model, {model}, answers questions {pct}% faster "
+             "than the previous release while using less memory. Analysts expect the launch to "
+             "put pressure on rivals ahead of the holiday quarter, and several customers said "
+             "they would test it over the coming weeks.")
+
+
+def make_articles(count: int):
+    """Synthetic search results, varied enough that dedup keeps them all."""
+    from src.state import NewsArticle
+
+    companies = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka"]
+    return [
+        NewsArticle(
+            title=f"{companies[i % len(companies)]} launches model {i}",
+            url=f"https://news{i}.example.com/story",
+            content="\n\n".join(
+                PARAGRAPH.format(company=companies[(i + j) % len(companies)], model=f"M-{i}{j}",
+                                 pct=10 + 7 * i + j)
+                for j in range(4)
+            ),
+            source=f"news{i}.example.com"
+        )
+        for i in range(count)
+    ]
+
+
+def run(fast: bool, runs: int, articles) -> dict:
+    """Run the research extraction + editor stage `runs` times; return latency and tokens."""
+    from langchain_core.callbacks import get_usage_metadata_callback
+    from src.agents.editor import editor_agent
+    from src.agents.researcher import researcher_agent
+    from src.state import NewsState
+
+    researcher, editor = researcher_agent.get(), editor_agent.get()
+    latencies = []
+    with get_usage_metadata_callback() as usage:
+        for _ in range(runs):
+            state = NewsState(topic="AI model launches", format_type="blog", fast_mode=fast)
+            start = time.perf_counter()
+            state = editor.select_angle(researcher.analyze(state, articles))
+            latencies.append(time.perf_counter() - start)
+            assert state.editorial_angle is not None
+
+    totals = {"input_tokens": 0, "output_tokens": 0}
+    for model_usage in usage.usage_metadata.values():
+        for key in totals:
+            totals[key] += model_usage.get(key, 0)
+    return {
+        "mean": statistics.mean(latencies),
+        "p95": sorted(latencies)[int(0.95 * (len(latencies) - 1))],
+        "input_tokens": totals["input_tokens"] / runs,
+        "output_tokens": totals["output_tokens"] / runs
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark fast mode against the two-node path.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.4, help="Mock server seconds per response")
+    parser.add_argument("--articles", type=int, default=8)
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = subprocess.Popen([
+        sys.executable, str(ROOT / "benchmarks" / "mock_openai_server.py"), "--port", str(port),
+        "--latency", str(args.latency)
+    ], stdout=subprocess.DEVNULL)
+    _wait_for_port(port)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "mock")
+    os.environ.setdefault("TAVILY_API_KEY", "mock")
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    from src.config import Config
+    Config.OPENAI_BASE_URL = os.environ["OPENAI_BASE_URL"]
+    Config.OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
+    Config.TAVILY_API_KEY = os.environ["TAVILY_API_KEY"]
+    Config.LLM_CACHE_ENABLED = False
+
+    articles = make_articles(args.articles)
+    try:
+        results = {mode: run(fast, args.runs, articles)
+                   for mode, fast in (("two-node", False), ("fast", True))}
+    finally:
+        server.terminate()
+
+    print(f"\n{args.runs} runs, {args.articles} articles, mock latency {args.latency * 1000:.0f} ms per call\n")
+    print(f"{'mode':<10}{'mean':>9}{'p95':>9}{'in tok':>9}{'out tok':>9}")
+    for mode, result in results.items():
+        print(f"{mode:<10}{result['mean']:>8.2f}s{result['p95']:>8.2f}s"
+              f"{result['input_tokens']:>9.0f}{result['output_tokens']:>9.0f}")
+
+    base, fast = results["two-node"], results["fast"]
+    print(f"\nfast mode: {1 - fast['mean'] / base['mean']:.0%} lower latency, "
+          f"{1 - fast['input_tokens'] / base['input_tokens']:.0%} fewer input tokens")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Connection-pool benchmark for the shared model HTTP transport.
+Runs concurrent chat calls through all four agents' models against the local
+mock server, once with keep-alive pooling and once with a connection per
+call, and reports latency and connection reuse.
+
+Usage:
+    python benchmarks/http_pool.py [--calls 200] [--concurrency 16] [--latency 0.05] [--handshake 0.03]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+AGENTS = ["researcher", "editor", "journalist", "fact_checker"]
+
+
+def run(calls: int, concurrency: int, keepalive: bool) -> dict:
+    """Make `calls` requests spread over the agents' models; return timing and reuse stats."""
+    from src.agents.llm import create_llm
+    from src.config import Config
+    from src.providers import reset_providers
+    from src.utils.concurrency import set_provider_limit
+    from src.utils.http import connection_stats, http_stats
+
+    Config.HTTP_MAX_KEEPALIVE_CONNECTIONS = Config.HTTP_MAX_CONNECTIONS if keepalive else 0
+    reset_providers()
+    set_provider_limit("openai", concurrency)
+
+    models = [create_llm(agent) for agent in AGENTS]
+    for model in models:
+        model.invoke("warm-up")  # first call pays one-off client setup
+    connection_stats.reset()
+    latencies = []
+
+    def call(index: int) -> None:
+        start = time.perf_counter()
+        models[index % len(models)].invoke(f"benchmark request {index}")
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(calls)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        **http_stats()
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Mock server did not start on port {port}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared HTTP connection pool.")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock server seconds per response")
+    parser.add_argument("--handshake", type=float, default=0.03,
+                        help="Mock seconds per new connection (TCP + TLS stand-in)")
+    args = parser.parse_args()
+
+    # The mock runs in its own process so it does not compete with the client for the GIL
+    port = _free_port()
+    server = subprocess.Popen([
+        sys.executable, str(ROOT / "benchmarks" / "mock_openai_server.py"), "--port", str(port),
+        "--latency", str(args.latency), "--handshake", str(args.handshake)
+    ], stdout=subprocess.DEVNULL)
+    _wait_for_port(port)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "mock")
+    os.environ.setdefault("TAVILY_API_KEY", "mock")
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    from src.config import Config
+    Config.OPENAI_BASE_URL = os.environ["OPENAI_BASE_URL"]
+    Config.OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
+    Config.TAVILY_API_KEY = os.environ["TAVILY_API_KEY"]
+    Config.LLM_CACHE_ENABLED = False
+    Config.HTTP_SHARED_POOL = True
+    # Both modes together exceed a minute's request budget; with the limiter on,
+    # whichever mode runs second measures limiter waits, not connection setup
+    Config.OPENAI_REQUESTS_PER_MINUTE = 0
+    Config.OPENAI_TOKENS_PER_MINUTE = 0
+
+    print(f"{args.calls} calls, {args.concurrency} concurrent, mock latency {args.latency * 1000:.0f} ms, "
+          f"connection setup {args.handshake * 1000:.0f} ms\n")
+    print(f"{'mode':<14}{'total':>9}{'mean':>10}{'p95':>10}{'conns':>8}{'reused':>9}")
+    for mode, keepalive in (("keep-alive", True), ("per-call", False)):
+        result = run(args.calls, args.concurrency, keepalive)
+        print(f"{mode:<14}{result['elapsed']:>8.2f}s{result['mean_ms']:>8.1f}ms{result['p95_ms']:>8.1f}ms"
+              f"{result['connections_opened']:>8}{result['reuse_rate']:>9.0%}")
+
+    server.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
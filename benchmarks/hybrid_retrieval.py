@@ -0,0 +1,141 @@
+"""
+Hybrid retrieval benchmark: BM25 + dense fusion vs. dense-only search.
+Builds a throwaway vector store of synthetic, entity-heavy news (companies,
+tickers, bill numbers over near-identical boilerplate), then runs one query
+per sampled article through VectorStore.semantic_search and
+VectorStore.hybrid_search and reports recall@k and query latency.
+
+Usage:
+    python benchmarks/hybrid_retrieval.py [--articles 2000] [--queries 200] [--k 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SYLLABLES = ["vel", "tri", "nor", "dax", "qua", "mir", "zen", "lum",
+             "kor", "bex", "sol", "tav", "ril", "gon", "pha", "cys"]
+EVENTS = [
+    "reported quarterly earnings above analyst expectations",
+    "faces a lawsuit over its data practices",
+    "announced a new partnership with a cloud provider",
+    "was cited during the committee vote"
+]
+BOILERPLATE = ("Markets reacted cautiously to the news on Tuesday. Analysts said the move reflects "
+               "broader trends in the technology sector, and investors will watch the next "
+               "earnings call closely. Regulators have not commented.")
+
+
+def make_corpus(count: int, seed: int = 7):
+    """Synthetic articles whose only distinguishing features are named entities."""
+    from src.state import NewsArticle
+
+    # Three distinct syllables give 16 * 15 * 14 unique company names
+    count = min(count, 3360)
+    rng = random.Random(seed)
+    entities, articles = [], []
+    seen = set()
+    while len(entities) < count:
+        company = "".join(rng.sample(SYLLABLES, 3)).capitalize()
+        if company in seen:
+            continue
+        seen.add(company)
+        ticker = company[:2].upper() + "".join(rng.choice("ABCDEFGHJKLMNPQRSTUVWXYZ") for _ in range(2))
+        entities.append((company, ticker, f"H.R. {1000 + len(entities)}"))
+
+    for i, (company, ticker, bill) in enumerate(entities):
+        event = EVENTS[i % len(EVENTS)]
+        articles.append(NewsArticle(
+            title=f"{company} ({ticker}) in the news",
+            url=f"https://wire.example.com/{i}",
+            content=f"{company} ({ticker}) {event}, according to filings tied to {bill}. {BOILERPLATE}",
+            source="wire.example.com"
+        ))
+    return entities, articles
+
+
+def make_queries(entities, count: int, seed: int = 11):
+    """(query, target article index) pairs naming one entity each."""
+    rng = random.Random(seed)
+    queries = []
+    for index in rng.sample(range(len(entities)), min(count, len(entities))):
+        company, ticker, bill = entities[index]
+        queries.append((rng.choice([f"{company} news", f"{ticker} stock", f"{bill} vote"]), index))
+    return queries
+
+
+def run(search, queries, article_ids, k: int) -> dict:
+    """Run every query through `search`; return recall@k and latency."""
+    hits, latencies = 0, []
+    for query, target in queries:
+        start = time.perf_counter()
+        results = search(query, k)
+        latencies.append(time.perf_counter() - start)
+        if article_ids[target] in {result["metadata"].get("article_id") for result in results}:
+            hits += 1
+    latencies.sort()
+    return {
+        "recall": hits / len(queries),
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))]
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark hybrid retrieval against dense-only search.")
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5, help="Passages returned per query")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "mock")
+    os.environ.setdefault("TAVILY_API_KEY", "mock")
+
+    from src.config import Config
+    from src.rag.vector_store import VectorStore, article_id
+
+    entities, articles = make_corpus(args.articles)
+    queries = make_queries(entities, args.queries)
+    article_ids = [article_id(article.url) for article in articles]
+
+    with tempfile.TemporaryDirectory() as directory:
+        Config.CHROMA_PERSIST_DIR = directory
+        Config.EMBEDDING_CACHE_ENABLED = False
+        store = VectorStore()
+
+        start = time.perf_counter()
+        store.add_articles(articles, "markets")
+        ingest_seconds = time.perf_counter() - start
+        # Re-index from scratch to isolate what the lexical side adds to ingestion
+        start = time.perf_counter()
+        store.bm25.rebuild(store.collection)
+        lexical_seconds = time.perf_counter() - start
+
+        store.semantic_search("warm-up", 1)  # first query loads the embedding model
+        results = {
+            "dense": run(store.semantic_search, queries, article_ids, args.k),
+            "hybrid": run(store.hybrid_search, queries, article_ids, args.k)
+        }
+
+    print(f"\n{args.articles:,} articles, {len(queries)} entity queries, k={args.k}")
+    print(f"ingestion {ingest_seconds:.1f}s, of which BM25 indexing ~{lexical_seconds:.1f}s\n")
+    print(f"{'mode':<8}{'recall@' + str(args.k):>11}{'p50':>10}{'p95':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['recall']:>11.1%}{result['p50'] * 1000:>8.1f}ms{result['p95'] * 1000:>8.1f}ms")
+
+    dense, hybrid = results["dense"], results["hybrid"]
+    print(f"\nhybrid: recall {hybrid['recall'] - dense['recall']:+.1%}, "
+          f"p50 latency {hybrid['p50'] / dense['p50']:.1f}x dense")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
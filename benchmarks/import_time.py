@@ -0,0 +1,93 @@
+"""
+Import-time budget check for The Daily AI.
+Each entry-point module is imported in a fresh interpreter, without API keys,
+and must finish within Config.IMPORT_TIME_BUDGET_MS without building any
+provider (LLM clients, Tavily, ChromaDB, compiled graph). The Streamlit app
+is measured after Streamlit itself is imported: the budget covers our code,
+not the UI framework's own start-up.
+
+Usage:
+    python benchmarks/import_time.py [module ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.config import Config  # noqa: E402
+
+DEFAULT_MODULES = ["src.graph.workflow", "test_workflow", "app"]
+
+# Frameworks imported before the clock starts (Streamlit compiles its emoji
+# table lazily, on the app's first set_page_config)
+PRELOAD = {"app": ["streamlit", "streamlit.emojis"]}
+
+PROBE = """
+import json, time
+{preload}
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+from src.providers import initialized_providers
+print(json.dumps({{"elapsed_ms": elapsed_ms, "initialized": initialized_providers()}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import a module in a clean interpreter and report timing."""
+    env = dict(os.environ)
+    for key in ("OPENAI_API_KEY", "TAVILY_API_KEY"):
+        env.pop(key, None)
+    env["CHROMA_PERSIST_DIR"] = str(ROOT / ".import_probe_chroma")
+
+    preload = "".join(f"import {name}\n" for name in PRELOAD.get(module, []))
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, preload=preload)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report["chroma_dir_created"] = (ROOT / ".import_probe_chroma").exists()
+    return report
+
+
+def main(modules: list[str]) -> int:
+    budget = Config.IMPORT_TIME_BUDGET_MS
+    failures = 0
+
+    print(f"Import-time budget: {budget:.0f} ms\n")
+    for module in modules:
+        report = measure(module)
+        if "error" in report:
+            print(f"❌ {module}: import failed ({report['error']})")
+            failures += 1
+            continue
+
+        problems = []
+        if report["elapsed_ms"] > budget:
+            problems.append("over budget")
+        if report["initialized"]:
+            problems.append(f"eager providers: {', '.join(report['initialized'])}")
+        if report["chroma_dir_created"]:
+            problems.append("created a Chroma directory")
+
+        status = "❌" if problems else "✅"
+        detail = f" ({'; '.join(problems)})" if problems else ""
+        print(f"{status} {module}: {report['elapsed_ms']:.1f} ms{detail}")
+        failures += bool(problems)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or DEFAULT_MODULES))
@@ -0,0 +1,206 @@
+"""
+Local stand-in for the OpenAI chat completions API, for benchmarks.
+Answers /v1/chat/completions (plain, streaming, JSON-schema and tool calls)
+after a fixed latency, with HTTP/1.1 keep-alive, so the whole workflow can
+run offline.
+
+Usage:
+    python benchmarks/mock_openai_server.py --port 8765 --latency 0.2 --handshake 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock python test_workflow.py "AI regulation"
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# One reply that every agent's text parser understands
+REPLY = """Title: Mock Story
+
+Key Facts:
+- The mock server answered this request
+- Responses arrive after a fixed latency
+
+Summary:
+A mock summary of the research.
+
+Angle: What the mock server reveals
+Reasoning: It keeps benchmarks deterministic
+Tone: informative
+Key Points:
+- Latency is fixed
+- No network access is needed
+
+Accurate: true
+Issues Found: none
+Confidence: 0.9
+"""
+
+
+def _tool_arguments(parameters: dict) -> dict:
+    """Fill a tool's JSON schema with placeholder values."""
+    values = {"array": ["mock item"], "number": 0.9, "integer": 1, "boolean": True, "object": {}}
+    return {
+        name: values.get(schema.get("type"), "mock")
+        for name, schema in parameters.get("properties", {}).items()
+    }
+
+
+def _usage(body: dict, message: dict) -> dict:
+    """Approximate token usage (about four characters per token) so benchmarks can compare prompts."""
+    prompt = sum(len(str(m.get("content") or "")) for m in body.get("messages", []))
+    prompt += len(json.dumps(body.get("tools") or body.get("response_format") or ""))
+    completion = len(message.get("content") or json.dumps(message.get("tool_calls", "")))
+    usage = {"prompt_tokens": prompt // 4 + 1, "completion_tokens": completion // 4 + 1}
+    usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+    return usage
+
+
+class MockServer(ThreadingHTTPServer):
+    """Threading HTTP server that records the peak number of requests in flight."""
+    daemon_threads = True
+    # The default backlog of 5 overflows when a benchmark opens dozens of
+    # connections at once, and dropped SYNs are retried only after a second
+    request_queue_size = 128
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._gauge_lock = threading.Lock()
+
+    def track(self, delta: int) -> None:
+        with self._gauge_lock:
+            self.in_flight += delta
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+
+def make_handler(latency: float, handshake: float = 0.0, chunk_delay: float = 0.0, reply: str = REPLY):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body are written separately; without NODELAY keep-alive
+            # responses stall on Nagle + delayed ACK
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Stand-in for the TCP + TLS setup a real provider connection costs
+            time.sleep(handshake)
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self._send_json({"object": "list", "data": [{"id": "mock", "object": "model"}]})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            self.server.track(1)
+            try:
+                self._answer(body)
+            finally:
+                self.server.track(-1)
+
+        def _answer(self, body: dict) -> None:
+            time.sleep(latency)
+
+            message = {"role": "assistant", "content": reply}
+            response_format = body.get("response_format") or {}
+            if response_format.get("type") == "json_schema":
+                schema = response_format["json_schema"].get("schema", {})
+                message = {"role": "assistant", "content": json.dumps(_tool_arguments(schema))}
+            if body.get("tools"):
+                function = body["tools"][0]["function"]
+                message = {"role": "assistant", "content": None, "tool_calls": [{
+                    "id": "call_mock",
+                    "type": "function",
+                    "function": {
+                        "name": function["name"],
+                        "arguments": json.dumps(_tool_arguments(function.get("parameters", {})))
+                    }
+                }]}
+
+            if body.get("stream") and not body.get("tools"):
+                self._send_stream(body["model"])
+                return
+
+            self._send_json({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+                "usage": _usage(body, message)
+            })
+
+        def _send_json(self, payload: dict) -> None:
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_stream(self, model: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            def send(data: str) -> None:
+                event = f"data: {data}\n\n".encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+
+            for line in reply.splitlines(keepends=True):
+                time.sleep(chunk_delay)
+                send(json.dumps({
+                    "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model, "choices": [{"index": 0, "delta": {"content": line}, "finish_reason": None}]
+                }))
+            send(json.dumps({
+                "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+            }))
+            send("[DONE]")
+            self.wfile.write(b"0\r\n\r\n")
+
+    return MockHandler
+
+
+def start_server(port: int = 0, latency: float = 0.0, handshake: float = 0.0,
+                 chunk_delay: float = 0.0, reply: str = REPLY) -> MockServer:
+    """
+    Start the mock server in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        latency: Seconds to wait before answering each request
+        handshake: Extra seconds charged once per new connection
+        chunk_delay: Seconds between streamed lines
+        reply: Text of every answer
+
+    Returns:
+        The running server; its base URL is http://127.0.0.1:{server.server_port}/v1
+    """
+    server = MockServer(("127.0.0.1", port), make_handler(latency, handshake, chunk_delay, reply))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock OpenAI chat completions server.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per response")
+    parser.add_argument("--handshake", type=float, default=0.0, help="Seconds per new connection")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Seconds between streamed lines")
+    args = parser.parse_args()
+
+    server = MockServer(("127.0.0.1", args.port), make_handler(args.latency, args.handshake, args.chunk_delay))
+    print(f"Mock OpenAI server on http://127.0.0.1:{args.port}/v1 (latency {args.latency}s)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
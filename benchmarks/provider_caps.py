@@ -0,0 +1,110 @@
+"""
+Provider concurrency-cap check for streaming fact-checks.
+Streams an article from the local mock server while its paragraphs are
+fact-checked on more workers than the OpenAI cap allows, through both the
+sync and the async journalist path, and fails if the server ever sees more
+requests in flight than Config.OPENAI_MAX_CONCURRENCY.
+
+Usage:
+    python benchmarks/provider_caps.py [--cap 3] [--paragraphs 12] [--workers 8] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PARAGRAPH = ("Paragraph {n} of the mock article reports that the mock company shipped release {n} "
+             "on schedule, according to the research gathered for this story.")
+
+
+def make_state():
+    """A state ready for the journalist: research results and an editorial angle."""
+    from src.state import EditorialAngle, NewsArticle, NewsState, ResearchResults
+
+    article = NewsArticle(title="Mock release", url="https://news.example.com/mock",
+                          content=PARAGRAPH.format(n=1), source="news.example.com")
+    return NewsState(
+        topic="Mock releases",
+        format_type="blog",
+        research_results=ResearchResults(topic="Mock releases", articles=[article],
+                                         key_facts=["The mock company shipped on schedule"],
+                                         summary="A mock summary."),
+        editorial_angle=EditorialAngle(angle="Shipping on time", reasoning="Deterministic",
+                                       target_tone="informative", key_points=["On schedule"])
+    )
+
+
+def run(server, label: str, write) -> dict:
+    """Run one write-and-check pass; return the server's peak in-flight requests."""
+    server.peak_in_flight = 0
+    start = time.perf_counter()
+    state = write(make_state())
+    return {
+        "mode": label,
+        "checks": len(state.paragraph_fact_checks),
+        "peak": server.peak_in_flight,
+        "elapsed": time.perf_counter() - start
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that paragraph fact-checks respect the OpenAI cap.")
+    parser.add_argument("--cap", type=int, default=3, help="OPENAI_MAX_CONCURRENCY for the run")
+    parser.add_argument("--paragraphs", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=8, help="PARAGRAPH_CHECK_WORKERS for the run")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock server seconds per response")
+    args = parser.parse_args()
+
+    from benchmarks.mock_openai_server import REPLY, start_server
+
+    article = "\n\n".join(PARAGRAPH.format(n=n) for n in range(1, args.paragraphs + 1))
+    # One line per paragraph, arriving faster than checks finish, so they pile up on the open stream
+    server = start_server(latency=args.latency, chunk_delay=args.latency / 10,
+                          reply=f"Title: Mock Story\n\n{article}\n\n{REPLY}")
+
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "mock")
+    os.environ.setdefault("TAVILY_API_KEY", "mock")
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    from src.config import Config
+    from src.graph.workflow import _awrite_with_paragraph_checks, _write_with_paragraph_checks
+    from src.utils.concurrency import set_provider_limit
+
+    Config.OPENAI_BASE_URL = os.environ["OPENAI_BASE_URL"]
+    Config.OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
+    Config.TAVILY_API_KEY = os.environ["TAVILY_API_KEY"]
+    Config.LLM_CACHE_ENABLED = False
+    Config.PARAGRAPH_CHECK_WORKERS = args.workers
+    Config.OPENAI_MAX_CONCURRENCY = args.cap
+    set_provider_limit("openai", args.cap)
+
+    try:
+        results = [
+            run(server, "sync", _write_with_paragraph_checks),
+            run(server, "async", lambda state: asyncio.run(_awrite_with_paragraph_checks(state)))
+        ]
+    finally:
+        server.shutdown()
+
+    print(f"\nOpenAI cap {args.cap}, {args.workers} check workers, {args.paragraphs} paragraphs\n")
+    print(f"{'mode':<7}{'checks':>8}{'peak':>6}{'time':>8}")
+    for result in results:
+        print(f"{result['mode']:<7}{result['checks']:>8}{result['peak']:>6}{result['elapsed']:>7.2f}s")
+
+    over = [result["mode"] for result in results if result["peak"] > args.cap]
+    if over:
+        print(f"\n❌ {', '.join(over)}: more than {args.cap} OpenAI requests in flight")
+        return 1
+    print(f"\n✅ Never more than {args.cap} OpenAI requests in flight")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Batch "daily edition" runner for The Daily AI.
+Runs a file of topic/format pairs through the workflow with bounded
+concurrency and writes each story to a JSONL file as soon as it finishes.
+
+Input file formats:
+    JSONL:  {"topic": "SpaceX Starship", "format_type": "vintage"}
+    Text:   SpaceX Starship | vintage      (format defaults to blog)
+
+Usage:
+    python daily_edition.py topics.txt --output edition.jsonl --workers 4
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from src.agents.routing import model_tier_stats
+from src.config import Config
+
+FORMATS = ("blog", "vintage", "professional", "social_thread")
+
+
+def load_topics(path: str) -> List[Tuple[str, str]]:
+    """
+    Read topic/format pairs from a JSONL or pipe-separated text file.
+
+    Returns:
+        List of (topic, format_type) tuples
+    """
+    stories = []
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if line.startswith("{"):
+                entry = json.loads(line)
+                topic = entry.get("topic", "").strip()
+                format_type = entry.get("format_type") or entry.get("format") or "blog"
+            else:
+                topic, _, format_type = line.partition("|")
+                topic = topic.strip()
+                format_type = format_type.strip() or "blog"
+
+            if not topic:
+                raise ValueError(f"{path}:{line_number}: missing topic")
+            if format_type not in FORMATS:
+                raise ValueError(f"{path}:{line_number}: unknown format '{format_type}'")
+            stories.append((topic, format_type))
+
+    return stories
+
+
+def configure_worker(openai_limit: Optional[int], tavily_limit: Optional[int]) -> None:
+    """Apply per-provider concurrency caps in the current process."""
+    from src.utils.concurrency import set_provider_limit
+
+    set_provider_limit("openai", openai_limit)
+    set_provider_limit("tavily", tavily_limit)
+
+
+def run_story(topic: str, format_type: str) -> dict:
+    """
+    Run one story through the workflow.
+
+    Returns:
+        JSON-serializable record with the story, fact-check summary and latency
+    """
+    from src.graph.workflow import news_workflow
+    from src.state import NewsState
+
+    start = time.perf_counter()
+    record = {"topic": topic, "format_type": format_type}
+
+    try:
+        output = news_workflow.get().invoke(NewsState(topic=topic, format_type=format_type))
+        final_state = NewsState(**output) if isinstance(output, dict) else output
+
+        if final_state.generated_content:
+            content = final_state.generated_content
+            record.update({
+                "status": "ok",
+                "title": content.title,
+                "content": content.content,
+                "word_count": content.word_count,
+                "sources": content.sources_used,
+                "fact_check_confidence": (
+                    final_state.fact_check.confidence_score if final_state.fact_check else None
+                ),
+                "iterations": final_state.iteration_count,
+                "limiter_wait_seconds": final_state.limiter_wait_seconds
+            })
+        else:
+            record.update({"status": "error", "error": final_state.error_message or "No content generated"})
+
+    except Exception as e:
+        record.update({"status": "error", "error": str(e)})
+
+    record["latency_seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_edition(stories: List[Tuple[str, str]], output_path: str, workers: int,
+                executor: str, openai_limit: Optional[int], tavily_limit: Optional[int]) -> dict:
+    """
+    Run every story with bounded concurrency, writing results incrementally.
+
+    With a process pool each worker process gets an equal share of the
+    provider caps, so the totals still hold across processes.
+
+    Returns:
+        Summary with counts, throughput and latency percentiles
+    """
+    if executor == "process":
+        share = lambda limit: max(1, limit // workers) if limit else None
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=configure_worker,
+            initargs=(share(openai_limit), share(tavily_limit))
+        )
+    else:
+        configure_worker(openai_limit, tavily_limit)
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    latencies = []
+    succeeded = 0
+    start = time.perf_counter()
+
+    with pool, open(output_path, "w", encoding="utf-8") as output:
+        futures = {pool.submit(run_story, topic, format_type): (topic, format_type)
+                   for topic, format_type in stories}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            topic, format_type = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:
+                record = {"topic": topic, "format_type": format_type, "status": "error", "error": str(e)}
+
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+            if record.get("status") == "ok":
+                succeeded += 1
+            if "latency_seconds" in record:
+                latencies.append(record["latency_seconds"])
+
+            icon = "✅" if record.get("status") == "ok" else "❌"
+            print(f"{icon} [{done}/{len(stories)}] {format_type}: {topic} "
+                  f"({record.get('latency_seconds', 0):.1f}s)")
+
+    elapsed = time.perf_counter() - start
+    return {
+        "stories": len(stories),
+        "succeeded": succeeded,
+        "failed": len(stories) - succeeded,
+        "elapsed_seconds": elapsed,
+        "stories_per_minute": len(stories) / elapsed * 60 if elapsed else 0.0,
+        "p50_latency_seconds": percentile(latencies, 50),
+        "p95_latency_seconds": percentile(latencies, 95),
+        # Process workers meter their own calls, so tiers are only known in thread mode
+        "model_tiers": model_tier_stats() if executor == "thread" else {}
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the morning edition in batch.")
+    parser.add_argument("input", help="JSONL or text file of topic/format pairs")
+    parser.add_argument("--output", default="daily_edition.jsonl", help="JSONL file for results")
+    parser.add_argument("--workers", type=int, default=4, help="Stories processed at once")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--max-openai", type=int, default=Config.OPENAI_MAX_CONCURRENCY,
+                        help="Concurrent OpenAI calls (0 = uncapped)")
+    parser.add_argument("--max-tavily", type=int, default=Config.TAVILY_MAX_CONCURRENCY,
+                        help="Concurrent Tavily calls (0 = uncapped)")
+    args = parser.parse_args(argv)
+
+    stories = load_topics(args.input)
+    if not stories:
+        print("❌ No topics found")
+        return 1
+
+    print("=" * 80)
+    print("THE DAILY AI - MORNING EDITION")
+    print("=" * 80)
+    print(f"\n{len(stories)} stories, {args.workers} {args.executor} workers, "
+          f"caps: openai={args.max_openai or '∞'} tavily={args.max_tavily or '∞'}\n")
+
+    summary = run_edition(stories, args.output, args.workers, args.executor,
+                          args.max_openai, args.max_tavily)
+
+    print("\n" + "=" * 80)
+    print(f"Stories: {summary['succeeded']}/{summary['stories']} succeeded")
+    print(f"Throughput: {summary['stories_per_minute']:.1f} stories/min "
+          f"({summary['elapsed_seconds']:.1f}s total)")
+    print(f"Latency per story: p50 {summary['p50_latency_seconds']:.1f}s, "
+          f"p95 {summary['p95_latency_seconds']:.1f}s")
+    for tier, stats in summary["model_tiers"].items():
+        print(f"Tier {tier} ({', '.join(stats['models'])}): {stats['calls']} calls, "
+              f"{stats['mean_latency_seconds']:.2f}s mean latency, ${stats['cost_usd']:.4f}")
+    print(f"Results written to {args.output}")
+    print("=" * 80)
+
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
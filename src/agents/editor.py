@@ -3,9 +3,10 @@ Editor agent - selects editorial angle and tone for the story.
 This demonstrates PROMPTING and STRUCTURED OUTPUT.
 """
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from src.agents.llm import create_llm
+from src.agents.structured import StructuredCaller
 from src.config import Config
+from src.providers import LazyProvider
 from src.state import NewsState, EditorialAngle
 from src.utils.prompts import EDITOR_SYSTEM_PROMPT, EDITOR_USER_PROMPT
 
@@ -18,16 +19,18 @@ class EditorAgent:
     
     def __init__(self):
         """Initialize the editor agent."""
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=Config.TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
+        from langchain_core.prompts import ChatPromptTemplate
+
+        self.llm = create_llm("editor")
         
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", EDITOR_SYSTEM_PROMPT),
             ("user", EDITOR_USER_PROMPT)
         ])
+        
+        self.structured = None
+        if Config.STRUCTURED_OUTPUT:
+            self.structured = StructuredCaller("editor", self.prompt, self.llm, EditorialAngle)
     
     def select_angle(self, state: NewsState) -> NewsState:
         """
@@ -43,37 +46,79 @@ class EditorAgent:
             state.error_message = "No research results available"
             return state
         
+        if state.editorial_angle is not None:
+            print("⏭️  Editorial angle already selected with the research (fast mode)")
+            return state
+        
+        print(f"📝 Selecting editorial angle for: {state.topic}")
+        
+        # Invoke the LLM to select an angle
+        inputs = self._build_inputs(state)
+        if self.structured:
+            angle, raw = self.structured.invoke(inputs)
+        else:
+            angle, raw = None, (self.prompt | self.llm).invoke(inputs).content
+        
+        return self._apply_angle(state, angle or self._parse_angle(raw))
+    
+    async def aselect_angle(self, state: NewsState) -> NewsState:
+        """
+        Async version of select_angle() using ainvoke.
+        
+        Args:
+            state: Current NewsState with research results
+            
+        Returns:
+            Updated NewsState with editorial angle
+        """
+        if not state.research_results:
+            state.error_message = "No research results available"
+            return state
+        
+        if state.editorial_angle is not None:
+            print("⏭️  Editorial angle already selected with the research (fast mode)")
+            return state
+        
         print(f"📝 Selecting editorial angle for: {state.topic}")
         
-        # Prepare input for the editor
+        inputs = self._build_inputs(state)
+        if self.structured:
+            angle, raw = await self.structured.ainvoke(inputs)
+        else:
+            angle, raw = None, (await (self.prompt | self.llm).ainvoke(inputs)).content
+        
+        return self._apply_angle(state, angle or self._parse_angle(raw))
+    
+    def _build_inputs(self, state: NewsState) -> dict:
+        """Prepare input for the editor."""
         research = state.research_results
         key_facts_text = "\n".join(f"- {fact}" for fact in research.key_facts)
         
-        # Invoke the LLM to select an angle
-        chain = self.prompt | self.llm
-        
-        response = chain.invoke({
+        return {
             "topic": state.topic,
             "key_facts": key_facts_text,
             "summary": research.summary,
             "format_type": state.format_type
-        })
+        }
+    
+    def _apply_angle(self, state: NewsState, editorial_angle: EditorialAngle) -> NewsState:
+        """Store the editorial angle on the state."""
+        state.editorial_angle = editorial_angle
+        print(f"✅ Editorial angle selected: {editorial_angle.angle[:60]}...")
         
-        # Parse the response to extract editorial angle
-        angle, reasoning, tone, key_points = self._parse_response(response.content)
+        return state
+    
+    def _parse_angle(self, response: str) -> EditorialAngle:
+        """Text-parsing fallback when structured output is off or failed."""
+        angle, reasoning, tone, key_points = self._parse_response(response)
         
         # Create structured editorial angle (STRUCTURED OUTPUT)
-        editorial_angle = EditorialAngle(
+        return EditorialAngle(
             angle=angle,
             reasoning=reasoning,
             target_tone=tone,
             key_points=key_points
         )
-        
-        state.editorial_angle = editorial_angle
-        print(f"✅ Editorial angle selected: {angle[:60]}...")
-        
-        return state
     
     def _parse_response(self, response: str) -> tuple[str, str, str, list[str]]:
         """
@@ -147,5 +192,5 @@ class EditorAgent:
         return angle.strip(), reasoning.strip(), tone.strip(), key_points[:5]
 
 
-# Create singleton instance
-editor_agent = EditorAgent()
+# Shared instance, built on first use
+editor_agent = LazyProvider("editor_agent", EditorAgent)
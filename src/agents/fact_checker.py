@@ -3,11 +3,21 @@ Fact checker agent - verifies accuracy and suggests improvements.
 This demonstrates RAG (using stored context for verification).
 """
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from typing import Optional
+from src.agents.llm import create_llm
+from src.agents.structured import StructuredCaller
 from src.config import Config
-from src.state import NewsState, FactCheckResult
-from src.utils.prompts import FACT_CHECKER_SYSTEM_PROMPT, FACT_CHECKER_USER_PROMPT
+from src.providers import LazyProvider
+from src.state import NewsState, FactCheckResult, ParagraphCheck
+from src.utils.context_packer import pack_for_agent
+from src.utils.prompts import (
+    FACT_CHECKER_SYSTEM_PROMPT,
+    FACT_CHECKER_USER_PROMPT,
+    FACT_CHECKER_PARAGRAPH_PROMPT
+)
+
+# Paragraphs shorter than this (titles, headings, sign-offs) are not checked
+MIN_PARAGRAPH_WORDS = 8
 
 
 class FactCheckerAgent:
@@ -18,16 +28,28 @@ class FactCheckerAgent:
     
     def __init__(self):
         """Initialize the fact checker agent."""
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=0.3,  # Lower temperature for more consistent fact-checking
-            api_key=Config.OPENAI_API_KEY
-        )
+        from langchain_core.prompts import ChatPromptTemplate
+
+        # Lower temperature (Config.FACT_CHECKER_TEMPERATURE) for more consistent fact-checking
+        self.llm = create_llm("fact_checker")
         
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", FACT_CHECKER_SYSTEM_PROMPT),
             ("user", FACT_CHECKER_USER_PROMPT)
         ])
+        
+        self.paragraph_prompt = ChatPromptTemplate.from_messages([
+            ("system", FACT_CHECKER_SYSTEM_PROMPT),
+            ("user", FACT_CHECKER_PARAGRAPH_PROMPT)
+        ])
+        
+        # Provider-side FactCheckResult schema (falls back to text parsing)
+        self.structured = self.paragraph_structured = None
+        if Config.STRUCTURED_OUTPUT:
+            self.structured = StructuredCaller("fact_checker", self.prompt, self.llm, FactCheckResult)
+            self.paragraph_structured = StructuredCaller(
+                "fact_checker", self.paragraph_prompt, self.llm, FactCheckResult
+            )
     
     def check_facts(self, state: NewsState) -> NewsState:
         """
@@ -43,12 +65,123 @@ class FactCheckerAgent:
             state.error_message = "Missing generated content or research results"
             return state
         
+        # Paragraphs were already checked while the article streamed
+        if state.paragraph_fact_checks:
+            return self.apply_paragraph_checks(state)
+        
         print(f"🔍 Fact-checking content...")
         
-        # Prepare source material for comparison
-        source_material = self._prepare_source_material(state)
+        # Invoke fact-checker
+        result = self._verify(self.prompt, self.structured, self._build_inputs(state))
+        
+        return self._apply_result(state, result)
+    
+    async def acheck_facts(self, state: NewsState) -> NewsState:
+        """
+        Async version of check_facts() using ainvoke.
+        
+        Args:
+            state: Current NewsState with generated content
+            
+        Returns:
+            Updated NewsState with fact-check results
+        """
+        if not state.generated_content or not state.research_results:
+            state.error_message = "Missing generated content or research results"
+            return state
+        
+        if state.paragraph_fact_checks:
+            return self.apply_paragraph_checks(state)
+        
+        print(f"🔍 Fact-checking content...")
+        
+        result = await self._averify(self.prompt, self.structured, self._build_inputs(state))
+        
+        return self._apply_result(state, result)
+    
+    def check_paragraph(self, state: NewsState, index: int, paragraph: str) -> Optional[ParagraphCheck]:
+        """
+        Fact-check a single paragraph against the research.
+        
+        Args:
+            state: NewsState with research results
+            index: Position of the paragraph in the article
+            paragraph: Paragraph text
+            
+        Returns:
+            ParagraphCheck, or None for paragraphs too short to be worth checking
+        """
+        if len(paragraph.split()) < MIN_PARAGRAPH_WORDS:
+            return None
+        
+        result = self._verify(self.paragraph_prompt, self.paragraph_structured,
+                              self._build_paragraph_inputs(state, paragraph))
+        return ParagraphCheck(index=index, text=paragraph, result=result)
+    
+    async def acheck_paragraph(self, state: NewsState, index: int, paragraph: str) -> Optional[ParagraphCheck]:
+        """Async version of check_paragraph() using ainvoke."""
+        if len(paragraph.split()) < MIN_PARAGRAPH_WORDS:
+            return None
+        
+        result = await self._averify(self.paragraph_prompt, self.paragraph_structured,
+                                     self._build_paragraph_inputs(state, paragraph))
+        return ParagraphCheck(index=index, text=paragraph, result=result)
+    
+    def apply_paragraph_checks(self, state: NewsState) -> NewsState:
+        """
+        Aggregate per-paragraph checks into the article's FactCheckResult.
+        
+        The article is accurate only if every paragraph is; confidence is the
+        length-weighted mean of the paragraph confidences.
+        """
+        checks = state.paragraph_fact_checks
+        print(f"🔍 Aggregating fact-checks from {len(checks)} paragraphs...")
+        
+        issues = []
+        suggestions = []
+        for check in checks:
+            issues.extend(f"Paragraph {check.index + 1}: {issue}" for issue in check.result.issues_found)
+            suggestions.extend(check.result.suggestions)
+        
+        weights = [len(check.text.split()) for check in checks]
+        confidence = sum(
+            weight * check.result.confidence_score for weight, check in zip(weights, checks)
+        ) / sum(weights)
+        
+        return self._apply_result(state, FactCheckResult(
+            is_accurate=all(check.result.is_accurate for check in checks),
+            issues_found=issues[:5],
+            suggestions=suggestions[:5],
+            confidence_score=round(confidence, 3)
+        ))
+    
+    def _build_paragraph_inputs(self, state: NewsState, paragraph: str) -> dict:
+        return {
+            "topic": state.topic,
+            "paragraph": paragraph,
+            "source_material": self._prepare_source_material(state, paragraph)
+        }
+    
+    def _verify(self, prompt, structured: Optional[StructuredCaller], inputs: dict) -> FactCheckResult:
+        """Run one check, preferring structured output over text parsing."""
+        if structured:
+            result, raw = structured.invoke(inputs)
+        else:
+            result, raw = None, (prompt | self.llm).invoke(inputs).content
+        return result or self._parse_result(raw)
+    
+    async def _averify(self, prompt, structured: Optional[StructuredCaller], inputs: dict) -> FactCheckResult:
+        """Async version of _verify()."""
+        if structured:
+            result, raw = await structured.ainvoke(inputs)
+        else:
+            result, raw = None, (await (prompt | self.llm).ainvoke(inputs)).content
+        return result or self._parse_result(raw)
+    
+    def _build_inputs(self, state: NewsState) -> dict:
+        """Prepare the generated content and source material for comparison."""
+        source_material = self._prepare_source_material(state, state.generated_content.content)
         
-        # Prepare generated content
         generated_text = f"""
 Title: {state.generated_content.title}
 
@@ -56,29 +189,31 @@ Content:
 {state.generated_content.content}
 """
         
-        # Invoke fact-checker
-        chain = self.prompt | self.llm
-        
-        response = chain.invoke({
+        return {
             "generated_content": generated_text,
             "source_material": source_material
-        })
-        
+        }
+    
+    def _parse_result(self, response: str) -> FactCheckResult:
+        """Text-parsing fallback when structured output is off or failed."""
         # Parse fact-check results
-        is_accurate, issues, suggestions, confidence = self._parse_response(response.content)
+        is_accurate, issues, suggestions, confidence = self._parse_response(response)
         
         # Create structured fact-check result
-        fact_check = FactCheckResult(
+        return FactCheckResult(
             is_accurate=is_accurate,
             issues_found=issues,
             suggestions=suggestions,
             confidence_score=confidence
         )
-        
+    
+    def _apply_result(self, state: NewsState, fact_check: FactCheckResult) -> NewsState:
+        """Store the fact-check result and decide whether refinement is needed."""
         state.fact_check = fact_check
+        confidence = fact_check.confidence_score
         
         # Determine if refinement is needed
-        if not is_accurate or confidence < 0.7:
+        if not fact_check.is_accurate or confidence < Config.MIN_FACT_CHECK_CONFIDENCE:
             state.needs_refinement = True
             print(f"⚠️  Issues found. Refinement needed. Confidence: {confidence:.2f}")
         else:
@@ -88,32 +223,26 @@ Content:
         
         return state
     
-    def _prepare_source_material(self, state: NewsState) -> str:
-        """Prepare source material for fact-checking."""
-        research = state.research_results
-        
-        # Format key facts
-        facts_text = "\n".join(f"- {fact}" for fact in research.key_facts)
-        
-        # Format articles (abbreviated)
-        articles_text = []
-        for idx, article in enumerate(research.articles[:3], 1):  # Limit to top 3
-            articles_text.append(f"""
-Source {idx}: {article.title}
-{article.content[:500]}...
-""")
+    def _prepare_source_material(self, state: NewsState, claims: str) -> str:
+        """
+        Prepare source material for fact-checking, within the fact checker's token budget.
         
-        source_material = f"""
-KEY FACTS FROM RESEARCH:
-{facts_text}
-
-SUMMARY:
-{research.summary}
-
-SOURCE ARTICLES (abbreviated):
-{''.join(articles_text)}
-"""
-        return source_material
+        Args:
+            state: NewsState with research results
+            claims: Text being checked; passages that best support it are kept
+        """
+        research = state.research_results
+        packed = pack_for_agent(
+            "fact_checker",
+            research.articles,
+            query=claims,
+            sections=[
+                ("KEY FACTS FROM RESEARCH", [f"- {fact}" for fact in research.key_facts]),
+                ("SUMMARY", [research.summary])
+            ],
+            articles_heading="SOURCE ARTICLES"
+        )
+        return f"\n{packed.text}\n"
     
     def _parse_response(self, response: str) -> tuple[bool, list[str], list[str], float]:
         """
@@ -190,5 +319,5 @@ SOURCE ARTICLES (abbreviated):
         return is_accurate, issues[:5], suggestions[:5], confidence
 
 
-# Create singleton instance
-fact_checker_agent = FactCheckerAgent()
+# Shared instance, built on first use
+fact_checker_agent = LazyProvider("fact_checker_agent", FactCheckerAgent)
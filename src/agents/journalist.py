@@ -3,11 +3,20 @@ Journalist agent - writes content in various formats.
 This demonstrates advanced PROMPTING and STRUCTURED OUTPUT.
 """
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from src.config import Config
+import re
+from typing import AsyncIterator, Iterator, List, Tuple
+from src.agents.llm import create_llm
+from src.agents.routing import should_escalate
+from src.providers import LazyProvider
 from src.state import NewsState, GeneratedContent
-from src.utils.prompts import get_journalist_prompt
+from src.config import Config
+from src.utils.context_packer import content_terms, count_tokens, pack_for_agent
+from src.utils.prompts import (
+    JOURNALIST_REVISION_PROMPT,
+    JOURNALIST_SYSTEM_PROMPTS,
+    get_journalist_prompt
+)
+from src.utils.streaming import ParagraphSplitter
 
 
 class JournalistAgent:
@@ -18,11 +27,13 @@ class JournalistAgent:
     
     def __init__(self):
         """Initialize the journalist agent."""
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=Config.TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
+        self.llm = create_llm("journalist")
+        
+        # Rewrites after a failed fact-check must produce a new draft,
+        # so they bypass the response cache
+        self.rewrite_llm = self.llm.model_copy(update={"cache": False})
+        # Rewrites after a low-confidence fact-check move to a stronger model
+        self.escalated_llm = create_llm("journalist", escalated=True).model_copy(update={"cache": False})
     
     def write_content(self, state: NewsState) -> NewsState:
         """
@@ -40,6 +51,211 @@ class JournalistAgent:
         
         print(f"✍️  Writing {state.format_type} content...")
         
+        # Generate content
+        chain = self._build_chain(state)
+        response = chain.invoke({})
+        
+        return self._apply_response(state, response.content)
+    
+    async def awrite_content(self, state: NewsState) -> NewsState:
+        """
+        Async version of write_content() using ainvoke.
+        
+        Args:
+            state: Current NewsState with research and editorial angle
+            
+        Returns:
+            Updated NewsState with generated content
+        """
+        if not state.research_results or not state.editorial_angle:
+            state.error_message = "Missing research results or editorial angle"
+            return state
+        
+        print(f"✍️  Writing {state.format_type} content...")
+        
+        chain = self._build_chain(state)
+        response = await chain.ainvoke({})
+        
+        return self._apply_response(state, response.content)
+    
+    def stream_paragraphs(self, state: NewsState) -> Iterator[str]:
+        """
+        Write content token by token, yielding each paragraph once it is complete.
+        
+        When the stream is exhausted the full text is parsed and stored on
+        state.generated_content, exactly as write_content() would.
+        
+        Args:
+            state: Current NewsState with research and editorial angle
+            
+        Yields:
+            Completed paragraphs, in order
+        """
+        if not state.research_results or not state.editorial_angle:
+            state.error_message = "Missing research results or editorial angle"
+            return
+        
+        print(f"✍️  Writing {state.format_type} content (streaming)...")
+        
+        splitter = ParagraphSplitter()
+        parts = []
+        for chunk in self._build_chain(state).stream({}):
+            parts.append(chunk.content)
+            yield from splitter.feed(chunk.content)
+        yield from splitter.flush()
+        
+        self._apply_response(state, "".join(parts))
+    
+    async def astream_paragraphs(self, state: NewsState) -> AsyncIterator[str]:
+        """
+        Async version of stream_paragraphs() using astream.
+        
+        Args:
+            state: Current NewsState with research and editorial angle
+            
+        Yields:
+            Completed paragraphs, in order
+        """
+        if not state.research_results or not state.editorial_angle:
+            state.error_message = "Missing research results or editorial angle"
+            return
+        
+        print(f"✍️  Writing {state.format_type} content (streaming)...")
+        
+        splitter = ParagraphSplitter()
+        parts = []
+        async for chunk in self._build_chain(state).astream({}):
+            parts.append(chunk.content)
+            for paragraph in splitter.feed(chunk.content):
+                yield paragraph
+        for paragraph in splitter.flush():
+            yield paragraph
+        
+        self._apply_response(state, "".join(parts))
+    
+    def revise_content(self, state: NewsState) -> NewsState:
+        """
+        Patch only the draft sections the fact-checker flagged.
+        
+        The flagged sections, the issues and the context retrieved during
+        refinement are sent to the model, and the revised sections are spliced
+        back into the draft. When no section can be tied to the issues, the
+        whole draft is revised as one section, still with that context.
+        
+        Args:
+            state: NewsState with a draft, fact-check result and refinement context
+            
+        Returns:
+            Updated NewsState with the patched content
+        """
+        sections, flagged = self._revision_targets(state)
+        chain, inputs = self._build_revision(state, sections, flagged)
+        response = chain.invoke(inputs)
+        
+        return self._apply_revision(state, sections, flagged, response.content)
+    
+    async def arevise_content(self, state: NewsState) -> NewsState:
+        """Async version of revise_content() using ainvoke."""
+        sections, flagged = self._revision_targets(state)
+        chain, inputs = self._build_revision(state, sections, flagged)
+        response = await chain.ainvoke(inputs)
+        
+        return self._apply_revision(state, sections, flagged, response.content)
+    
+    def _revision_targets(self, state: NewsState) -> Tuple[List[str], List[int]]:
+        """The draft's sections and the indexes of those to revise."""
+        sections = self._split_sections(state.generated_content.content)
+        flagged = self._flagged_sections(state, sections)
+        if flagged:
+            print(f"🩹 Revising {len(flagged)}/{len(sections)} flagged sections...")
+            return sections, flagged
+        
+        # No section shares words with the issues: revise the whole draft as one
+        # section, so the refinement context is still used
+        print("🩹 No section matches the issues; revising the whole draft...")
+        return ["\n\n".join(sections)], [0]
+    
+    def _split_sections(self, content: str) -> List[str]:
+        """Split a draft into its blank-line separated sections."""
+        return [section.strip() for section in re.split(r"\n\s*\n", content) if section.strip()]
+    
+    def _flagged_sections(self, state: NewsState, sections: List[str]) -> List[int]:
+        """
+        Indexes of the sections the fact-check issues point at.
+        
+        Paragraph-level checks identify their paragraph directly; otherwise
+        each issue is matched to the section sharing the most content words.
+        """
+        flagged = set()
+        
+        for check in state.paragraph_fact_checks:
+            if check.result.is_accurate and not check.result.issues_found:
+                continue
+            if check.text.strip() in sections:
+                flagged.add(sections.index(check.text.strip()))
+        
+        if not flagged and state.fact_check:
+            section_terms = [content_terms(section) for section in sections]
+            for issue in state.fact_check.issues_found:
+                issue_terms = content_terms(issue)
+                overlaps = [len(issue_terms & terms) for terms in section_terms]
+                if overlaps and max(overlaps) > 0:
+                    flagged.add(overlaps.index(max(overlaps)))
+        
+        return sorted(flagged)[:Config.PATCH_MAX_SECTIONS]
+    
+    def _build_revision(self, state: NewsState, sections: List[str], flagged: List[int]):
+        """Build the revision chain and inputs for the flagged sections."""
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        fact_check = state.fact_check
+        inputs = {
+            "format_type": state.format_type,
+            "topic": state.topic,
+            "sections": "\n\n".join(f"[S{index + 1}]\n{sections[index]}" for index in flagged),
+            "issues": "\n".join(f"- {issue}" for issue in fact_check.issues_found) or "- (none listed)",
+            "suggestions": "\n".join(f"- {tip}" for tip in fact_check.suggestions) or "- (none listed)",
+            "context": state.refinement_context or "\n".join(
+                f"- {fact}" for fact in state.research_results.key_facts
+            )
+        }
+        
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", JOURNALIST_SYSTEM_PROMPTS.get(state.format_type, JOURNALIST_SYSTEM_PROMPTS["blog"])),
+            ("user", JOURNALIST_REVISION_PROMPT)
+        ])
+        prompt_tokens = count_tokens(JOURNALIST_REVISION_PROMPT.format(**inputs))
+        print(f"📦 Revision prompt: {prompt_tokens:,} tokens")
+        
+        return prompt | self._rewrite_llm(state), inputs
+    
+    def _apply_revision(self, state: NewsState, sections: List[str], flagged: List[int],
+                        response: str) -> NewsState:
+        """Splice revised sections back into the draft."""
+        revised = {
+            int(number) - 1: text.strip()
+            for number, text in re.findall(r"\[S(\d+)\]\s*\n(.*?)(?=\n\s*\[S\d+\]|\Z)", response, re.S)
+        }
+        patched = [index for index in flagged if revised.get(index)]
+        for index in patched:
+            sections[index] = revised[index]
+        
+        content = "\n\n".join(sections)
+        state.generated_content = state.generated_content.model_copy(update={
+            "content": content,
+            "word_count": len(content.split())
+        })
+        
+        # Earlier paragraph checks no longer describe the draft
+        state.paragraph_fact_checks = []
+        print(f"✅ Patched {len(patched)} sections: {len(content.split())} words")
+        
+        return state
+    
+    def _build_chain(self, state: NewsState):
+        """Build the format-specific prompt | llm chain for this state."""
+        from langchain_core.prompts import ChatPromptTemplate
+        
         # Prepare source material
         source_material = self._prepare_source_material(state)
         
@@ -59,15 +275,29 @@ class JournalistAgent:
             ("user", user_prompt)
         ])
         
-        # Generate content
-        chain = prompt | self.llm
-        response = chain.invoke({})
+        llm = self.llm if state.iteration_count == 0 else self._rewrite_llm(state)
+        return prompt | llm
+    
+    def _rewrite_llm(self, state: NewsState):
+        """Uncached model for a rewrite, escalated when the fact-check was unsure."""
+        if not should_escalate(state):
+            return self.rewrite_llm
         
+        print(f"⬆️  Fact-check confidence {state.fact_check.confidence_score:.2f} is below "
+              f"{Config.MIN_FACT_CHECK_CONFIDENCE:.2f}; rewriting on the "
+              f"{self.escalated_llm.tier} tier ({self.escalated_llm.model_name})")
+        return self.escalated_llm
+    
+    def _apply_response(self, state: NewsState, response: str) -> NewsState:
+        """Parse the generated text and store it on the state."""
         # Parse the generated content
-        title, content = self._parse_content(response.content, state.format_type)
+        title, content = self._parse_content(response, state.format_type)
         
-        # Extract source URLs
-        source_urls = [article.url for article in state.research_results.articles]
+        # Extract source URLs (including syndicated copies collapsed by dedup)
+        source_urls = [
+            url for article in state.research_results.articles
+            for url in [article.url, *article.alternate_urls]
+        ]
         
         # Create structured output
         generated_content = GeneratedContent(
@@ -84,36 +314,22 @@ class JournalistAgent:
         return state
     
     def _prepare_source_material(self, state: NewsState) -> str:
-        """Prepare source material from research results."""
+        """Prepare source material from research results, within the journalist's token budget."""
         research = state.research_results
+        angle = state.editorial_angle
         
-        # Format articles
-        articles_text = []
-        for idx, article in enumerate(research.articles, 1):
-            articles_text.append(f"""
-Article {idx}: {article.title}
-Source: {article.source or 'Unknown'}
-URL: {article.url}
-
-{article.content}
-
----
-""")
-        
-        # Combine everything
-        source_material = f"""
-TOPIC: {research.topic}
-
-KEY FACTS:
-{chr(10).join(f"- {fact}" for fact in research.key_facts)}
-
-SUMMARY:
-{research.summary}
-
-DETAILED ARTICLES:
-{''.join(articles_text)}
-"""
-        return source_material
+        # Key facts and summary first, then the passages closest to the chosen angle
+        packed = pack_for_agent(
+            "journalist",
+            research.articles,
+            query=" ".join([state.topic, angle.angle, *angle.key_points]),
+            sections=[
+                ("KEY FACTS", [f"- {fact}" for fact in research.key_facts]),
+                ("SUMMARY", [research.summary])
+            ],
+            articles_heading="DETAILED ARTICLES"
+        )
+        return f"\nTOPIC: {research.topic}\n\n{packed.text}\n"
     
     def _parse_content(self, response: str, format_type: str) -> tuple[str, str]:
         """
@@ -167,5 +383,5 @@ DETAILED ARTICLES:
         return title, content
 
 
-# Create singleton instance
-journalist_agent = JournalistAgent()
+# Shared instance, built on first use
+journalist_agent = LazyProvider("journalist_agent", JournalistAgent)
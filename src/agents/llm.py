@@ -0,0 +1,49 @@
+"""
+Chat model factory shared by all agents.
+Centralizes how each agent's ChatOpenAI client is configured.
+"""
+
+from typing import Optional
+from src.config import Config
+
+
+def create_llm(agent: str, temperature: Optional[float] = None, escalated: bool = False):
+    """
+    Build the chat model for an agent.
+
+    Args:
+        agent: Agent name (researcher, editor, journalist, fact_checker)
+        temperature: Override for the agent's Config.<AGENT>_TEMPERATURE
+        escalated: Build the agent's escalation model (see src.agents.routing)
+
+    Returns:
+        Configured ChatOpenAI instance on the agent's routed model that
+        respects provider concurrency caps, shares the process-wide HTTP
+        connection pool and is wired to the response cache if the agent
+        has opted in
+    """
+    from src.agents.managed_llm import ManagedChatOpenAI
+    from src.agents.routing import agent_profile
+    from src.utils.llm_cache import get_llm_cache
+
+    Config.validate()
+
+    transport = {}
+    if Config.HTTP_SHARED_POOL:
+        from src.utils.http import http_async_client, http_client
+        transport = {"http_client": http_client.get(), "http_async_client": http_async_client.get()}
+
+    profile = agent_profile(agent, escalated)
+
+    return ManagedChatOpenAI(
+        model=profile.model,
+        tier=profile.tier,
+        temperature=profile.temperature if temperature is None else temperature,
+        max_tokens=profile.max_tokens,
+        api_key=Config.OPENAI_API_KEY,
+        base_url=Config.OPENAI_BASE_URL,
+        cache=get_llm_cache(agent),
+        # Retries are handled by the shared rate limiter with jittered backoff
+        max_retries=0,
+        **transport
+    )
@@ -0,0 +1,107 @@
+"""
+ChatOpenAI subclass that respects process-wide provider controls.
+Imported lazily by create_llm() to keep package import cheap.
+"""
+
+import time
+from langchain_openai import ChatOpenAI
+from src.agents.routing import tier_stats
+from src.utils.concurrency import aprovider_slot, provider_slot
+from src.utils.rate_limiter import acall_with_retry, call_with_retry, estimate_tokens
+
+
+def _attempt_timer(fn):
+    """
+    Wrap a retried call to note when its latest attempt began, so tier latency
+    covers the provider call alone, not limiter waits or retry backoff.
+    """
+    def attempt():
+        attempt.start = time.perf_counter()
+        return fn()
+    return attempt
+
+
+class ManagedChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI whose network calls hold an "openai" concurrency slot, queue on
+    the shared OpenAI rate limiter and retry rate-limit errors with backoff.
+    Cache hits are served before _generate is reached, so they never wait
+    and are not metered; every network call is recorded under its tier.
+    """
+
+    tier: str = "default"
+
+    def _estimate_tokens(self, messages) -> int:
+        """Prompt plus expected completion tokens, for the token budget."""
+        prompt_tokens = sum(estimate_tokens(str(message.content)) for message in messages)
+        return prompt_tokens + (self.max_tokens or 512)
+
+    def _meter(self, start: float, usage) -> None:
+        """Record one call's latency and token usage for the tier report."""
+        usage = usage or {}
+        tier_stats.record(self.tier, self.model_name, time.perf_counter() - start,
+                          usage.get("input_tokens", 0), usage.get("output_tokens", 0))
+
+    @staticmethod
+    def _result_usage(result):
+        message = result.generations[0].message if result.generations else None
+        return getattr(message, "usage_metadata", None)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        parent = super()._generate
+        call = _attempt_timer(lambda: parent(messages, stop=stop, run_manager=run_manager, **kwargs))
+        with provider_slot("openai"):
+            result = call_with_retry("openai", call, tokens=self._estimate_tokens(messages))
+        self._meter(call.start, self._result_usage(result))
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        parent = super()._agenerate
+        call = _attempt_timer(lambda: parent(messages, stop=stop, run_manager=run_manager, **kwargs))
+        async with aprovider_slot("openai"):
+            result = await acall_with_retry("openai", call, tokens=self._estimate_tokens(messages))
+        self._meter(call.start, self._result_usage(result))
+        return result
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        parent = super()._stream
+
+        def start():
+            # Retries are only safe until the first chunk has been produced
+            stream = parent(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return stream, next(stream, None)
+
+        call = _attempt_timer(start)
+        with provider_slot("openai"):
+            stream, first = call_with_retry("openai", call, tokens=self._estimate_tokens(messages))
+            usage = None
+            if first is not None:
+                usage = first.message.usage_metadata
+                yield first
+                for chunk in stream:
+                    # Usage arrives on the last chunk when the provider reports it
+                    usage = chunk.message.usage_metadata or usage
+                    yield chunk
+            self._meter(call.start, usage)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        parent = super()._astream
+
+        async def start():
+            stream = parent(messages, stop=stop, run_manager=run_manager, **kwargs)
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+
+        call = _attempt_timer(start)
+        async with aprovider_slot("openai"):
+            stream, first = await acall_with_retry("openai", call, tokens=self._estimate_tokens(messages))
+            usage = None
+            if first is not None:
+                usage = first.message.usage_metadata
+                yield first
+                async for chunk in stream:
+                    usage = chunk.message.usage_metadata or usage
+                    yield chunk
+            self._meter(call.start, usage)
@@ -3,13 +3,20 @@ Researcher agent - searches for news and extracts key information.
 This demonstrates TOOL CALLING and STRUCTURED OUTPUT.
 """
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+import asyncio
+from src.agents.llm import create_llm
+from src.agents.structured import StructuredCaller
 from src.config import Config
-from src.state import NewsState, ResearchResults, NewsArticle
+from src.providers import LazyProvider
+from src.rag.topic_cache import topic_cache
+from src.state import NewsState, ResearchResults, ResearchFindings, ResearchBrief, NewsArticle
+from src.tools.query_expansion import expand_queries
 from src.tools.tavily_search import tavily_search
-from src.utils.prompts import RESEARCHER_SYSTEM_PROMPT, RESEARCHER_USER_PROMPT
-from typing import List
+from src.utils.dedup import dedup_articles, merge_articles
+from src.utils.context_packer import pack_for_agent
+from src.utils.prompts import (RESEARCHER_SYSTEM_PROMPT, RESEARCHER_USER_PROMPT,
+                               RESEARCHER_FAST_SYSTEM_PROMPT, RESEARCHER_FAST_USER_PROMPT)
+from typing import List, Optional
 
 
 class ResearcherAgent:
@@ -20,16 +27,27 @@ class ResearcherAgent:
     
     def __init__(self):
         """Initialize the researcher agent."""
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=Config.TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
+        from langchain_core.prompts import ChatPromptTemplate
+
+        self.llm = create_llm("researcher")
         
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", RESEARCHER_SYSTEM_PROMPT),
             ("user", RESEARCHER_USER_PROMPT)
         ])
+        
+        # Fast mode: findings and editorial angle from one fused call
+        self.fast_prompt = ChatPromptTemplate.from_messages([
+            ("system", RESEARCHER_FAST_SYSTEM_PROMPT),
+            ("user", RESEARCHER_FAST_USER_PROMPT)
+        ])
+        
+        # Provider-side schema for key facts + summary (falls back to text parsing)
+        self.structured = None
+        self.fast_structured = None
+        if Config.STRUCTURED_OUTPUT:
+            self.structured = StructuredCaller("researcher", self.prompt, self.llm, ResearchFindings)
+            self.fast_structured = StructuredCaller("researcher_fast", self.fast_prompt, self.llm, ResearchBrief)
     
     def research(self, state: NewsState) -> NewsState:
         """
@@ -40,13 +58,21 @@ class ResearcherAgent:
             
         Returns:
             Updated NewsState with research results
+            
+        Raises:
+            SearchError: The search provider failed; "no articles" is reported
+                through state.error_message instead
         """
         topic = state.topic
         
         print(f"🔍 Researching topic: {topic}")
         
+        # Step 0: Reuse fresh research for a near-duplicate topic (SEMANTIC SEARCH)
+        if self._reuse_cached_research(state):
+            return state
+        
         # Step 1: Search for news articles using Tavily (TOOL CALLING)
-        articles = tavily_search.search_news(topic)
+        articles = self._search(topic)
         
         if not articles:
             state.error_message = "No articles found for this topic"
@@ -54,50 +80,205 @@ class ResearcherAgent:
         
         print(f"📰 Found {len(articles)} articles")
         
-        # Step 2: Format search results for LLM analysis
-        search_results_text = self._format_articles(articles)
+        # Steps 2-5: Extract key facts from the articles (STRUCTURED OUTPUT)
+        state = self.analyze(state, articles)
         
-        # Step 3: Use LLM to extract key facts and summarize
-        chain = self.prompt | self.llm
+        if Config.TOPIC_CACHE_ENABLED:
+            self._store_topic_cache(topic, state.research_results)
         
-        response = chain.invoke({
-            "topic": topic,
-            "search_results": search_results_text
-        })
+        return state
+    
+    async def aresearch(self, state: NewsState) -> NewsState:
+        """
+        Async version of research() using async search and ainvoke.
+        Blocking ChromaDB calls run in a worker thread.
+        
+        Args:
+            state: Current NewsState
+            
+        Returns:
+            Updated NewsState with research results
+        """
+        topic = state.topic
+        
+        print(f"🔍 Researching topic: {topic}")
+        
+        if await asyncio.to_thread(self._reuse_cached_research, state):
+            return state
+        
+        articles = await self._asearch(topic)
+        
+        if not articles:
+            state.error_message = "No articles found for this topic"
+            return state
+        
+        print(f"📰 Found {len(articles)} articles")
+        
+        state = await self.aanalyze(state, articles)
+        
+        if Config.TOPIC_CACHE_ENABLED:
+            await asyncio.to_thread(self._store_topic_cache, topic, state.research_results)
+        
+        return state
+    
+    def analyze(self, state: NewsState, articles: List[NewsArticle]) -> NewsState:
+        """
+        Extract key facts and a summary from already-found articles.
+        In fast mode the same call also selects the editorial angle.
+        
+        Args:
+            state: Current NewsState
+            articles: Search results to analyze
+            
+        Returns:
+            Updated NewsState with research results
+        """
+        # Format search results and use LLM to extract key facts (STRUCTURED OUTPUT)
+        inputs = self._build_inputs(state.topic, articles)
+        if state.fast_mode:
+            findings = self._fast_findings(state, inputs)
+        elif self.structured:
+            findings, raw = self.structured.invoke(inputs)
+            findings = findings or self._parse_findings(raw)
+        else:
+            findings = self._parse_findings((self.prompt | self.llm).invoke(inputs).content)
         
-        # Step 4: Parse the response to extract structured information
-        key_facts, summary = self._parse_response(response.content)
+        # Build structured research results
+        state.research_results = self._build_results(state.topic, articles, findings)
+        return state
+    
+    async def aanalyze(self, state: NewsState, articles: List[NewsArticle]) -> NewsState:
+        """Async version of analyze() using ainvoke."""
+        inputs = self._build_inputs(state.topic, articles)
+        if state.fast_mode:
+            findings = await self._afast_findings(state, inputs)
+        elif self.structured:
+            findings, raw = await self.structured.ainvoke(inputs)
+            findings = findings or self._parse_findings(raw)
+        else:
+            findings = self._parse_findings((await (self.prompt | self.llm).ainvoke(inputs)).content)
+        
+        state.research_results = self._build_results(state.topic, articles, findings)
+        return state
+    
+    def _search(self, topic: str) -> List[NewsArticle]:
+        """
+        Search for a topic, expanding it into parallel sub-queries when enabled.
+        Results are merged with duplicate URLs and near-duplicate content removed.
+        """
+        if not Config.SEARCH_EXPANSION_ENABLED:
+            return self._dedup(tavily_search.search_news(topic))
+        
+        queries = expand_queries(topic, Config.SEARCH_EXPANSION_QUERIES)
+        print(f"🔎 Searching {len(queries)} queries in parallel")
+        return self._dedup(merge_articles(tavily_search.search_many(queries), Config.MAX_RESEARCH_ARTICLES))
+    
+    async def _asearch(self, topic: str) -> List[NewsArticle]:
+        """Async version of _search()."""
+        if not Config.SEARCH_EXPANSION_ENABLED:
+            return self._dedup(await tavily_search.asearch_news(topic))
         
-        # Step 5: Create structured research results (STRUCTURED OUTPUT)
+        queries = expand_queries(topic, Config.SEARCH_EXPANSION_QUERIES)
+        print(f"🔎 Searching {len(queries)} queries concurrently")
+        return self._dedup(merge_articles(await tavily_search.asearch_many(queries), Config.MAX_RESEARCH_ARTICLES))
+    
+    def _dedup(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """Collapse syndicated copies and repeated sentences before any LLM sees them."""
+        if not Config.DEDUP_ENABLED or not articles:
+            return articles
+        
+        articles, report = dedup_articles(articles, Config.DEDUP_SIMILARITY_THRESHOLD)
+        if report.articles_in != report.articles_out or report.sentences_removed:
+            print(f"🧹 Dedup: {report.articles_in} → {report.articles_out} articles, "
+                  f"{report.sentences_removed} repeated sentences, "
+                  f"{report.tokens_removed:,} tokens removed")
+        return articles
+    
+    def _build_inputs(self, topic: str, articles: List[NewsArticle]) -> dict:
+        """Format search results into prompt inputs for LLM analysis."""
+        return {
+            "topic": topic,
+            "search_results": self._format_articles(topic, articles)
+        }
+    
+    def _fast_findings(self, state: NewsState, inputs: dict) -> ResearchFindings:
+        """Fast mode: one call returns the findings and sets the editorial angle."""
+        inputs = {**inputs, "format_type": state.format_type}
+        if self.fast_structured:
+            brief, raw = self.fast_structured.invoke(inputs)
+        else:
+            brief, raw = None, (self.fast_prompt | self.llm).invoke(inputs).content
+        return self._apply_brief(state, brief, raw)
+    
+    async def _afast_findings(self, state: NewsState, inputs: dict) -> ResearchFindings:
+        """Async version of _fast_findings()."""
+        inputs = {**inputs, "format_type": state.format_type}
+        if self.fast_structured:
+            brief, raw = await self.fast_structured.ainvoke(inputs)
+        else:
+            brief, raw = None, (await (self.fast_prompt | self.llm).ainvoke(inputs)).content
+        return self._apply_brief(state, brief, raw)
+    
+    def _apply_brief(self, state: NewsState, brief: Optional[ResearchBrief], raw: str) -> ResearchFindings:
+        """Store the fused call's angle; without a parsed brief the editor node selects one."""
+        if brief is None:
+            print("⚠️  Fast mode: no editorial angle parsed; the editor will select one")
+            return self._parse_findings(raw)
+        
+        state.editorial_angle = brief.editorial_angle()
+        print(f"⚡ Fast mode: editorial angle selected with research: {brief.angle[:60]}...")
+        return brief.findings()
+    
+    def _build_results(self, topic: str, articles: List[NewsArticle],
+                       findings: ResearchFindings) -> ResearchResults:
+        """Combine the articles and the extracted findings (STRUCTURED OUTPUT)."""
         research_results = ResearchResults(
             topic=topic,
             articles=articles,
-            key_facts=key_facts,
-            summary=summary
+            key_facts=findings.key_facts,
+            summary=findings.summary
         )
         
-        state.research_results = research_results
-        print(f"✅ Research complete. Found {len(key_facts)} key facts")
+        print(f"✅ Research complete. Found {len(findings.key_facts)} key facts")
+        return research_results
+    
+    def _reuse_cached_research(self, state: NewsState) -> bool:
+        """Fill in research from the semantic topic cache, if a close topic is fresh."""
+        if not Config.TOPIC_CACHE_ENABLED:
+            return False
         
-        return state
+        cached = self._lookup_topic_cache(state.topic)
+        if not cached:
+            return False
+        
+        state.research_results = cached["research"].model_copy(update={"topic": state.topic})
+        print(f"✅ Reused research for '{cached['matched_topic']}' "
+              f"(similarity {cached['similarity']:.3f})")
+        return True
     
-    def _format_articles(self, articles: List[NewsArticle]) -> str:
-        """Format articles for LLM consumption."""
-        formatted = []
-        for idx, article in enumerate(articles, 1):
-            formatted.append(f"""
-Article {idx}:
-Title: {article.title}
-Source: {article.source or 'Unknown'}
-URL: {article.url}
-Published: {article.published_date or 'Unknown'}
-
-Content:
-{article.content}
-
----
-""")
-        return "\n".join(formatted)
+    def _lookup_topic_cache(self, topic: str) -> Optional[dict]:
+        """Look up the semantic topic cache; failures fall back to fresh research."""
+        try:
+            return topic_cache.get().lookup(topic)
+        except Exception as e:
+            print(f"Error reading topic cache: {e}")
+            return None
+    
+    def _store_topic_cache(self, topic: str, research: ResearchResults) -> None:
+        """Remember research for similar future topics."""
+        try:
+            topic_cache.get().store(topic, research)
+        except Exception as e:
+            print(f"Error writing topic cache: {e}")
+    
+    def _format_articles(self, topic: str, articles: List[NewsArticle]) -> str:
+        """Format articles for LLM consumption, within the researcher's token budget."""
+        return pack_for_agent("researcher", articles, query=topic).text
+    
+    def _parse_findings(self, response: str) -> ResearchFindings:
+        """Text-parsing fallback when structured output is off or failed."""
+        key_facts, summary = self._parse_response(response)
+        return ResearchFindings(key_facts=key_facts, summary=summary)
     
     def _parse_response(self, response: str) -> tuple[List[str], str]:
         """
@@ -154,5 +335,5 @@ Content:
         return key_facts[:10], summary.strip()  # Limit to 10 facts
 
 
-# Create singleton instance
-researcher_agent = ResearcherAgent()
+# Shared instance, built on first use
+researcher_agent = LazyProvider("researcher_agent", ResearcherAgent)
@@ -0,0 +1,137 @@
+"""
+Per-agent model routing and tiering.
+Each agent runs on a tier ("cheap", "strong") or a named model with its own
+temperature and max tokens; journalist rewrites after a low-confidence
+fact-check are escalated to a stronger model. Every call is metered per
+tier for cost and latency.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from src.config import Config
+
+TIERS = ("cheap", "strong")
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """The model settings one agent call runs with."""
+    agent: str
+    tier: str
+    model: str
+    temperature: float
+    max_tokens: Optional[int]
+
+
+def _resolve(choice: str) -> Tuple[str, str]:
+    """(tier, model) for a tier name or a model name."""
+    if choice in TIERS:
+        return choice, getattr(Config, f"{choice.upper()}_MODEL")
+    # A model named directly is its own tier in the reports
+    return choice, choice
+
+
+def agent_profile(agent: str, escalated: bool = False) -> ModelProfile:
+    """
+    Model settings for an agent, from Config.<AGENT>_MODEL/_TEMPERATURE/_MAX_TOKENS.
+
+    Args:
+        agent: Agent name (researcher, editor, journalist, fact_checker)
+        escalated: Use Config.ESCALATION_MODEL instead of the agent's own model
+    """
+    prefix = agent.upper()
+    tier, model = _resolve(Config.ESCALATION_MODEL if escalated else getattr(Config, f"{prefix}_MODEL"))
+    return ModelProfile(
+        agent=agent,
+        tier=tier,
+        model=model,
+        temperature=getattr(Config, f"{prefix}_TEMPERATURE"),
+        max_tokens=getattr(Config, f"{prefix}_MAX_TOKENS") or None
+    )
+
+
+def should_escalate(state) -> bool:
+    """
+    Whether the journalist's next draft should use the escalation model.
+
+    Only rewrites are escalated, and only when the last fact-check's
+    confidence fell below Config.MIN_FACT_CHECK_CONFIDENCE; an inaccurate
+    verdict with high confidence is rewritten on the journalist's own tier.
+    """
+    fact_check = state.fact_check
+    return (state.iteration_count > 0
+            and fact_check is not None
+            and fact_check.confidence_score < Config.MIN_FACT_CHECK_CONFIDENCE)
+
+
+def _parse_prices(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Parse "model:input/output,..." (USD per million tokens)."""
+    prices = {}
+    for entry in spec.split(","):
+        model, _, price = entry.strip().partition(":")
+        input_price, _, output_price = price.partition("/")
+        try:
+            prices[model.strip()] = (float(input_price), float(output_price or input_price))
+        except ValueError:
+            continue
+    return prices
+
+
+def call_cost(model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    """USD cost of one call from Config.MODEL_PRICES, or None if the model is unpriced."""
+    price = _parse_prices(Config.MODEL_PRICES).get(model)
+    if price is None:
+        return None
+    return (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
+
+
+class TierStats:
+    """Per-tier counters for model calls: latency, tokens and cost."""
+
+    def __init__(self):
+        self._tiers: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tier: str, model: str, latency: float,
+               input_tokens: int, output_tokens: int) -> None:
+        cost = call_cost(model, input_tokens, output_tokens)
+        with self._lock:
+            stats = self._tiers.setdefault(tier, {
+                "models": set(), "calls": 0, "latency_seconds": 0.0,
+                "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0, "unpriced_calls": 0
+            })
+            stats["models"].add(model)
+            stats["calls"] += 1
+            stats["latency_seconds"] += latency
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            if cost is None:
+                stats["unpriced_calls"] += 1
+            else:
+                stats["cost_usd"] += cost
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Calls, mean latency, tokens and cost per tier."""
+        with self._lock:
+            return {
+                tier: {
+                    **stats,
+                    "models": sorted(stats["models"]),
+                    "mean_latency_seconds": stats["latency_seconds"] / stats["calls"],
+                    "cost_usd": round(stats["cost_usd"], 6)
+                }
+                for tier, stats in self._tiers.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tiers.clear()
+
+
+tier_stats = TierStats()
+
+
+def model_tier_stats() -> Dict[str, dict]:
+    """Cost and latency of every model call so far, per tier."""
+    return tier_stats.snapshot()
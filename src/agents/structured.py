@@ -0,0 +1,89 @@
+"""
+Schema-constrained structured output for agents.
+Agents get their Pydantic model straight from the provider instead of
+scraping free text; failures are counted and fall back to text parsing.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from src.config import Config
+
+
+class StructuredOutputStats:
+    """Per-agent counters for structured calls and parse failures."""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent: str, failed: bool) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(agent, {"calls": 0, "failures": 0})
+            counts["calls"] += 1
+            counts["failures"] += int(failed)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Calls, failures and failure rate per agent."""
+        with self._lock:
+            return {
+                agent: {**counts, "failure_rate": counts["failures"] / counts["calls"]}
+                for agent, counts in self._counts.items()
+            }
+
+
+_stats = StructuredOutputStats()
+
+
+def structured_output_stats() -> Dict[str, dict]:
+    """Parse-failure counters for every agent using structured output."""
+    return _stats.snapshot()
+
+
+class StructuredCaller:
+    """
+    prompt | llm.with_structured_output(schema) with failure accounting.
+
+    Returns the parsed model, or None plus the raw text so the caller can
+    fall back to its text parser without another LLM call.
+    """
+
+    def __init__(self, agent: str, prompt, llm, schema: Type[BaseModel]):
+        """
+        Args:
+            agent: Agent name, for the failure counters
+            prompt: ChatPromptTemplate producing the messages
+            llm: Chat model to constrain
+            schema: Pydantic model the response must match
+        """
+        self.agent = agent
+        self.schema = schema
+        # The JSON schema (not the class) is bound so a malformed reply comes
+        # back as a parsing error with the raw message, instead of raising
+        # inside the client; the model is validated here
+        self.chain = prompt | llm.with_structured_output(
+            schema.model_json_schema(), method=Config.STRUCTURED_OUTPUT_METHOD, include_raw=True
+        )
+
+    def invoke(self, inputs: dict) -> Tuple[Optional[BaseModel], str]:
+        return self._unpack(self.chain.invoke(inputs))
+
+    async def ainvoke(self, inputs: dict) -> Tuple[Optional[BaseModel], str]:
+        return self._unpack(await self.chain.ainvoke(inputs))
+
+    def _unpack(self, result: Dict[str, Any]) -> Tuple[Optional[BaseModel], str]:
+        parsed = None
+        if result.get("parsing_error") is None and result.get("parsed") is not None:
+            try:
+                parsed = self.schema.model_validate(result["parsed"])
+            except ValidationError:
+                pass
+        failed = parsed is None
+        _stats.record(self.agent, failed)
+
+        raw = result.get("raw")
+        raw_text = raw.content if raw is not None and isinstance(raw.content, str) else ""
+        if failed:
+            print(f"⚠️  {self.agent} structured output failed to parse; falling back to text parsing")
+            return None, raw_text
+        return parsed, raw_text
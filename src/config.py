@@ -26,22 +26,134 @@ class Config:
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
     
+    # Model Routing (each agent runs on a tier or a named model; max tokens 0 = provider default)
+    CHEAP_MODEL = os.getenv("CHEAP_MODEL", OPENAI_MODEL)
+    STRONG_MODEL = os.getenv("STRONG_MODEL", "gpt-4o")
+    RESEARCHER_MODEL = os.getenv("RESEARCHER_MODEL", "cheap")
+    EDITOR_MODEL = os.getenv("EDITOR_MODEL", "cheap")
+    JOURNALIST_MODEL = os.getenv("JOURNALIST_MODEL", "cheap")
+    FACT_CHECKER_MODEL = os.getenv("FACT_CHECKER_MODEL", "cheap")
+    RESEARCHER_TEMPERATURE = float(os.getenv("RESEARCHER_TEMPERATURE", str(TEMPERATURE)))
+    EDITOR_TEMPERATURE = float(os.getenv("EDITOR_TEMPERATURE", str(TEMPERATURE)))
+    JOURNALIST_TEMPERATURE = float(os.getenv("JOURNALIST_TEMPERATURE", str(TEMPERATURE)))
+    FACT_CHECKER_TEMPERATURE = float(os.getenv("FACT_CHECKER_TEMPERATURE", "0.3"))
+    RESEARCHER_MAX_TOKENS = int(os.getenv("RESEARCHER_MAX_TOKENS", "1500"))
+    EDITOR_MAX_TOKENS = int(os.getenv("EDITOR_MAX_TOKENS", "600"))
+    JOURNALIST_MAX_TOKENS = int(os.getenv("JOURNALIST_MAX_TOKENS", "0"))
+    FACT_CHECKER_MAX_TOKENS = int(os.getenv("FACT_CHECKER_MAX_TOKENS", "800"))
+    # Journalist rewrites after a fact-check below MIN_FACT_CHECK_CONFIDENCE run on ESCALATION_MODEL
+    MIN_FACT_CHECK_CONFIDENCE = float(os.getenv("MIN_FACT_CHECK_CONFIDENCE", "0.7"))
+    ESCALATION_MODEL = os.getenv("ESCALATION_MODEL", "strong")
+    # USD per million input/output tokens, for per-tier cost reports
+    MODEL_PRICES = os.getenv("MODEL_PRICES", "gpt-4o-mini:0.15/0.60,gpt-4o:2.50/10.00")
+    
     # Vector Store Configuration
     CHROMA_PERSIST_DIR = os.getenv("CHROMA_PERSIST_DIR", "./chroma_db")
     COLLECTION_NAME = os.getenv("COLLECTION_NAME", "news_articles")
     
     # Search Configuration
     MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", "5"))
+    SEARCH_EXPANSION_ENABLED = os.getenv("SEARCH_EXPANSION_ENABLED", "true").lower() == "true"
+    SEARCH_EXPANSION_QUERIES = int(os.getenv("SEARCH_EXPANSION_QUERIES", "4"))
+    SEARCH_MAX_WORKERS = int(os.getenv("SEARCH_MAX_WORKERS", "4"))
+    MAX_RESEARCH_ARTICLES = int(os.getenv("MAX_RESEARCH_ARTICLES", "10"))
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+    DEDUP_SIMILARITY_THRESHOLD = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.7"))
+    
+    # Cache Configuration
+    CACHE_DIR = os.getenv("CACHE_DIR", "./.cache")
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "1800"))
+    SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_AGENTS = [
+        agent.strip()
+        for agent in os.getenv("LLM_CACHE_AGENTS", "researcher,editor,journalist,fact_checker").split(",")
+        if agent.strip()
+    ]
+    LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+    TOPIC_CACHE_ENABLED = os.getenv("TOPIC_CACHE_ENABLED", "true").lower() == "true"
+    TOPIC_CACHE_MAX_DISTANCE = float(os.getenv("TOPIC_CACHE_MAX_DISTANCE", "0.25"))
+    TOPIC_CACHE_FRESHNESS_SECONDS = float(os.getenv("TOPIC_CACHE_FRESHNESS_SECONDS", "10800"))
+    TOPIC_CACHE_MAX_ENTRIES = int(os.getenv("TOPIC_CACHE_MAX_ENTRIES", "500"))  # 0 = uncapped
+    EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+    
+    # Concurrency Configuration (per process; 0 means uncapped)
+    OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+    TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "4"))
+    
+    # Rate Limit Configuration (per process; 0 disables a budget)
+    OPENAI_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    OPENAI_TOKENS_PER_MINUTE = float(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+    TAVILY_REQUESTS_PER_MINUTE = float(os.getenv("TAVILY_REQUESTS_PER_MINUTE", "100"))
+    RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "5"))
+    BACKOFF_BASE_SECONDS = float(os.getenv("BACKOFF_BASE_SECONDS", "1"))
+    BACKOFF_MAX_SECONDS = float(os.getenv("BACKOFF_MAX_SECONDS", "30"))
+    
+    # Streaming Fact-Check (check paragraphs while the article is generated)
+    STREAMING_FACT_CHECK = os.getenv("STREAMING_FACT_CHECK", "false").lower() == "true"
+    PARAGRAPH_CHECK_WORKERS = int(os.getenv("PARAGRAPH_CHECK_WORKERS", "4"))
+    
+    # HTTP Transport (one keep-alive pool shared by every model client)
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None  # e.g. a local mock server
+    HTTP_SHARED_POOL = os.getenv("HTTP_SHARED_POOL", "true").lower() == "true"
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "60"))
+    HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "10"))
+    
+    # Prompt Context Budgets (tokens of source material per agent)
+    RESEARCHER_CONTEXT_TOKENS = int(os.getenv("RESEARCHER_CONTEXT_TOKENS", "4000"))
+    JOURNALIST_CONTEXT_TOKENS = int(os.getenv("JOURNALIST_CONTEXT_TOKENS", "3000"))
+    FACT_CHECKER_CONTEXT_TOKENS = int(os.getenv("FACT_CHECKER_CONTEXT_TOKENS", "1500"))
+    CONTEXT_PASSAGE_TOKENS = int(os.getenv("CONTEXT_PASSAGE_TOKENS", "120"))
+    
+    # Refinement (patch only the sections the fact-checker flagged)
+    PATCH_REFINEMENT = os.getenv("PATCH_REFINEMENT", "true").lower() == "true"
+    PATCH_MAX_SECTIONS = int(os.getenv("PATCH_MAX_SECTIONS", "3"))
+    
+    # Structured Output (provider-side schemas instead of free-text parsing)
+    STRUCTURED_OUTPUT = os.getenv("STRUCTURED_OUTPUT", "true").lower() == "true"
+    STRUCTURED_OUTPUT_METHOD = os.getenv("STRUCTURED_OUTPUT_METHOD", "json_schema")  # or function_calling
+    
+    # Fast Mode (one fused research + editorial-angle call instead of two)
+    FAST_MODE = os.getenv("FAST_MODE", "false").lower() == "true"
+    
+    # Vector Store Ingestion
+    VECTOR_WRITER_WORKERS = int(os.getenv("VECTOR_WRITER_WORKERS", "2"))
+    INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "256"))
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "4"))
+    CHUNK_TOKENS = int(os.getenv("CHUNK_TOKENS", "200"))
+    CHUNK_OVERLAP_SENTENCES = int(os.getenv("CHUNK_OVERLAP_SENTENCES", "1"))
+    
+    # Retrieval (topic + recency filters, hybrid BM25 + dense ranking with time decay)
+    RETRIEVAL_RECENCY_DAYS = float(os.getenv("RETRIEVAL_RECENCY_DAYS", "30"))  # 0 = no window
+    RETRIEVAL_HALF_LIFE_DAYS = float(os.getenv("RETRIEVAL_HALF_LIFE_DAYS", "7"))  # 0 = no decay
+    RETRIEVAL_OVERFETCH = int(os.getenv("RETRIEVAL_OVERFETCH", "3"))
+    RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "hybrid")  # or dense
+    HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+    
+    # Vector Store Retention (0 disables a limit)
+    RETENTION_MAX_AGE_DAYS = float(os.getenv("RETENTION_MAX_AGE_DAYS", "30"))
+    RETENTION_MAX_ARTICLES = int(os.getenv("RETENTION_MAX_ARTICLES", "50000"))
+    RETENTION_MAX_PER_TOPIC = int(os.getenv("RETENTION_MAX_PER_TOPIC", "500"))
+    RETENTION_INTERVAL_SECONDS = float(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))  # background job; 0 = off
+    
+    # Startup Configuration
+    IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "250"))
     
     @classmethod
     def validate(cls):
-        """Validate that required configuration is present."""
+        """
+        Validate that required configuration is present.
+        Called by the clients that need the keys when they are first built,
+        so importing the package works without any keys configured.
+        """
         if not cls.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is required. Please set it in .env file.")
         if not cls.TAVILY_API_KEY:
             raise ValueError("TAVILY_API_KEY is required. Please set it in .env file.")
         return True
-
-
-# Validate configuration on import
-Config.validate()
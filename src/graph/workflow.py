@@ -3,27 +3,55 @@ LangGraph workflow implementation.
 This demonstrates LANGGRAPH: State, Nodes, Graph - a key MAT496 topic.
 """
 
-from typing import Literal
-from langgraph.graph import StateGraph, END
-from src.state import NewsState
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Dict, List, Literal, Optional
+from src.config import Config
+from src.providers import LazyProvider
+from src.state import NewsState, GeneratedContent
 from src.agents.researcher import researcher_agent
 from src.agents.editor import editor_agent
 from src.agents.journalist import journalist_agent
 from src.agents.fact_checker import fact_checker_agent
 from src.rag.vector_store import vector_store
+from src.rag.background_writer import background_writer
+from src.tools.tavily_search import SearchError
+from src.utils.concurrency import detached_context
+from src.utils.http import aclose_loop_pool
+from src.utils.rate_limiter import limiter_wait_scope
 
 
 # Node functions
+# Providers are resolved with .get() inside each node: LangGraph inspects node
+# globals at compile time, and attribute forwarding would build them eagerly.
 def research_node(state: NewsState) -> NewsState:
     """Research node - searches for news and extracts facts."""
-    return researcher_agent.research(state)
+    try:
+        return researcher_agent.get().research(state)
+    except SearchError as e:
+        return _search_failed(state, e)
+
+
+def _search_failed(state: NewsState, error: SearchError) -> NewsState:
+    """Stop the run: a provider outage is not the same as a topic with no news."""
+    print(f"❌ Research aborted: {error}")
+    state.error_message = f"Search provider unavailable: {error}"
+    return state
 
 
 def store_in_vector_db_node(state: NewsState) -> NewsState:
-    """Store research results in vector database for RAG."""
+    """
+    Store research results in vector database for RAG.
+    
+    The write runs in the background so embedding overlaps the editor,
+    journalist and fact-check stages; refinement waits for it.
+    """
     if state.research_results:
-        print("💾 Storing articles in vector database...")
-        vector_store.add_articles(
+        print("💾 Storing articles in vector database (background)...")
+        background_writer.get().submit(
             state.research_results.articles,
             state.topic
         )
@@ -32,17 +60,78 @@ def store_in_vector_db_node(state: NewsState) -> NewsState:
 
 def editor_node(state: NewsState) -> NewsState:
     """Editor node - selects editorial angle."""
-    return editor_agent.select_angle(state)
+    return editor_agent.get().select_angle(state)
 
 
 def journalist_node(state: NewsState) -> NewsState:
-    """Journalist node - writes the content."""
-    return journalist_agent.write_content(state)
+    """Journalist node - writes the content, or patches it after a failed fact-check."""
+    if _should_patch(state):
+        return journalist_agent.get().revise_content(state)
+    if Config.STREAMING_FACT_CHECK:
+        return _write_with_paragraph_checks(state)
+    return journalist_agent.get().write_content(state)
+
+
+def _should_patch(state: NewsState) -> bool:
+    """Refinement passes revise the flagged sections instead of rewriting the draft."""
+    return (Config.PATCH_REFINEMENT and state.iteration_count > 0
+            and state.generated_content is not None and state.fact_check is not None)
+
+
+def _write_with_paragraph_checks(state: NewsState) -> NewsState:
+    """
+    Stream the article and fact-check each paragraph as soon as it is written.
+    
+    Checks run in worker threads while generation continues, so the fact-check
+    node only has to aggregate them: end-to-end latency is roughly generation
+    time plus the check of the last paragraph.
+    """
+    journalist = journalist_agent.get()
+    fact_checker = fact_checker_agent.get()
+    state.paragraph_fact_checks = []
+    start = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=Config.PARAGRAPH_CHECK_WORKERS) as pool:
+        # Copy the context per check so rate-limiter waits count toward this node; detached,
+        # because the suspended stream holds the OpenAI slot and checks must take their own
+        futures = [
+            pool.submit(detached_context().run, fact_checker.check_paragraph, state, index, paragraph)
+            for index, paragraph in enumerate(journalist.stream_paragraphs(state))
+        ]
+        generated = time.perf_counter() - start
+        
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    
+    checks = _collect_paragraph_checks(results)
+    return _finish_paragraph_checks(state, checks, generated, time.perf_counter() - start)
+
+
+def _collect_paragraph_checks(results: list) -> list:
+    """Drop skipped paragraphs; any failure discards all checks (full check runs instead)."""
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        print(f"⚠️  {len(errors)} paragraph checks failed ({errors[0]}); "
+              f"falling back to a full fact-check")
+        return []
+    return [result for result in results if result is not None]
+
+
+def _finish_paragraph_checks(state: NewsState, checks: list, generated: float, total: float) -> NewsState:
+    state.paragraph_fact_checks = checks
+    if checks:
+        print(f"⏱️  Generation took {generated:.1f}s; {len(checks)} paragraph checks "
+              f"finished {total - generated:.1f}s later")
+    return state
 
 
 def fact_check_node(state: NewsState) -> NewsState:
     """Fact-check node - verifies accuracy."""
-    return fact_checker_agent.check_facts(state)
+    return fact_checker_agent.get().check_facts(state)
 
 
 def refinement_node(state: NewsState) -> NewsState:
@@ -50,19 +139,32 @@ def refinement_node(state: NewsState) -> NewsState:
     Refinement node - uses RAG to get additional context and refine content.
     This demonstrates RAG (Retrieval Augmented Generation).
     """
+    state = _advance_refinement(state)
+    if state.is_complete:
+        return state
+    
     print("🔄 Refining content with additional context...")
     
-    # Get relevant context from vector store
-    if state.fact_check and state.fact_check.issues_found:
-        # Use issues to guide retrieval
-        query = f"{state.topic} {' '.join(state.fact_check.issues_found[:2])}"
-    else:
-        query = state.topic
+    # Make sure this topic's articles have been written before retrieving
+    background_writer.get().wait_for_topic(state.topic)
     
-    additional_context = vector_store.get_context_for_topic(state.topic, query, n_results=3)
+    # Get relevant context from vector store; the journalist revises against it
+    query = _refinement_query(state)
+    state.refinement_context = vector_store.get().get_context_for_topic(state.topic, query, n_results=5)
     
-    # For now, just mark for re-writing
-    # In a more advanced version, we could pass the context to the journalist
+    return state
+
+
+def _refinement_query(state: NewsState) -> str:
+    """Build the retrieval query for refinement."""
+    if state.fact_check and state.fact_check.issues_found:
+        # Use issues to guide retrieval
+        return f"{state.topic} {' '.join(state.fact_check.issues_found[:2])}"
+    return state.topic
+
+
+def _advance_refinement(state: NewsState) -> NewsState:
+    """Count a refinement iteration and stop once the limit is reached (the graph then ends)."""
     state.iteration_count += 1
     
     # Prevent infinite loops
@@ -74,6 +176,139 @@ def refinement_node(state: NewsState) -> NewsState:
     return state
 
 
+# Async node functions
+# Same behavior as the nodes above, built on ainvoke and async search so one
+# event loop can drive many workflows. Blocking ChromaDB calls run in threads.
+async def aresearch_node(state: NewsState) -> NewsState:
+    """Async research node."""
+    try:
+        return await researcher_agent.get().aresearch(state)
+    except SearchError as e:
+        return _search_failed(state, e)
+
+
+async def astore_in_vector_db_node(state: NewsState) -> NewsState:
+    """Async vector-store node; submits the write and returns at once."""
+    if state.research_results:
+        print("💾 Storing articles in vector database (background)...")
+        background_writer.get().submit(
+            state.research_results.articles,
+            state.topic
+        )
+    return state
+
+
+async def aeditor_node(state: NewsState) -> NewsState:
+    """Async editor node."""
+    return await editor_agent.get().aselect_angle(state)
+
+
+async def ajournalist_node(state: NewsState) -> NewsState:
+    """Async journalist node."""
+    if _should_patch(state):
+        return await journalist_agent.get().arevise_content(state)
+    if Config.STREAMING_FACT_CHECK:
+        return await _awrite_with_paragraph_checks(state)
+    return await journalist_agent.get().awrite_content(state)
+
+
+async def _awrite_with_paragraph_checks(state: NewsState) -> NewsState:
+    """Async version of _write_with_paragraph_checks(); checks run as tasks."""
+    journalist = journalist_agent.get()
+    fact_checker = fact_checker_agent.get()
+    state.paragraph_fact_checks = []
+    start = time.perf_counter()
+    
+    tasks = []
+    index = 0
+    async for paragraph in journalist.astream_paragraphs(state):
+        tasks.append(detached_context().run(
+            asyncio.create_task, fact_checker.acheck_paragraph(state, index, paragraph)
+        ))
+        index += 1
+    generated = time.perf_counter() - start
+    
+    checks = _collect_paragraph_checks(await asyncio.gather(*tasks, return_exceptions=True))
+    return _finish_paragraph_checks(state, checks, generated, time.perf_counter() - start)
+
+
+async def afact_check_node(state: NewsState) -> NewsState:
+    """Async fact-check node."""
+    return await fact_checker_agent.get().acheck_facts(state)
+
+
+async def arefinement_node(state: NewsState) -> NewsState:
+    """Async refinement node."""
+    state = _advance_refinement(state)
+    if state.is_complete:
+        return state
+    
+    print("🔄 Refining content with additional context...")
+    
+    await asyncio.to_thread(background_writer.get().wait_for_topic, state.topic)
+    
+    query = _refinement_query(state)
+    state.refinement_context = await asyncio.to_thread(
+        vector_store.get().get_context_for_topic, state.topic, query, 5
+    )
+    
+    return state
+
+
+def _track_limiter_wait(name: str, node):
+    """
+    Wrap a node so time spent queueing or backing off on provider rate
+    limiters is recorded in state.limiter_wait_seconds under the node name.
+    """
+    def record(state: NewsState, waited: float) -> NewsState:
+        if waited > 0 and isinstance(state, NewsState):
+            state.limiter_wait_seconds[name] = round(
+                state.limiter_wait_seconds.get(name, 0.0) + waited, 3
+            )
+            print(f"⏳ {name} waited {waited:.1f}s on rate limiters")
+        return state
+    
+    if inspect.iscoroutinefunction(node):
+        @wraps(node)
+        async def async_wrapper(state: NewsState) -> NewsState:
+            with limiter_wait_scope() as waited:
+                result = await node(state)
+            return record(result, waited[0])
+        return async_wrapper
+    
+    @wraps(node)
+    def wrapper(state: NewsState) -> NewsState:
+        with limiter_wait_scope() as waited:
+            result = node(state)
+        return record(result, waited[0])
+    return wrapper
+
+
+SYNC_NODES = {
+    name: _track_limiter_wait(name, node)
+    for name, node in {
+        "research": research_node,
+        "store_vectors": store_in_vector_db_node,
+        "editor": editor_node,
+        "journalist": journalist_node,
+        "fact_check": fact_check_node,
+        "refine": refinement_node
+    }.items()
+}
+
+ASYNC_NODES = {
+    name: _track_limiter_wait(name, node)
+    for name, node in {
+        "research": aresearch_node,
+        "store_vectors": astore_in_vector_db_node,
+        "editor": aeditor_node,
+        "journalist": ajournalist_node,
+        "fact_check": afact_check_node,
+        "refine": arefinement_node
+    }.items()
+}
+
+
 # Conditional edge functions
 def should_continue_after_research(state: NewsState) -> Literal["continue", "end"]:
     """Decide whether to continue after research."""
@@ -89,26 +324,43 @@ def should_refine(state: NewsState) -> Literal["refine", "end"]:
     return "end"
 
 
+def should_revise(state: NewsState) -> Literal["revise", "end"]:
+    """After refine: revise the draft, unless the iteration limit accepted it."""
+    return "end" if state.is_complete else "revise"
+
+
 # Build the graph
-def create_workflow() -> StateGraph:
+def create_workflow(use_async: bool = False):
     """
     Create the LangGraph workflow.
     
+    Args:
+        use_async: Build the graph from async nodes (for ainvoke/astream)
+    
     Workflow:
     START → Research → Store in Vector DB → Editor → Journalist → Fact Check → [Refine or END]
                                                                         ↓
-                                                                    Journalist (if refine)
+                                                          Journalist (or END at the iteration limit)
+    
+    The vector-store write is handed to a background writer, so it overlaps
+    the editor → fact-check stages and only Refine waits for it.
+    
+    In fast mode (state.fast_mode) Research also picks the editorial angle in
+    the same LLM call, and Editor passes the state through.
+    
+    LangGraph is imported here rather than at module level so that importing
+    this module stays cheap; the graph is compiled on first use.
     """
+    from langgraph.graph import StateGraph, END
+    
     # Initialize the graph with NewsState
     workflow = StateGraph(NewsState)
     
+    nodes = ASYNC_NODES if use_async else SYNC_NODES
+    
     # Add nodes
-    workflow.add_node("research", research_node)
-    workflow.add_node("store_vectors", store_in_vector_db_node)
-    workflow.add_node("editor", editor_node)
-    workflow.add_node("journalist", journalist_node)
-    workflow.add_node("fact_check", fact_check_node)
-    workflow.add_node("refine", refinement_node)
+    workflow.add_node("research", nodes["research"])
+    workflow.add_node("store_vectors", nodes["store_vectors"])
     
     # Set entry point
     workflow.set_entry_point("research")
@@ -124,6 +376,37 @@ def create_workflow() -> StateGraph:
     )
     
     workflow.add_edge("store_vectors", "editor")
+    _add_writing_stages(workflow, END, nodes)
+    
+    # Compile the graph
+    return workflow.compile()
+
+
+def create_format_workflow(use_async: bool = False):
+    """
+    Create the per-format part of the workflow, starting from existing research.
+    
+    Args:
+        use_async: Build the graph from async nodes (for ainvoke/astream)
+    
+    Workflow:
+    START → Editor → Journalist → Fact Check → [Refine or END]
+    """
+    from langgraph.graph import StateGraph, END
+    
+    workflow = StateGraph(NewsState)
+    workflow.set_entry_point("editor")
+    _add_writing_stages(workflow, END, ASYNC_NODES if use_async else SYNC_NODES)
+    return workflow.compile()
+
+
+def _add_writing_stages(workflow, end, nodes: dict) -> None:
+    """Add the editor → journalist → fact-check → refine loop to a graph."""
+    workflow.add_node("editor", nodes["editor"])
+    workflow.add_node("journalist", nodes["journalist"])
+    workflow.add_node("fact_check", nodes["fact_check"])
+    workflow.add_node("refine", nodes["refine"])
+    
     workflow.add_edge("editor", "journalist")
     workflow.add_edge("journalist", "fact_check")
     
@@ -132,15 +415,142 @@ def create_workflow() -> StateGraph:
         should_refine,
         {
             "refine": "refine",
-            "end": END
+            "end": end
         }
     )
     
-    workflow.add_edge("refine", "journalist")
+    workflow.add_conditional_edges(
+        "refine",
+        should_revise,
+        {
+            "revise": "journalist",
+            "end": end
+        }
+    )
+
+
+# Compiled workflow, built on first use
+news_workflow = LazyProvider("news_workflow", create_workflow)
+
+format_workflow = LazyProvider("format_workflow", create_format_workflow)
+
+# Async variants: support ainvoke/astream so one event loop can run many stories
+async_news_workflow = LazyProvider("async_news_workflow", partial(create_workflow, use_async=True))
+async_format_workflow = LazyProvider("async_format_workflow", partial(create_format_workflow, use_async=True))
+
+ALL_FORMATS = ["blog", "vintage", "professional", "social_thread"]
+
+
+def run_multi_format(topic: str, formats: Optional[List[str]] = None) -> Dict[str, GeneratedContent]:
+    """
+    Generate several formats from a single research pass.
     
-    # Compile the graph
-    return workflow.compile()
+    Research and vector storage run once; the editor → journalist → fact-check
+    loop then runs for every format in parallel, so wall-clock time stays
+    close to a single-format run.
+    
+    Args:
+        topic: The news topic to research
+        formats: Formats to generate (defaults to all four)
+        
+    Returns:
+        Mapping from format type to GeneratedContent (failed formats are omitted)
+    """
+    formats = formats or ALL_FORMATS
+    start = time.perf_counter()
+    
+    # Through the tracked node wrappers, so research waits are recorded like in the graph
+    state = NewsState(topic=topic, format_type=formats[0])
+    state = SYNC_NODES["research"](state)
+    if should_continue_after_research(state) == "end":
+        print(f"❌ Research failed: {state.error_message}")
+        return {}
+    state = SYNC_NODES["store_vectors"](state)
+    
+    # Each format gets its own copy of the state, sharing the research results
+    format_states = [_format_state(state, format_type) for format_type in formats]
+    print(f"🔀 Writing {len(formats)} formats in parallel: {', '.join(formats)}")
+    
+    outputs = format_workflow.get().batch(
+        format_states,
+        config={"max_concurrency": len(formats)},
+        return_exceptions=True
+    )
+    
+    results = _collect_format_results(formats, outputs)
+    print(f"⏱️  {len(results)}/{len(formats)} formats ready in {time.perf_counter() - start:.1f}s")
+    return results
+
+
+async def arun_multi_format(topic: str, formats: Optional[List[str]] = None) -> Dict[str, GeneratedContent]:
+    """
+    Async version of run_multi_format(); formats run concurrently on the event loop.
+    
+    Meant as the top-level coroutine of an asyncio.run() call: the loop's
+    pooled HTTP connections are closed when it returns.
+    
+    Args:
+        topic: The news topic to research
+        formats: Formats to generate (defaults to all four)
+        
+    Returns:
+        Mapping from format type to GeneratedContent (failed formats are omitted)
+    """
+    try:
+        return await _arun_multi_format(topic, formats or ALL_FORMATS)
+    finally:
+        await aclose_loop_pool()
+
+
+async def _arun_multi_format(topic: str, formats: List[str]) -> Dict[str, GeneratedContent]:
+    start = time.perf_counter()
+    
+    state = NewsState(topic=topic, format_type=formats[0])
+    state = await ASYNC_NODES["research"](state)
+    if should_continue_after_research(state) == "end":
+        print(f"❌ Research failed: {state.error_message}")
+        return {}
+    state = await ASYNC_NODES["store_vectors"](state)
+    
+    print(f"🔀 Writing {len(formats)} formats concurrently: {', '.join(formats)}")
+    graph = async_format_workflow.get()
+    outputs = await asyncio.gather(
+        *(graph.ainvoke(_format_state(state, format_type)) for format_type in formats),
+        return_exceptions=True
+    )
+    
+    results = _collect_format_results(formats, outputs)
+    print(f"⏱️  {len(results)}/{len(formats)} formats ready in {time.perf_counter() - start:.1f}s")
+    return results
+
+
+def _format_state(state: NewsState, format_type: str) -> NewsState:
+    """
+    Copy of the researched state for one format; a fast-mode angle only fits its own format.
+    
+    Research results are shared read-only; the per-run containers the nodes
+    write to are copied so parallel formats never mix their numbers.
+    """
+    update = {
+        "format_type": format_type,
+        "limiter_wait_seconds": dict(state.limiter_wait_seconds),
+        "paragraph_fact_checks": list(state.paragraph_fact_checks)
+    }
+    if format_type != state.format_type:
+        update["editorial_angle"] = None
+    return state.model_copy(update=update)
 
 
-# Create the compiled workflow
-news_workflow = create_workflow()
+def _collect_format_results(formats: List[str], outputs: list) -> Dict[str, GeneratedContent]:
+    """Map each format to its generated content, reporting failures."""
+    results = {}
+    for format_type, output in zip(formats, outputs):
+        if isinstance(output, Exception):
+            print(f"❌ {format_type} failed: {output}")
+            continue
+        final_state = NewsState(**output) if isinstance(output, dict) else output
+        if final_state.generated_content:
+            results[format_type] = final_state.generated_content
+        else:
+            print(f"❌ {format_type} failed: {final_state.error_message}")
+    return results
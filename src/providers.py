@@ -0,0 +1,88 @@
+"""
+Lazy provider registry for The Daily AI.
+Heavy singletons (LLM clients, Tavily, ChromaDB, the compiled graph) are built
+the first time they are used instead of at import time.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class LazyProvider:
+    """
+    Thread-safe, on-demand holder for a shared object.
+
+    The provider builds its instance with ``factory`` the first time it is
+    needed. Attribute access is forwarded to the instance, so a provider can
+    stand in for the eager module-level singletons used across the codebase
+    (e.g. ``researcher_agent.research(state)`` keeps working).
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        """
+        Register a new provider.
+
+        Args:
+            name: Registry name used for introspection and logging
+            factory: Zero-argument callable that builds the instance
+        """
+        self._name = name
+        self._factory = factory
+        self._instance: Optional[Any] = None
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    @property
+    def name(self) -> str:
+        """Registry name of this provider."""
+        return self._name
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the instance has been built."""
+        return self._instance is not None
+
+    def get(self) -> Any:
+        """Return the shared instance, building it on first use."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def reset(self) -> None:
+        """Drop the cached instance so the next access rebuilds it."""
+        with self._lock:
+            self._instance = None
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not found on the provider itself;
+        # private names are never forwarded to avoid recursion during setup.
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.get(), attr)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self.initialized else "lazy"
+        return f"<LazyProvider {self._name} ({state})>"
+
+
+_registry: Dict[str, LazyProvider] = {}
+
+
+def get_provider(name: str) -> LazyProvider:
+    """Look up a registered provider by name."""
+    return _registry[name]
+
+
+def initialized_providers() -> List[str]:
+    """Names of providers whose instances have already been built."""
+    return [name for name, provider in _registry.items() if provider.initialized]
+
+
+def reset_providers() -> None:
+    """Reset every registered provider (useful for tests and config reloads)."""
+    for provider in _registry.values():
+        provider.reset()
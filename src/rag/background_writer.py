@@ -0,0 +1,155 @@
+"""
+Background vector-store ingestion.
+Articles are embedded and written off the critical path; only the refinement
+step, the one reader of the store, waits for a topic's pending writes.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from src.config import Config
+from src.providers import LazyProvider
+from src.state import NewsArticle
+
+
+@dataclass(eq=False)
+class PendingWrite:
+    """One submitted ingestion job and its timing."""
+    future: Future
+    article_count: int
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    reported: bool = False
+
+
+class BackgroundWriter:
+    """
+    Runs VectorStore.add_articles on a worker pool, keeping a registry of
+    pending writes per topic so readers can wait for exactly what they need.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Args:
+            max_workers: Concurrent ingestion jobs (defaults to Config.VECTOR_WRITER_WORKERS)
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.VECTOR_WRITER_WORKERS,
+            thread_name_prefix="vector-writer"
+        )
+        self._pending: Dict[str, List[PendingWrite]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, articles: List[NewsArticle], topic: str) -> PendingWrite:
+        """
+        Queue articles for ingestion and return immediately.
+
+        Args:
+            articles: Articles to store
+            topic: The topic these articles are related to
+        """
+        from src.rag.vector_store import vector_store
+
+        write = PendingWrite(future=None, article_count=len(articles), submitted_at=time.perf_counter())
+
+        def run():
+            write.started_at = time.perf_counter()
+            try:
+                vector_store.get().add_articles(articles, topic)
+            finally:
+                write.finished_at = time.perf_counter()
+
+        with self._lock:
+            self._prune()
+            write.future = self._executor.submit(run)
+            self._pending.setdefault(topic, []).append(write)
+        write.future.add_done_callback(lambda future: self._report(topic, write))
+        return write
+
+    def _prune(self) -> None:
+        """Forget finished writes nobody waited on (caller holds the lock)."""
+        for topic in list(self._pending):
+            writes = [write for write in self._pending[topic] if not write.future.done()]
+            if writes:
+                self._pending[topic] = writes
+            else:
+                del self._pending[topic]
+
+    def _report(self, topic: str, write: PendingWrite) -> None:
+        error = write.future.exception()
+        if error is not None:
+            print(f"❌ Background vector-store write for '{topic}' failed: {error}")
+            return
+        print(f"💾 Stored {write.article_count} articles for '{topic}' in "
+              f"{write.finished_at - write.started_at:.2f}s (background)")
+
+    def wait_for_topic(self, topic: str, timeout: Optional[float] = None) -> float:
+        """
+        Block until every pending write for a topic has finished.
+
+        Failed writes are reported but not raised: refinement can still run
+        against whatever the store already holds.
+
+        Args:
+            topic: Topic to wait for
+            timeout: Maximum seconds to wait per write
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            writes = list(self._pending.get(topic, []))
+        if not writes:
+            return 0.0
+
+        start = time.perf_counter()
+        for write in writes:
+            try:
+                write.future.result(timeout=timeout)
+            except Exception:
+                pass  # already reported by the done callback
+        waited = time.perf_counter() - start
+
+        # Several format branches may wait on the same topic; report each write once
+        with self._lock:
+            remaining = [write for write in self._pending.get(topic, []) if write not in writes]
+            if remaining:
+                self._pending[topic] = remaining
+            else:
+                self._pending.pop(topic, None)
+            unreported = [write for write in writes if not write.reported]
+            for write in unreported:
+                write.reported = True
+
+        for write in unreported:
+            if write.finished_at is None:
+                continue
+            duration = write.finished_at - (write.started_at or write.submitted_at)
+            hidden = max(0.0, duration - waited)
+            print(f"⏱️  Vector-store write took {duration:.2f}s; {hidden:.2f}s overlapped "
+                  f"with editorial work, refine waited {waited:.2f}s")
+        return waited
+
+    def pending_topics(self) -> List[str]:
+        """Topics with writes that have not been waited for yet."""
+        with self._lock:
+            return [topic for topic, writes in self._pending.items()
+                    if any(not write.future.done() for write in writes)]
+
+    def flush(self) -> None:
+        """Wait for every pending write (e.g. before a batch run exits)."""
+        with self._lock:
+            writes = [write for topic_writes in self._pending.values() for write in topic_writes]
+            self._pending.clear()
+        for write in writes:
+            try:
+                write.future.result()
+            except Exception:
+                pass
+
+
+# Shared writer, built on first use
+background_writer = LazyProvider("background_writer", BackgroundWriter)
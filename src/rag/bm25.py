@@ -0,0 +1,270 @@
+"""
+Local BM25 inverted index kept alongside the Chroma collection.
+Dense embeddings blur exact names: company names, bill numbers and tickers
+("H.R. 4821", "NVDA") are matched far better lexically. The index is updated
+on every vector-store write and stored in a SQLite file next to Chroma's.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from src.rag.chunking import record_topics
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.\-&'][a-z0-9]+)*")
+PART_PATTERN = re.compile(r"[.\-&']")
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do does for from had
+has have he her his how i if in into is it its more most new no not of on or our out over said
+she so than that the their them then there these they this to up was we were what when which
+who will with would you
+""".split())
+
+# Filterable fields copied from each record's metadata
+FIELDS = ("topic", "source", "published_ts", "stored_ts")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase terms for indexing and querying.
+
+    Compound tokens ("gpt-4o", "h.r", "at&t") are kept whole and also split
+    into their parts, so "GPT-4o" matches both "gpt-4o" and "gpt".
+    """
+    terms = []
+    for token in TOKEN_PATTERN.findall((text or "").lower()):
+        if token.endswith("'s"):
+            token = token[:-2]  # possessive: "nvidia's" -> "nvidia"
+        if token not in STOPWORDS:
+            terms.append(token)
+        if PART_PATTERN.search(token):
+            terms.extend(part for part in PART_PATTERN.split(token)
+                         if part not in STOPWORDS and (len(part) > 1 or part.isdigit()))
+    return terms
+
+
+class BM25Index:
+    """
+    Okapi BM25 over the vector store's passage records.
+
+    Postings and per-document lengths live in SQLite, so the index survives
+    restarts and is shared by every process using the same store; scoring
+    only reads the postings of the query's terms.
+    """
+
+    def __init__(self, path: str, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            path: SQLite file for the index
+            k1: Term-frequency saturation
+            b: Document-length normalization
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            had_docs, had_topics = (self._conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+            ).fetchone()[0] for name in ("docs", "doc_topics"))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS docs (id TEXT PRIMARY KEY, length INTEGER NOT NULL, "
+                "topic TEXT, source TEXT, published_ts INTEGER, stored_ts INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings (term TEXT NOT NULL, doc_id TEXT NOT NULL, "
+                "tf INTEGER NOT NULL, PRIMARY KEY (term, doc_id)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id)")
+            # Every topic a document was stored under
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS doc_topics (doc_id TEXT NOT NULL, topic TEXT NOT NULL, "
+                "PRIMARY KEY (doc_id, topic)) WITHOUT ROWID"
+            )
+        # An index written before topic membership was tracked has to be rebuilt
+        self.needs_rebuild = bool(had_docs and not had_topics)
+
+    def _delete(self, ids: Sequence[str]) -> None:
+        """Remove documents (caller holds the lock and a transaction)."""
+        rows = [(doc_id,) for doc_id in ids]
+        self._conn.executemany("DELETE FROM postings WHERE doc_id = ?", rows)
+        self._conn.executemany("DELETE FROM doc_topics WHERE doc_id = ?", rows)
+        self._conn.executemany("DELETE FROM docs WHERE id = ?", rows)
+
+    def add(self, ids: Sequence[str], documents: Sequence[str], metadatas: Sequence[dict]) -> None:
+        """Index documents, replacing any earlier version under the same ID."""
+        docs, postings = [], []
+        for doc_id, document, metadata in zip(ids, documents, metadatas):
+            counts = Counter(tokenize(document))
+            docs.append((doc_id, sum(counts.values()), *(metadata.get(name) for name in FIELDS)))
+            postings.extend((term, doc_id, tf) for term, tf in counts.items())
+
+        with self._lock, self._conn:
+            self._delete(ids)
+            self._conn.executemany("INSERT INTO docs VALUES (?, ?, ?, ?, ?, ?)", docs)
+            self._conn.executemany("INSERT INTO postings VALUES (?, ?, ?)", postings)
+            self._insert_topics(ids, metadatas)
+
+    def add_topics(self, ids: Sequence[str], metadatas: Sequence[dict]) -> None:
+        """Record extra topics for indexed documents; their text is unchanged."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE docs SET topic = ? WHERE id = ?",
+                [(metadata.get("topic"), doc_id) for doc_id, metadata in zip(ids, metadatas)]
+            )
+            self._insert_topics(ids, metadatas)
+
+    def _insert_topics(self, ids: Sequence[str], metadatas: Sequence[dict]) -> None:
+        """Add documents' topic memberships (caller holds the lock and a transaction)."""
+        self._conn.executemany("INSERT OR IGNORE INTO doc_topics VALUES (?, ?)", [
+            (doc_id, topic) for doc_id, metadata in zip(ids, metadatas) for topic in record_topics(metadata)
+        ])
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """Drop documents from the index."""
+        with self._lock, self._conn:
+            self._delete(ids)
+
+    def clear(self) -> None:
+        """Drop every document from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM postings")
+            self._conn.execute("DELETE FROM doc_topics")
+            self._conn.execute("DELETE FROM docs")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def rebuild(self, collection, page_size: int = 1000) -> int:
+        """
+        Re-index every record of a Chroma collection.
+
+        Returns:
+            Number of records indexed
+        """
+        self.clear()
+        self.needs_rebuild = False
+        offset = 0
+        while True:
+            page = collection.get(limit=page_size, offset=offset, include=["documents", "metadatas"])
+            if not page["ids"]:
+                return offset
+            self.add(page["ids"], [doc or "" for doc in page["documents"]],
+                     [meta or {} for meta in page["metadatas"]])
+            offset += len(page["ids"])
+
+    def sync(self, collection, page_size: int = 1000) -> Tuple[int, int]:
+        """
+        Bring the index back in line with a Chroma collection it drifted from.
+
+        Only record IDs are compared; documents are read and tokenized just
+        for the records missing from the index.
+
+        Returns:
+            (records indexed, documents dropped)
+        """
+        stored = set()
+        offset = 0
+        while True:
+            page = collection.get(limit=page_size, offset=offset, include=[])
+            if not page["ids"]:
+                break
+            stored.update(page["ids"])
+            offset += len(page["ids"])
+        with self._lock:
+            indexed = {row[0] for row in self._conn.execute("SELECT id FROM docs")}
+
+        missing, extra = sorted(stored - indexed), sorted(indexed - stored)
+        for start in range(0, len(missing), page_size):
+            page = collection.get(ids=missing[start:start + page_size], include=["documents", "metadatas"])
+            self.add(page["ids"], [doc or "" for doc in page["documents"]],
+                     [meta or {} for meta in page["metadatas"]])
+        if extra:
+            self.remove(extra)
+        return len(missing), len(extra)
+
+    def vacuum(self) -> None:
+        """Return pages freed by removals to the disk."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+            # In WAL mode the rebuilt pages land in the log first
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def search(self, query: str, n_results: int = 10, topic: Optional[str] = None,
+               source: Optional[str] = None, since: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a query by BM25.
+
+        Args:
+            query: Free-text query
+            n_results: Number of documents to return
+            topic: Only documents stored under this topic (among others)
+            source: Only documents from this source
+            since: Only documents published (or, if undated, stored) at or after this unix time
+
+        Returns:
+            (document ID, score) pairs, best first
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+
+        placeholders = ", ".join("?" * len(terms))
+        filters, params = [], []
+        if topic:
+            filters.append("EXISTS (SELECT 1 FROM doc_topics t WHERE t.doc_id = d.id AND t.topic = ?)")
+            params.append(topic)
+        if source:
+            filters.append("d.source = ?")
+            params.append(source)
+        if since:
+            filters.append("(d.published_ts >= ? OR (d.published_ts = 0 AND d.stored_ts >= ?))")
+            params.extend([since, since])
+        where = "".join(f" AND {condition}" for condition in filters)
+
+        with self._lock:
+            count, total_length = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+            ).fetchone()
+            if not count:
+                return []
+            document_frequency: Dict[str, int] = dict(self._conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+            ).fetchall())
+            rows = self._conn.execute(
+                f"SELECT p.doc_id, p.term, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc_id "
+                f"WHERE p.term IN ({placeholders}){where}", [*terms, *params]
+            ).fetchall()
+
+        average_length = total_length / count or 1.0
+        idf = {term: math.log(1 + (count - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+        scores: Dict[str, float] = {}
+        for doc_id, term, tf, length in rows:
+            norm = self.k1 * (1 - self.b + self.b * length / average_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf[term] * tf * (self.k1 + 1) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:n_results]
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists: each list adds 1 / (k + rank) to an ID's score.
+
+    Rank-based, so BM25 scores and vector distances never need to be put on
+    a common scale.
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
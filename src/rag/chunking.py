@@ -0,0 +1,126 @@
+"""
+Sentence-aware chunking of articles into passages for the vector store.
+Passages stay within a token budget, never cut a sentence in half (unless
+the sentence alone is over budget) and overlap by a few sentences so a fact
+spanning a boundary is still retrievable.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+from src.config import Config
+from src.utils.context_packer import count_tokens
+
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+@dataclass
+class Passage:
+    """One chunk of an article."""
+    index: int
+    text: str
+    tokens: int
+
+
+def passage_id(article_id: str, index: int) -> str:
+    """ID of a passage record: the parent article's ID plus its position."""
+    return f"{article_id}#{index}"
+
+
+def parent_id(record_id: str) -> str:
+    """Parent article ID of a passage record."""
+    return record_id.split("#", 1)[0]
+
+
+# Topic membership is one True-valued metadata key per topic, so an article
+# stored under several topics matches a where filter for each of them
+TOPIC_FLAG_PREFIX = "topic:"
+
+
+def topic_flag(topic: str) -> str:
+    """Metadata key marking a record as stored under a topic."""
+    return f"{TOPIC_FLAG_PREFIX}{topic}"
+
+
+def record_topics(metadata: dict) -> List[str]:
+    """
+    Every topic a record was stored under.
+
+    Records written before topic flags existed carry only their "topic" field.
+    """
+    topics = [key[len(TOPIC_FLAG_PREFIX):] for key, value in metadata.items()
+              if key.startswith(TOPIC_FLAG_PREFIX) and value]
+    if metadata.get("topic") and metadata["topic"] not in topics:
+        topics.append(metadata["topic"])
+    return topics
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (and paragraph breaks), dropping blanks."""
+    return [sentence.strip() for sentence in SENTENCE_PATTERN.split(text or "") if sentence.strip()]
+
+
+def _split_long(sentence: str, max_tokens: int) -> List[str]:
+    """Break a sentence that alone exceeds the budget into word windows."""
+    words = sentence.split()
+    pieces, current = [], []
+    for word in words:
+        current.append(word)
+        if count_tokens(" ".join(current)) > max_tokens and len(current) > 1:
+            current.pop()
+            pieces.append(" ".join(current))
+            current = [word]
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int = None, overlap_sentences: int = None) -> List[Passage]:
+    """
+    Split text into passages of whole sentences.
+
+    Args:
+        text: Article body
+        max_tokens: Passage budget (defaults to Config.CHUNK_TOKENS)
+        overlap_sentences: Sentences repeated at the start of the next passage
+            (defaults to Config.CHUNK_OVERLAP_SENTENCES)
+
+    Returns:
+        Passages in document order
+    """
+    max_tokens = max_tokens or Config.CHUNK_TOKENS
+    overlap = Config.CHUNK_OVERLAP_SENTENCES if overlap_sentences is None else overlap_sentences
+
+    sentences = []
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence)
+        if tokens > max_tokens:
+            sentences.extend((piece, count_tokens(piece)) for piece in _split_long(sentence, max_tokens))
+        else:
+            sentences.append((sentence, tokens))
+
+    passages: List[Passage] = []
+    current: List[tuple] = []
+    fresh = 0  # sentences in current that no earlier passage contains
+
+    def flush() -> None:
+        passages.append(Passage(
+            index=len(passages),
+            text=" ".join(sentence for sentence, _ in current),
+            tokens=sum(tokens for _, tokens in current)
+        ))
+
+    for sentence, tokens in sentences:
+        if current and fresh and sum(t for _, t in current) + tokens > max_tokens:
+            flush()
+            # Carry the overlap forward, as long as it leaves room for new text
+            current = current[-overlap:] if overlap else []
+            while current and sum(t for _, t in current) + tokens > max_tokens:
+                current.pop(0)
+            fresh = 0
+        current.append((sentence, tokens))
+        fresh += 1
+
+    if current and fresh:
+        flush()
+    return passages
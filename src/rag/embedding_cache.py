@@ -0,0 +1,115 @@
+"""
+Embedding cache keyed by content hash.
+Popular stories show up in many searches; caching their embeddings lets
+ingestion skip the embedding model for text it has already seen.
+"""
+
+import base64
+import os
+import threading
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from src.config import Config
+from src.utils.cache import SQLiteCache, make_cache_key
+
+
+class EmbeddingCache:
+    """
+    Content-addressed cache in front of an embedding function.
+
+    Vectors are stored as float32 in a local SQLite file, keyed on the
+    embedding model name and the exact document text.
+    """
+
+    def __init__(self, embedding_function: Optional[Callable] = None,
+                 path: Optional[str] = None):
+        """
+        Args:
+            embedding_function: Callable mapping a list of texts to vectors;
+                defaults to ChromaDB's default embedding function so vectors
+                match the ones the collection uses for queries
+            path: Location of the cache file
+        """
+        if embedding_function is None:
+            from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+            embedding_function = DefaultEmbeddingFunction()
+
+        self.embedding_function = embedding_function
+        self.model_name = self._model_name(embedding_function)
+        self.store = SQLiteCache(
+            path or os.path.join(Config.CACHE_DIR, "embedding_cache.sqlite"),
+            max_entries=Config.EMBEDDING_CACHE_MAX_ENTRIES
+        )
+
+        self.computed = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _model_name(embedding_function: Callable) -> str:
+        """Identify the model so vectors from different models never mix."""
+        name = getattr(embedding_function, "name", None)
+        if callable(name):
+            return str(name())
+        return type(embedding_function).__name__
+
+    @staticmethod
+    def _encode(vector: Sequence[float]) -> str:
+        return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+    @staticmethod
+    def _decode(value: str) -> List[float]:
+        return np.frombuffer(base64.b64decode(value), dtype=np.float32).tolist()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, computing vectors only for text not seen before.
+
+        Args:
+            texts: Documents to embed
+
+        Returns:
+            One vector per input text, in order
+        """
+        keys = [make_cache_key("embedding", self.model_name, text) for text in texts]
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Unique texts that still need the model (duplicates within a batch count once)
+        pending = {}
+        for idx, key in enumerate(keys):
+            if key in pending:
+                pending[key].append(idx)
+                continue
+            cached = self.store.get(key)
+            if cached is not None:
+                vectors[idx] = self._decode(cached)
+            else:
+                pending[key] = [idx]
+
+        if pending:
+            pending_keys = list(pending)
+            computed = self.embedding_function([texts[pending[key][0]] for key in pending_keys])
+            for key, vector in zip(pending_keys, computed):
+                vector = np.asarray(vector, dtype=np.float32).tolist()
+                self.store.set(key, self._encode(vector))
+                for idx in pending[key]:
+                    vectors[idx] = vector
+
+        with self._lock:
+            self.computed += len(pending)
+            self.reused += len(texts) - len(pending)
+
+        return vectors
+
+    def stats(self) -> dict:
+        """Get counters for embeddings computed versus reused."""
+        total = self.computed + self.reused
+        return {
+            "model": self.model_name,
+            "computed": self.computed,
+            "reused": self.reused,
+            "reuse_rate": self.reused / total if total else 0.0,
+            "entries": len(self.store)
+        }
@@ -0,0 +1,235 @@
+"""
+Bulk, streaming ingestion for vector-store backfills.
+Articles are read lazily (e.g. from a JSONL archive), embedded and upserted
+in batches on a worker pool with a bounded number of batches in flight, and
+progress is checkpointed so an interrupted backfill resumes where it stopped.
+
+Usage:
+    python -m src.rag.ingest archive.jsonl [--batch-size 256] [--workers 4] [--checkpoint PATH]
+
+Each JSONL line is an article: {"title", "url", "content", "published_date",
+"source", "topic"}; lines without a topic use --topic.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+from src.config import Config
+from src.state import NewsArticle
+
+Item = Tuple[NewsArticle, str]
+
+
+def read_jsonl(path: str, default_topic: str = "archive") -> Iterator[Item]:
+    """
+    Stream (article, topic) pairs from a JSONL archive, one line at a time.
+
+    Blank lines are skipped; malformed lines are reported and skipped so one
+    bad record does not stop a backfill.
+    """
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                topic = entry.pop("topic", None) or default_topic
+                article = NewsArticle(**{key: value for key, value in entry.items()
+                                         if key in NewsArticle.model_fields})
+            except (ValueError, TypeError) as e:
+                print(f"⚠️  {path}:{line_number}: skipped ({e})")
+                continue
+            yield article, topic
+
+
+@dataclass
+class IngestReport:
+    """Outcome of a bulk ingestion run."""
+    read: int
+    written: int
+    failed_batches: int
+    failed_articles: int
+    resumed_from: int
+    elapsed_seconds: float
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class Checkpoint:
+    """
+    Resume position of a backfill: how many input items are fully written.
+
+    Saved atomically (write then rename) so a crash never leaves it corrupt.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+
+    def load(self) -> int:
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        with open(self.path, encoding="utf-8") as handle:
+            return int(json.load(handle).get("position", 0))
+
+    def save(self, position: int, written: int) -> None:
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"position": position, "written": written, "updated_at": time.time()}, handle)
+        os.replace(temp_path, self.path)
+
+
+class BulkIngestor:
+    """
+    Streams items into the vector store in batches on a worker pool.
+
+    At most workers * 2 batches are held in memory at once, whatever the
+    size of the input. Batches can finish out of order, so the checkpoint
+    only advances past a batch once every batch before it is written;
+    anything re-read after a crash is an idempotent upsert.
+    """
+
+    def __init__(self, store=None, batch_size: int = None, workers: int = None,
+                 checkpoint_path: Optional[str] = None, report_every: float = 10.0):
+        """
+        Args:
+            store: VectorStore to write to (defaults to the shared one)
+            batch_size: Articles per embed + upsert call (defaults to Config.INGEST_BATCH_SIZE)
+            workers: Concurrent batches (defaults to Config.INGEST_WORKERS)
+            checkpoint_path: File recording the resume position (None disables resuming)
+            report_every: Seconds between progress lines
+        """
+        if store is None:
+            from src.rag.vector_store import vector_store
+            store = vector_store.get()
+        self.store = store
+        self.batch_size = batch_size or Config.INGEST_BATCH_SIZE
+        self.workers = workers or Config.INGEST_WORKERS
+        self.checkpoint = Checkpoint(checkpoint_path)
+        self.report_every = report_every
+
+    def _batches(self, items: Iterator[Item]) -> Iterator[List[Item]]:
+        while True:
+            batch = list(itertools.islice(items, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def ingest(self, items: Iterable[Item]) -> IngestReport:
+        """
+        Write every (article, topic) pair, resuming from the checkpoint.
+
+        Args:
+            items: Iterator or generator of (NewsArticle, topic) pairs, in a
+                stable order so the checkpoint position means the same on resume
+
+        Returns:
+            IngestReport with counts and throughput
+        """
+        resumed_from = self.checkpoint.load()
+        items = itertools.islice(iter(items), resumed_from, None)
+        if resumed_from:
+            print(f"⏩ Resuming after {resumed_from:,} articles")
+
+        start = time.perf_counter()
+        last_report = start
+        read = written = failed = failed_articles = 0
+
+        # Batches finished out of order wait here until the checkpoint reaches them
+        position = resumed_from
+        done = {}  # batch offset -> (size, succeeded)
+        blocked = False
+
+        def collect(future, offset: int, size: int) -> None:
+            nonlocal written, failed, failed_articles
+            error = future.exception()
+            done[offset] = (size, error is None)
+            if error is None:
+                written += future.result()
+            else:
+                failed += 1
+                failed_articles += size
+                print(f"❌ Batch at article {offset:,} failed: {error}")
+
+        def advance() -> None:
+            nonlocal position, blocked
+            while not blocked and position in done:
+                size, succeeded = done.pop(position)
+                if not succeeded:
+                    # The checkpoint stays in front of a failed batch so a resume retries it
+                    blocked = True
+                    break
+                position += size
+            self.checkpoint.save(position, written)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest") as pool:
+            in_flight = {}
+            offset = resumed_from
+            for batch in self._batches(items):
+                # Bound memory: wait for a slot before reading further
+                if len(in_flight) >= self.workers * 2:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        collect(future, *in_flight.pop(future))
+                    advance()
+
+                in_flight[pool.submit(self.store.add_batch, batch)] = (offset, len(batch))
+                offset += len(batch)
+                read += len(batch)
+
+                now = time.perf_counter()
+                if now - last_report >= self.report_every:
+                    last_report = now
+                    print(f"📥 {read:,} read, {written:,} written, "
+                          f"{read / (now - start):,.0f} docs/s")
+
+            for future in list(in_flight):
+                collect(future, *in_flight.pop(future))
+            advance()
+
+        return IngestReport(read=read, written=written, failed_batches=failed,
+                            failed_articles=failed_articles, resumed_from=resumed_from,
+                            elapsed_seconds=time.perf_counter() - start)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backfill the vector store from a JSONL archive.")
+    parser.add_argument("input", help="JSONL file of articles")
+    parser.add_argument("--topic", default="archive", help="Topic for lines without one")
+    parser.add_argument("--batch-size", type=int, default=Config.INGEST_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=Config.INGEST_WORKERS)
+    parser.add_argument("--checkpoint", default=None,
+                        help="Resume file (default: <input>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    checkpoint_path = args.checkpoint or f"{args.input}.checkpoint.json"
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    ingestor = BulkIngestor(batch_size=args.batch_size, workers=args.workers,
+                            checkpoint_path=checkpoint_path)
+    report = ingestor.ingest(read_jsonl(args.input, args.topic))
+
+    icon = "✅" if report.failed_batches == 0 else "⚠️ "
+    unchanged = report.read - report.written - report.failed_articles
+    print(f"{icon} Ingested {report.read:,} articles ({report.written:,} written, {unchanged:,} unchanged) "
+          f"in {report.elapsed_seconds:.1f}s: {report.docs_per_second:,.0f} docs/s")
+    if report.failed_batches:
+        print(f"❌ {report.failed_batches} batches failed; rerun to retry them from {checkpoint_path}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+One-off migration of an existing vector store to passage records.
+
+Older versions stored each article as one whole-article record, first keyed
+as "{topic}_{idx}_{hash(url)}" with a per-process salted hash() and
+append-only adds (so every run re-inserted the same articles), later keyed
+by article_id(). This keeps one copy of each distinct article (the most
+recently inserted wins, stored under the topics of all copies), re-stores
+it as sentence-aware passages under "{article_id}#{n}" and deletes the
+whole-article records. Passages are
+re-embedded, since their text differs from the old documents. Passages
+stored before dates were indexed get their published_ts / stored_ts
+metadata backfilled in place (stored_ts is the migration time).
+
+Usage (with no app or batch run using the store):
+    python -m src.rag.migrate [--dry-run] [--batch-size 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from src.config import Config
+from src.rag.retention import directory_size, vacuum
+from src.rag.vector_store import article_id, published_timestamp
+from src.state import NewsArticle
+
+
+def _to_article(document: str, metadata: dict) -> Tuple[NewsArticle, str]:
+    """Rebuild the (article, topic) a whole-article record was stored from."""
+    title, _, content = (document or "").partition("\n\nContent: ")
+    if not content:
+        title, content = "", document or ""
+
+    def known(key: str) -> Optional[str]:
+        return None if metadata.get(key) in (None, "", "unknown") else metadata[key]
+
+    article = NewsArticle(
+        title=metadata.get("title") or title.removeprefix("Title: "),
+        url=metadata.get("url", ""),
+        content=content,
+        source=known("source"),
+        published_date=known("published_date")
+    )
+    return article, metadata.get("topic", "archive")
+
+
+def _with_timestamps(metadata: dict, stored_ts: int) -> dict:
+    """Passage metadata with the sortable date fields added."""
+    published_date = metadata.get("published_date")
+    if published_date == "unknown":
+        published_date = ""
+    return {
+        **metadata,
+        "published_date": published_date or "",
+        "published_ts": published_timestamp(published_date),
+        "stored_ts": stored_ts
+    }
+
+
+def plan_migration(collection, batch_size: int = 500) -> dict:
+    """
+    Scan a collection for whole-article records.
+
+    Returns:
+        Dict with "keep" (article id -> (document, metadata) of the copy to
+        re-store), "topics" (article id -> topics of all its copies),
+        "delete" (every whole-article record id), "undated" (passage id ->
+        metadata missing timestamps) and "total"
+    """
+    keep: Dict[str, tuple] = {}
+    topics: Dict[str, List[str]] = {}
+    delete: List[str] = []
+    undated: Dict[str, dict] = {}
+    total = 0
+    offset = 0
+    while True:
+        # Chroma returns records in insertion order, so later copies overwrite earlier ones
+        page = collection.get(limit=batch_size, offset=offset, include=["metadatas", "documents"])
+        if not page["ids"]:
+            break
+        for record_id, metadata, document in zip(page["ids"], page["metadatas"], page["documents"]):
+            metadata = metadata or {}
+            total += 1
+            if "passage_index" in metadata:
+                if "published_ts" not in metadata:
+                    undated[record_id] = metadata
+                continue
+            aid = article_id(metadata.get("url", ""), document or "")
+            keep[aid] = (document, metadata)
+            topic = metadata.get("topic", "archive")
+            if topic not in topics.setdefault(aid, []):
+                topics[aid].append(topic)
+            delete.append(record_id)
+        offset += len(page["ids"])
+
+    return {"keep": keep, "topics": topics, "delete": delete, "undated": undated, "total": total}
+
+
+def migrate(store, batch_size: int = 500, dry_run: bool = False) -> dict:
+    """
+    Re-store whole-article records as passages and drop duplicates.
+
+    Args:
+        store: VectorStore whose collection is migrated in place
+        batch_size: Records read and articles written per call
+        dry_run: Only report what would change
+
+    Returns:
+        Counts before and after, and articles re-stored / records deleted
+    """
+    plan = plan_migration(store.collection, batch_size)
+    report = {
+        "records_before": plan["total"],
+        "records_after": plan["total"],
+        "articles": len(plan["keep"]),
+        "deleted": len(plan["delete"]),
+        "dated": len(plan["undated"])
+    }
+    if dry_run:
+        return report
+
+    # 1. Re-store each distinct article as passages, under each of its topics
+    items = [(_to_article(document, metadata)[0], topic)
+             for aid, (document, metadata) in plan["keep"].items()
+             for topic in plan["topics"][aid]]
+    for start in range(0, len(items), batch_size):
+        store.add_batch(items[start:start + batch_size])
+
+    # 2. Delete the whole-article records
+    store.delete(plan["delete"])
+
+    # 3. Backfill timestamps on passages written before dates were indexed
+    stored_ts = int(time.time())
+    undated = list(plan["undated"].items())
+    for start in range(0, len(undated), batch_size):
+        page = undated[start:start + batch_size]
+        store.collection.update(
+            ids=[record_id for record_id, _ in page],
+            metadatas=[_with_timestamps(metadata, stored_ts) for _, metadata in page]
+        )
+
+    report["records_after"] = store.collection.count()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Deduplicate a vector store and move it to passage records.")
+    parser.add_argument("--path", default=Config.CHROMA_PERSIST_DIR, help="Chroma persist directory")
+    parser.add_argument("--collection", default=Config.COLLECTION_NAME)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.path):
+        print(f"❌ No vector store at {args.path}")
+        return 1
+
+    from src.rag.vector_store import VectorStore
+
+    Config.CHROMA_PERSIST_DIR = args.path
+    Config.COLLECTION_NAME = args.collection
+    store = VectorStore()
+
+    size_before = directory_size(args.path)
+    start = time.perf_counter()
+    report = migrate(store, args.batch_size, args.dry_run)
+    elapsed = time.perf_counter() - start
+
+    if args.dry_run:
+        print(f"🔎 Would re-store {report['articles']:,} articles as passages and delete "
+              f"{report['deleted']:,} of {report['records_before']:,} records; "
+              f"would date {report['dated']:,} passages")
+        return 0
+
+    print(f"✅ Re-stored {report['articles']:,} articles as passages and deleted {report['deleted']:,} "
+          f"whole-article records ({report['records_before']:,} → {report['records_after']:,} records) "
+          f"in {elapsed:.1f}s")
+    if report["dated"]:
+        print(f"📅 Backfilled timestamps on {report['dated']:,} passages")
+    # SQLite reuses freed pages; the file only shrinks after a VACUUM
+    if report["deleted"]:
+        vacuum(args.path)
+    print(f"💾 Store size: {size_before / 1e6:.1f} MB → {directory_size(args.path) / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
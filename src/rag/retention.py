@@ -0,0 +1,319 @@
+"""
+Retention and compaction for the news vector store.
+News goes stale within days, so a RetentionPolicy evicts articles (all of
+their passages) past a maximum age and beyond per-topic and total caps.
+Freed pages of the BM25 index go back to the disk on every pass; Chroma's
+SQLite file is only VACUUMed from the command line, while no process has the
+store open, since a VACUUM from a second connection breaks Chroma's writes.
+
+Usage (with no app or batch run using the store):
+    python -m src.rag.retention [--dry-run] [--max-age-days 30] [--max-articles 50000] [--max-per-topic 500]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from src.config import Config
+from src.providers import LazyProvider
+from src.rag.chunking import parent_id, record_topics
+
+CHROMA_SQLITE_FILE = "chroma.sqlite3"
+
+
+def directory_size(path: str) -> int:
+    """Total size in bytes of the files under a directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+@dataclass
+class StoredArticle:
+    """One article in the store: its topics, age and passage record IDs."""
+    topics: List[str]
+    timestamp: int
+    record_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    Limits on what the vector store keeps; 0 disables a limit.
+
+    Attributes:
+        max_age_days: Evict articles published (or, if undated, stored) longer ago
+        max_articles: Keep at most this many articles, newest first
+        max_per_topic: Keep at most this many articles per topic, newest first
+    """
+    max_age_days: float = 0.0
+    max_articles: int = 0
+    max_per_topic: int = 0
+
+    @classmethod
+    def from_config(cls) -> "RetentionPolicy":
+        return cls(
+            max_age_days=Config.RETENTION_MAX_AGE_DAYS,
+            max_articles=Config.RETENTION_MAX_ARTICLES,
+            max_per_topic=Config.RETENTION_MAX_PER_TOPIC
+        )
+
+    def select_evictions(self, articles: Dict[str, StoredArticle], now: float) -> Dict[str, str]:
+        """
+        Decide which articles to evict.
+
+        Age is applied first, then the per-topic caps, then the total cap.
+        An article stored under several topics is kept while any of them
+        still has room for it. Articles with no timestamp at all are never
+        too old, but are the first to go when a cap is exceeded.
+
+        Returns:
+            Article ID -> reason ("age", "topic_cap" or "total_cap")
+        """
+        evicted: Dict[str, str] = {}
+
+        if self.max_age_days:
+            cutoff = now - self.max_age_days * 86400
+            for aid, article in articles.items():
+                if article.timestamp and article.timestamp < cutoff:
+                    evicted[aid] = "age"
+
+        def newest_first(ids: List[str]) -> List[str]:
+            return sorted(ids, key=lambda aid: articles[aid].timestamp, reverse=True)
+
+        if self.max_per_topic:
+            by_topic: Dict[str, List[str]] = {}
+            for aid, article in articles.items():
+                if aid not in evicted:
+                    for topic in article.topics or [""]:
+                        by_topic.setdefault(topic, []).append(aid)
+            within_cap = set()
+            for ids in by_topic.values():
+                within_cap.update(newest_first(ids)[:self.max_per_topic])
+            for aid in articles:
+                if aid not in evicted and aid not in within_cap:
+                    evicted[aid] = "topic_cap"
+
+        if self.max_articles:
+            remaining = [aid for aid in articles if aid not in evicted]
+            for aid in newest_first(remaining)[self.max_articles:]:
+                evicted[aid] = "total_cap"
+
+        return evicted
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of one retention + compaction pass."""
+    articles_before: int
+    articles_after: int
+    records_before: int
+    records_after: int
+    evicted: Dict[str, int]
+    bytes_before: int
+    bytes_after: int
+    vacuumed: bool
+    elapsed_seconds: float
+
+    @property
+    def evicted_articles(self) -> int:
+        return sum(self.evicted.values())
+
+
+def scan_articles(collection, page_size: int = 1000) -> Dict[str, StoredArticle]:
+    """Group every record in a collection under its parent article."""
+    articles: Dict[str, StoredArticle] = {}
+    offset = 0
+    while True:
+        page = collection.get(limit=page_size, offset=offset, include=["metadatas"])
+        if not page["ids"]:
+            break
+        for record_id, metadata in zip(page["ids"], page["metadatas"]):
+            metadata = metadata or {}
+            aid = metadata.get("article_id") or parent_id(record_id)
+            timestamp = metadata.get("published_ts") or metadata.get("stored_ts") or 0
+            article = articles.setdefault(aid, StoredArticle(record_topics(metadata), timestamp))
+            article.record_ids.append(record_id)
+        offset += len(page["ids"])
+    return articles
+
+
+def vacuum(persist_dir: str, timeout: float = 30.0) -> bool:
+    """
+    Rebuild Chroma's SQLite file to return freed pages to the disk.
+
+    Only run this while no process has the store open: Chroma's writes fail
+    (disk I/O errors, a "missing" collection) when another connection
+    rebuilds the file under them. Waits up to `timeout` seconds for locks.
+
+    Returns:
+        Whether the VACUUM ran
+    """
+    path = os.path.join(persist_dir, CHROMA_SQLITE_FILE)
+    if not os.path.exists(path):
+        return False
+    try:
+        connection = sqlite3.connect(path, timeout=timeout)
+        try:
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        print(f"⚠️  VACUUM of {path} skipped: {e}")
+        return False
+    return True
+
+
+def compact(store=None, policy: Optional[RetentionPolicy] = None, dry_run: bool = False,
+            vacuum_chroma: bool = False) -> CompactionReport:
+    """
+    Evict articles outside the retention policy, then VACUUM the BM25 index.
+
+    Args:
+        store: VectorStore to compact (defaults to the shared one)
+        policy: Limits to apply (defaults to RetentionPolicy.from_config())
+        dry_run: Only report what would be evicted
+        vacuum_chroma: Also VACUUM Chroma's SQLite file; offline use only (see vacuum())
+
+    Returns:
+        CompactionReport with counts and disk size before and after
+    """
+    if store is None:
+        from src.rag.vector_store import vector_store
+        store = vector_store.get()
+    policy = policy or RetentionPolicy.from_config()
+
+    start = time.perf_counter()
+    bytes_before = directory_size(Config.CHROMA_PERSIST_DIR)
+    articles = scan_articles(store.collection)
+    records_before = sum(len(article.record_ids) for article in articles.values())
+    evictions = policy.select_evictions(articles, time.time())
+
+    evicted: Dict[str, int] = {}
+    for reason in evictions.values():
+        evicted[reason] = evicted.get(reason, 0) + 1
+
+    vacuumed = False
+    if not dry_run and evictions:
+        store.delete([record_id for aid in evictions for record_id in articles[aid].record_ids])
+        store.bm25.vacuum()
+        if vacuum_chroma:
+            vacuumed = vacuum(Config.CHROMA_PERSIST_DIR)
+
+    records_evicted = sum(len(articles[aid].record_ids) for aid in evictions)
+    return CompactionReport(
+        articles_before=len(articles),
+        articles_after=len(articles) - len(evictions),
+        records_before=records_before,
+        records_after=records_before - records_evicted,
+        evicted=evicted,
+        bytes_before=bytes_before,
+        bytes_after=bytes_before if dry_run else directory_size(Config.CHROMA_PERSIST_DIR),
+        vacuumed=vacuumed,
+        elapsed_seconds=time.perf_counter() - start
+    )
+
+
+def print_report(report: CompactionReport, dry_run: bool = False) -> None:
+    """Print evictions and the size change of a compaction pass."""
+    reasons = ", ".join(f"{count:,} by {reason}" for reason, count in report.evicted.items()) or "none"
+    verb = "Would evict" if dry_run else "Evicted"
+    print(f"🧹 {verb} {report.evicted_articles:,} articles ({reasons}): "
+          f"{report.articles_before:,} → {report.articles_after:,} articles, "
+          f"{report.records_before:,} → {report.records_after:,} passages")
+    if not dry_run:
+        print(f"💾 Store size: {report.bytes_before / 1e6:.1f} MB → {report.bytes_after / 1e6:.1f} MB "
+              f"in {report.elapsed_seconds:.1f}s")
+
+
+class RetentionJob:
+    """
+    Runs compact() on a daemon thread every Config.RETENTION_INTERVAL_SECONDS,
+    keeping the store's size and query latency bounded on long-running
+    processes. Chroma's file is not VACUUMed here: writers share the store.
+    """
+
+    def __init__(self, interval_seconds: float = None, policy: Optional[RetentionPolicy] = None):
+        """
+        Args:
+            interval_seconds: Seconds between passes (defaults to Config.RETENTION_INTERVAL_SECONDS; 0 disables)
+            policy: Limits to apply (defaults to RetentionPolicy.from_config())
+        """
+        self.interval_seconds = Config.RETENTION_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        self.policy = policy or RetentionPolicy.from_config()
+        self.last_report: Optional[CompactionReport] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """
+        Start the background job; the first pass runs immediately.
+
+        Returns:
+            Whether a new job was started (False if disabled or already running)
+        """
+        with self._lock:
+            if self.interval_seconds <= 0 or (self._thread and self._thread.is_alive()):
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="vector-retention", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the job after the pass in progress, if any."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self) -> CompactionReport:
+        """Run one retention + compaction pass now."""
+        self.last_report = compact(policy=self.policy)
+        return self.last_report
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                report = self.run_once()
+                if report.evicted_articles:
+                    print_report(report)
+            except Exception as e:
+                # A failed pass is retried on the next interval
+                print(f"❌ Vector-store retention pass failed: {e}")
+            self._stop.wait(self.interval_seconds)
+
+
+# Shared job, built on first use
+retention_job = LazyProvider("retention_job", RetentionJob)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Evict stale articles and compact the vector store.")
+    parser.add_argument("--dry-run", action="store_true", help="Report evictions without deleting")
+    parser.add_argument("--max-age-days", type=float, default=Config.RETENTION_MAX_AGE_DAYS)
+    parser.add_argument("--max-articles", type=int, default=Config.RETENTION_MAX_ARTICLES)
+    parser.add_argument("--max-per-topic", type=int, default=Config.RETENTION_MAX_PER_TOPIC)
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(Config.CHROMA_PERSIST_DIR):
+        print(f"❌ No vector store at {Config.CHROMA_PERSIST_DIR}")
+        return 1
+
+    policy = RetentionPolicy(args.max_age_days, args.max_articles, args.max_per_topic)
+    # The CLI is the offline path: stop apps and batch runs using the store first
+    print_report(compact(policy=policy, dry_run=args.dry_run, vacuum_chroma=True), dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Semantic topic cache.
+Reuses recent research for near-duplicate topics ("EU AI Act news" vs
+"AI regulation in the EU") by embedding each researched topic in ChromaDB.
+"""
+
+import time
+from typing import Optional
+from src.config import Config
+from src.providers import LazyProvider
+from src.rag.vector_store import vector_store
+from src.state import ResearchResults
+from src.utils.cache import make_cache_key
+
+
+class TopicCache:
+    """
+    Embedding index of recently researched topics.
+
+    A lookup returns stored ResearchResults when the closest recent topic is
+    within Config.TOPIC_CACHE_MAX_DISTANCE (cosine distance) and younger than
+    Config.TOPIC_CACHE_FRESHNESS_SECONDS. Each entry holds a full research
+    payload, so expired entries are deleted on every store and the newest
+    Config.TOPIC_CACHE_MAX_ENTRIES are kept.
+    """
+
+    COLLECTION_NAME = "research_topics"
+
+    def __init__(self, client=None):
+        """
+        Initialize the topic collection.
+
+        Args:
+            client: ChromaDB client; defaults to the shared vector store's client
+        """
+        self.client = client if client is not None else vector_store.get().client
+        self.collection = self.client.get_or_create_collection(
+            name=self.COLLECTION_NAME,
+            metadata={
+                "description": "Recently researched topics for The Daily AI",
+                "hnsw:space": "cosine"
+            }
+        )
+
+    def lookup(self, topic: str) -> Optional[dict]:
+        """
+        Find fresh research for a semantically similar topic.
+
+        Args:
+            topic: The topic about to be researched
+
+        Returns:
+            Dict with research, matched_topic, similarity and age_seconds,
+            or None if no recent topic is close enough
+        """
+        now = time.time()
+        results = self.collection.query(
+            query_texts=[topic],
+            n_results=1,
+            where={"created_at": {"$gte": now - Config.TOPIC_CACHE_FRESHNESS_SECONDS}}
+        )
+
+        if not results["ids"] or not results["ids"][0]:
+            print("🧭 Topic cache miss: no recent topics")
+            return None
+
+        metadata = results["metadatas"][0][0]
+        distance = results["distances"][0][0]
+        similarity = 1.0 - distance
+        matched_topic = results["documents"][0][0]
+        threshold = 1.0 - Config.TOPIC_CACHE_MAX_DISTANCE
+
+        if distance > Config.TOPIC_CACHE_MAX_DISTANCE:
+            print(f"🧭 Topic cache miss: closest '{matched_topic}' "
+                  f"similarity {similarity:.3f} < {threshold:.3f}")
+            return None
+
+        print(f"🧭 Topic cache hit: '{topic}' ≈ '{matched_topic}' "
+              f"similarity {similarity:.3f} >= {threshold:.3f}")
+
+        return {
+            "research": ResearchResults.model_validate_json(metadata["research_json"]),
+            "matched_topic": matched_topic,
+            "similarity": similarity,
+            "age_seconds": now - metadata["created_at"]
+        }
+
+    def store(self, topic: str, research: ResearchResults) -> None:
+        """
+        Remember research for a topic, replacing any earlier entry.
+
+        Args:
+            topic: The researched topic
+            research: Research results to reuse for similar topics
+        """
+        now = time.time()
+        normalized_topic = " ".join(topic.lower().split())
+        self.collection.upsert(
+            ids=[make_cache_key("topic", normalized_topic)],
+            documents=[topic],
+            metadatas=[{
+                "created_at": now,
+                "research_json": research.model_dump_json()
+            }]
+        )
+        self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Delete expired entries, then the oldest beyond Config.TOPIC_CACHE_MAX_ENTRIES.
+
+        Returns:
+            Number of entries left
+        """
+        now = time.time() if now is None else now
+        self.collection.delete(where={"created_at": {"$lt": now - Config.TOPIC_CACHE_FRESHNESS_SECONDS}})
+
+        count = self.collection.count()
+        excess = count - Config.TOPIC_CACHE_MAX_ENTRIES
+        if Config.TOPIC_CACHE_MAX_ENTRIES and excess > 0:
+            entries = self.collection.get(include=["metadatas"])
+            by_age = sorted(zip(entries["ids"], entries["metadatas"]),
+                            key=lambda entry: (entry[1] or {}).get("created_at", 0))
+            self.collection.delete(ids=[entry_id for entry_id, _ in by_age[:excess]])
+            count -= excess
+        return count
+
+    def get_stats(self) -> dict:
+        """Get statistics about the topic cache."""
+        return {
+            "total_topics": self.collection.count(),
+            "collection_name": self.COLLECTION_NAME
+        }
+
+
+# Shared instance, built on first use
+topic_cache = LazyProvider("topic_cache", TopicCache)
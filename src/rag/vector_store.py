@@ -1,13 +1,110 @@
 """
 Vector store implementation using ChromaDB.
 This demonstrates SEMANTIC SEARCH and RAG - key MAT496 topics.
+
+Articles are stored as sentence-aware passages ("{article_id}#{n}") that
+carry their parent article's metadata, so retrieval returns only the
+relevant parts of long pieces.
+
+Retrieval is filtered on the stored topics, source and publication time
+(Chroma indexes metadata, so filters shrink the search before ranking), and
+recent stories are preferred through time-decay scoring. A BM25 inverted
+index is maintained on every write, and hybrid retrieval fuses its ranking
+with the dense one so exact names and numbers are not lost.
 """
 
-import chromadb
-from chromadb.config import Settings
-from typing import List, Optional
+import hashlib
+import os
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Sequence, Tuple
 from src.config import Config
+from src.providers import LazyProvider
+from src.rag.bm25 import BM25Index, reciprocal_rank_fusion
+from src.rag.chunking import chunk_text, passage_id, record_topics, topic_flag
 from src.state import NewsArticle
+from src.utils.dedup import canonicalize_url
+
+
+def article_id(url: str, document: str = "") -> str:
+    """
+    Stable, content-addressed ID for a stored article.
+    
+    The sha256 of the canonical URL, so the same story re-fetched in another
+    run (or under another topic) maps to the same record. Articles without a
+    URL are keyed on their document text.
+    """
+    key = canonicalize_url(url) if url else f"doc:{document}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def content_hash(document: str) -> str:
+    """sha256 of a stored document, to skip re-writing unchanged articles."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def published_timestamp(published_date: Optional[str]) -> int:
+    """
+    Unix timestamp of a publication date, or 0 when missing or unparseable.
+    
+    Accepts ISO 8601 ("2025-01-15", "2025-01-15T09:30:00Z") and RFC 2822
+    ("Wed, 15 Jan 2025 09:30:00 GMT"); dates without a timezone are UTC.
+    """
+    if not published_date or published_date == "unknown":
+        return 0
+    value = published_date.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def build_where(topic: Optional[str] = None, source: Optional[str] = None,
+                since: Optional[int] = None) -> Optional[dict]:
+    """
+    Chroma metadata filter for topic, source and a minimum publication time.
+    
+    An article matches every topic it was stored under. Articles with no
+    known date are matched on when they were stored.
+    """
+    conditions = []
+    if topic:
+        # Records written before topic flags carry only their "topic" field
+        conditions.append({"$or": [{topic_flag(topic): True}, {"topic": topic}]})
+    if source:
+        conditions.append({"source": source})
+    if since:
+        conditions.append({"$or": [
+            {"published_ts": {"$gte": since}},
+            {"$and": [{"published_ts": 0}, {"stored_ts": {"$gte": since}}]}
+        ]})
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def recency_weight(metadata: dict, now: float, half_life_days: float) -> float:
+    """Exponential time decay: 1.0 for a story published now, 0.5 one half-life ago."""
+    if half_life_days <= 0:
+        return 1.0
+    timestamp = metadata.get("published_ts") or metadata.get("stored_ts")
+    if not timestamp:
+        return 1.0
+    age_days = max(0.0, now - timestamp) / 86400
+    return 0.5 ** (age_days / half_life_days)
+
+
+def _add_topics(metadata: dict, topics: Sequence[str]) -> dict:
+    """Mark a record's metadata as stored under extra topics (in place)."""
+    metadata.update({topic_flag(topic): True for topic in topics})
+    return metadata
 
 
 class VectorStore:
@@ -18,6 +115,9 @@ class VectorStore:
     
     def __init__(self):
         """Initialize ChromaDB client and collection."""
+        import chromadb
+        from chromadb.config import Settings
+
         self.client = chromadb.PersistentClient(
             path=Config.CHROMA_PERSIST_DIR,
             settings=Settings(
@@ -31,107 +131,346 @@ class VectorStore:
             name=Config.COLLECTION_NAME,
             metadata={"description": "News articles for The Daily AI"}
         )
+        
+        # Largest batch one Chroma call accepts
+        self.max_batch_size = self.client.get_max_batch_size()
+        
+        # Lexical index over the same records; rebuilt in full only when it
+        # cannot be trusted (a store written before the index existed, or an
+        # index without topic membership)
+        self.bm25 = BM25Index(os.path.join(Config.CHROMA_PERSIST_DIR, f"bm25_{Config.COLLECTION_NAME}.sqlite3"))
+        record_count = self.collection.count()
+        indexed_count = len(self.bm25)
+        if self.bm25.needs_rebuild or (record_count and not indexed_count):
+            print(f"🔤 Rebuilding BM25 index from {record_count:,} records...")
+            self.bm25.rebuild(self.collection)
+        elif indexed_count != record_count:
+            # A BM25 write that failed after its Chroma write: re-index only the difference
+            indexed, dropped = self.bm25.sync(self.collection)
+            print(f"⚠️  BM25 index drifted from the store ({indexed_count:,} vs {record_count:,} records): "
+                  f"indexed {indexed:,} missing, dropped {dropped:,} stale")
+        
+        # Content-hash embedding cache so repeated articles are embedded once
+        self.embedding_cache = None
+        if Config.EMBEDDING_CACHE_ENABLED:
+            from src.rag.embedding_cache import EmbeddingCache
+            self.embedding_cache = EmbeddingCache()
     
-    def add_articles(self, articles: List[NewsArticle], topic: str) -> None:
+    def add_articles(self, articles: List[NewsArticle], topic: str) -> int:
         """
-        Add news articles to the vector store.
+        Add news articles to the vector store, or update them in place.
+        
+        Records are keyed by article_id() and upserted, so repeat topics and
+        restarts never duplicate an article; unchanged articles are skipped
+        without re-embedding. Topics add up: an article stored under another
+        topic stays retrievable under the earlier ones.
         
         Args:
             articles: List of NewsArticle objects to store
             topic: The topic these articles are related to
+            
+        Returns:
+            Number of records written
         """
-        if not articles:
-            return
+        return self.add_batch([(article, topic) for article in articles])
+    
+    def add_batch(self, items: Sequence[Tuple[NewsArticle, str]]) -> int:
+        """
+        Upsert (article, topic) pairs, split to respect Chroma's batch limit.
         
-        documents = []
-        metadatas = []
-        ids = []
+        Returns:
+            Number of articles written or added to a new topic (unchanged articles are skipped)
+        """
+        batch_size = min(Config.INGEST_BATCH_SIZE, self.max_batch_size)
+        return sum(
+            self._upsert(items[start:start + batch_size])
+            for start in range(0, len(items), batch_size)
+        )
+    
+    def _upsert(self, items: Sequence[Tuple[NewsArticle, str]]) -> int:
+        """Chunk and upsert one batch of articles."""
+        if not items:
+            return 0
         
-        for idx, article in enumerate(articles):
-            # Create document text
+        stored_ts = int(time.time())
+        articles = {}
+        for article, topic in items:
+            # Create document text; the hash covers everything a passage is built from
             doc_text = f"Title: {article.title}\n\nContent: {article.content}"
-            documents.append(doc_text)
             
-            # Create metadata
+            # Parent metadata, repeated on every passage
             metadata = {
+                "article_id": article_id(article.url, doc_text),
                 "title": article.title,
                 "url": article.url,
+                "canonical_url": canonicalize_url(article.url) if article.url else "",
+                "content_hash": content_hash(doc_text),
+                # Latest topic; membership is the topic_flag() keys
                 "topic": topic,
+                topic_flag(topic): True,
                 "source": article.source or "unknown",
-                "published_date": article.published_date or "unknown"
+                "published_date": article.published_date or "",
+                # Sortable timestamps for date filters; 0 when the date is unknown
+                "published_ts": published_timestamp(article.published_date),
+                "stored_ts": stored_ts
             }
-            metadatas.append(metadata)
             
-            # Create unique ID
-            ids.append(f"{topic}_{idx}_{hash(article.url)}")
-        
-        # Add to collection
-        self.collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+            # Same canonical URL twice in one batch: the later copy wins, under both topics
+            earlier = articles.get(metadata["article_id"])
+            if earlier is not None:
+                _add_topics(metadata, record_topics(earlier[1]))
+            articles[metadata["article_id"]] = (article, metadata)
+        
+        # The first passage holds the parent's hash, passage count and topics.
+        # Unchanged articles are skipped, or only tagged when the topic is new
+        stale, retagged = [], []
+        existing = self.collection.get(ids=[passage_id(aid, 0) for aid in articles], include=["metadatas"])
+        for stored in existing["metadatas"] or []:
+            stored = stored or {}
+            aid = stored.get("article_id")
+            if aid not in articles:
+                continue
+            metadata = articles[aid][1]
+            new_topics = [topic for topic in record_topics(metadata) if topic not in record_topics(stored)]
+            if stored.get("content_hash") == metadata["content_hash"]:
+                del articles[aid]
+                if new_topics:
+                    retagged.append((aid, stored.get("passage_count", 1), metadata["topic"], new_topics))
+            else:
+                _add_topics(metadata, record_topics(stored))
+                stale.append((aid, stored.get("passage_count", 0)))
+        
+        if retagged:
+            self._add_topics(retagged)
+        if not articles:
+            return len(retagged)
+        
+        ids, documents, metadatas = [], [], []
+        for aid, (article, metadata) in articles.items():
+            passages = chunk_text(article.content) or chunk_text(article.title)
+            for passage in passages:
+                ids.append(passage_id(aid, passage.index))
+                # The title is embedded with every passage so each one is self-describing
+                documents.append(f"{article.title}\n\n{passage.text}")
+                metadatas.append({**metadata, "passage_index": passage.index,
+                                  "passage_count": len(passages)})
+            articles[aid] = len(passages)
+        
+        # Embed through the cache when enabled; otherwise Chroma embeds
+        embeddings = None
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.embed(documents)
+        
+        # Upsert: a new version of an article replaces its passages
+        for start in range(0, len(ids), self.max_batch_size):
+            end = start + self.max_batch_size
+            self.collection.upsert(
+                documents=documents[start:end],
+                embeddings=embeddings[start:end] if embeddings is not None else None,
+                metadatas=metadatas[start:end],
+                ids=ids[start:end]
+            )
+        
+        self.bm25.add(ids, documents, metadatas)
+        
+        # A shorter new version leaves old trailing passages behind
+        leftover = [passage_id(aid, index) for aid, old_count in stale
+                    for index in range(articles[aid], old_count)]
+        if leftover:
+            self.delete(leftover)
+        
+        return len(articles) + len(retagged)
+    
+    def _add_topics(self, retagged: Sequence[Tuple[str, int, str, List[str]]]) -> None:
+        """Add topics to stored articles' passages without re-embedding them."""
+        ids, metadatas = [], []
+        for aid, passage_count, latest, topics in retagged:
+            update = _add_topics({"topic": latest}, topics)
+            for index in range(passage_count):
+                ids.append(passage_id(aid, index))
+                metadatas.append(update)
+        # Chroma merges updated keys into the stored metadata
+        for start in range(0, len(ids), self.max_batch_size):
+            end = start + self.max_batch_size
+            self.collection.update(ids=ids[start:end], metadatas=metadatas[start:end])
+        self.bm25.add_topics(ids, metadatas)
     
-    def semantic_search(self, query: str, n_results: int = 3) -> List[dict]:
+    def delete(self, ids: Sequence[str]) -> None:
+        """Delete records from the collection and the BM25 index."""
+        for start in range(0, len(ids), self.max_batch_size):
+            batch = list(ids[start:start + self.max_batch_size])
+            self.collection.delete(ids=batch)
+            self.bm25.remove(batch)
+    
+    def semantic_search(self, query: str, n_results: int = 3,
+                        where: Optional[dict] = None) -> List[dict]:
         """
-        Perform semantic search to find relevant articles.
+        Perform semantic search to find relevant passages.
         This demonstrates SEMANTIC SEARCH capability.
         
         Args:
             query: Search query
-            n_results: Number of results to return
+            n_results: Number of passages to return
+            where: Optional metadata filter (see build_where)
             
         Returns:
-            List of relevant documents with metadata
+            List of relevant passages with their parent article's metadata
         """
         results = self.collection.query(
             query_texts=[query],
-            n_results=n_results
+            n_results=n_results,
+            where=where
         )
         
         # Format results
         formatted_results = []
         if results["documents"] and results["documents"][0]:
             for idx, doc in enumerate(results["documents"][0]):
+                metadata = results["metadatas"][0][idx] if results["metadatas"] else {}
                 result = {
-                    "content": doc,
-                    "metadata": results["metadatas"][0][idx] if results["metadatas"] else {},
+                    "id": results["ids"][0][idx],
+                    "content": self._passage_text(doc, metadata),
+                    "metadata": metadata,
                     "distance": results["distances"][0][idx] if results["distances"] else None
                 }
                 formatted_results.append(result)
         
         return formatted_results
     
+    @staticmethod
+    def _passage_text(document: str, metadata: dict) -> str:
+        """Drop the title a passage was embedded with."""
+        if "passage_index" in metadata:
+            return document.split("\n\n", 1)[-1]
+        return document
+    
+    def hybrid_search(self, query: str, n_results: int = 5, topic: Optional[str] = None,
+                      source: Optional[str] = None, since: Optional[int] = None) -> List[dict]:
+        """
+        Fuse BM25 and dense rankings with reciprocal rank fusion.
+        
+        Args:
+            query: Search query
+            n_results: Number of passages to return
+            topic: Only passages stored under this topic
+            source: Only passages from this source
+            since: Only stories published (or, if undated, stored) at or after this unix time
+            
+        Returns:
+            Passages like semantic_search, best first, each with an RRF "score"
+            ("distance" is None for passages only BM25 found)
+        """
+        # Each ranking goes deeper than the final cut so fusion has overlap to work with
+        depth = n_results * max(1, Config.RETRIEVAL_OVERFETCH)
+        dense = self.semantic_search(query, depth, build_where(topic, source, since))
+        lexical = self.bm25.search(query, depth, topic=topic, source=source, since=since)
+        
+        fused = reciprocal_rank_fusion(
+            [[result["id"] for result in dense], [doc_id for doc_id, _ in lexical]],
+            k=Config.HYBRID_RRF_K
+        )[:n_results]
+        
+        # Fetch passages only the lexical side found
+        by_id = {result["id"]: result for result in dense}
+        missing = [doc_id for doc_id, _ in fused if doc_id not in by_id]
+        if missing:
+            records = self.collection.get(ids=missing, include=["documents", "metadatas"])
+            for doc_id, doc, metadata in zip(records["ids"], records["documents"], records["metadatas"]):
+                metadata = metadata or {}
+                by_id[doc_id] = {"id": doc_id, "content": self._passage_text(doc, metadata),
+                                 "metadata": metadata, "distance": None}
+        
+        results = []
+        for doc_id, score in fused:
+            if doc_id in by_id:
+                results.append({**by_id[doc_id], "score": score})
+        return results
+    
+    def search_recent(self, query: str, n_results: int = 5, topic: Optional[str] = None,
+                      source: Optional[str] = None, recency_days: Optional[float] = None) -> List[dict]:
+        """
+        Filtered search, re-ranked by relevance times recency.
+        
+        Relevance is the hybrid RRF score, or similarity alone when
+        Config.RETRIEVAL_MODE is "dense".
+        
+        Args:
+            query: Search query
+            n_results: Number of passages to return
+            topic: Only passages stored under this topic
+            source: Only passages from this source
+            recency_days: Only stories from the last N days
+                (defaults to Config.RETRIEVAL_RECENCY_DAYS; 0 disables)
+            
+        Returns:
+            Passages ordered by decayed score, each with a "score" key
+        """
+        if recency_days is None:
+            recency_days = Config.RETRIEVAL_RECENCY_DAYS
+        now = time.time()
+        since = int(now - recency_days * 86400) if recency_days else None
+        
+        # Over-fetch so time decay can promote a slightly less relevant, newer passage
+        candidates = n_results * max(1, Config.RETRIEVAL_OVERFETCH)
+        if Config.RETRIEVAL_MODE == "hybrid":
+            results = self.hybrid_search(query, candidates, topic, source, since)
+        else:
+            results = self.semantic_search(query, candidates, build_where(topic, source, since))
+            for result in results:
+                # Chroma's default distance is squared L2; map it to a (0, 1] similarity
+                result["score"] = 1.0 / (1.0 + (result["distance"] or 0.0))
+        
+        for result in results:
+            result["score"] *= recency_weight(result["metadata"], now, Config.RETRIEVAL_HALF_LIFE_DAYS)
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:n_results]
+    
     def get_context_for_topic(self, topic: str, query: Optional[str] = None, 
-                             n_results: int = 5) -> str:
+                             n_results: int = 5, source: Optional[str] = None) -> str:
         """
         Get relevant context for a topic to augment generation (RAG).
         This demonstrates RAG (Retrieval Augmented Generation).
         
+        Only passages stored under the topic and published within
+        Config.RETRIEVAL_RECENCY_DAYS are searched, newer ones weighted up.
+        The retrieved passages are grouped under their parent article (best
+        match first, passages in reading order).
+        
         Args:
             topic: The topic to get context for
             query: Optional specific query to refine search
-            n_results: Number of results to retrieve
+            n_results: Number of passages to retrieve
+            source: Optional source to restrict retrieval to
             
         Returns:
             Formatted context string
         """
+        from src.utils.context_packer import count_tokens
+        
         search_query = query if query else topic
-        results = self.semantic_search(search_query, n_results)
+        results = self.search_recent(search_query, n_results, topic=topic, source=source)
         
         if not results:
+            print(f"📭 No recent passages stored for '{topic}'")
             return ""
         
+        # Group passages by parent article, keeping rank order of first appearance
+        sources = {}
+        for result in results:
+            metadata = result["metadata"]
+            parent = metadata.get("article_id") or metadata.get("url") or result["content"]
+            sources.setdefault(parent, (metadata, []))[1].append(result)
+        
         # Format context
         context_parts = []
-        for idx, result in enumerate(results, 1):
-            metadata = result["metadata"]
-            content = result["content"]
+        for idx, (metadata, passages) in enumerate(sources.values(), 1):
+            passages.sort(key=lambda result: result["metadata"].get("passage_index", 0))
+            content = "\n[...]\n".join(result["content"] for result in passages)
             
             context_part = f"""
 Source {idx}: {metadata.get('title', 'Unknown')}
 URL: {metadata.get('url', 'N/A')}
-Published: {metadata.get('published_date', 'Unknown')}
+Published: {metadata.get('published_date') or 'Unknown'}
 
 {content}
 
@@ -139,7 +478,10 @@ Published: {metadata.get('published_date', 'Unknown')}
 """
             context_parts.append(context_part)
         
-        return "\n".join(context_parts)
+        context = "\n".join(context_parts)
+        print(f"📚 Retrieved {len(results)} passages from {len(sources)} articles "
+              f"({count_tokens(context):,} tokens)")
+        return context
     
     def clear_collection(self) -> None:
         """Clear all documents from the collection."""
@@ -148,15 +490,20 @@ Published: {metadata.get('published_date', 'Unknown')}
             name=Config.COLLECTION_NAME,
             metadata={"description": "News articles for The Daily AI"}
         )
+        self.bm25.clear()
     
     def get_stats(self) -> dict:
         """Get statistics about the vector store."""
         count = self.collection.count()
-        return {
+        stats = {
             "total_documents": count,
+            "lexical_documents": len(self.bm25),
             "collection_name": Config.COLLECTION_NAME
         }
+        if self.embedding_cache is not None:
+            stats["embeddings"] = self.embedding_cache.stats()
+        return stats
 
 
-# Singleton instance
-vector_store = VectorStore()
+# Shared instance, built on first use
+vector_store = LazyProvider("vector_store", VectorStore)
@@ -3,9 +3,10 @@ State definitions for The Daily AI using Pydantic.
 This demonstrates STRUCTURED OUTPUT - one of the key MAT496 topics.
 """
 
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
+from src.config import Config
 
 
 class NewsArticle(BaseModel):
@@ -15,6 +16,10 @@ class NewsArticle(BaseModel):
     content: str
     published_date: Optional[str] = None
     source: Optional[str] = None
+    alternate_urls: List[str] = Field(
+        default_factory=list,
+        description="URLs of duplicate copies of this story, kept for attribution"
+    )
 
 
 class ResearchResults(BaseModel):
@@ -25,6 +30,12 @@ class ResearchResults(BaseModel):
     summary: str = Field(description="Brief summary of findings")
 
 
+class ResearchFindings(BaseModel):
+    """What the Researcher agent's LLM call extracts from the search results."""
+    key_facts: List[str] = Field(description="Key facts extracted from articles, one short sentence each")
+    summary: str = Field(description="Brief 2-3 sentence summary of findings")
+
+
 class EditorialAngle(BaseModel):
     """Structured output from the Editor agent."""
     angle: str = Field(description="The chosen editorial angle/hook for the story")
@@ -33,6 +44,23 @@ class EditorialAngle(BaseModel):
     key_points: List[str] = Field(description="Key points to emphasize")
 
 
+class ResearchBrief(BaseModel):
+    """Fast-mode output: research findings and editorial angle from one LLM call."""
+    key_facts: List[str] = Field(description="Key facts extracted from articles, one short sentence each")
+    summary: str = Field(description="Brief 2-3 sentence summary of findings")
+    angle: str = Field(description="The chosen editorial angle/hook for the story")
+    reasoning: str = Field(description="Why this angle is interesting")
+    target_tone: str = Field(description="Suggested tone for the article")
+    key_points: List[str] = Field(description="Key points to emphasize")
+    
+    def findings(self) -> ResearchFindings:
+        return ResearchFindings(key_facts=self.key_facts, summary=self.summary)
+    
+    def editorial_angle(self) -> EditorialAngle:
+        return EditorialAngle(angle=self.angle, reasoning=self.reasoning,
+                              target_tone=self.target_tone, key_points=self.key_points)
+
+
 class GeneratedContent(BaseModel):
     """Structured output from the Journalist agent."""
     title: str
@@ -44,10 +72,17 @@ class GeneratedContent(BaseModel):
 
 class FactCheckResult(BaseModel):
     """Structured output from the Fact Checker agent."""
-    is_accurate: bool
-    issues_found: List[str] = Field(default_factory=list)
-    suggestions: List[str] = Field(default_factory=list)
-    confidence_score: float = Field(ge=0.0, le=1.0)
+    is_accurate: bool = Field(description="Whether the content matches the source material")
+    issues_found: List[str] = Field(default_factory=list, description="Specific factual problems, if any")
+    suggestions: List[str] = Field(default_factory=list, description="Concrete fixes for the issues")
+    confidence_score: float = Field(ge=0.0, le=1.0, description="Confidence in the verdict, 0.0 to 1.0")
+
+
+class ParagraphCheck(BaseModel):
+    """Fact-check of one paragraph, made while later paragraphs were still being written."""
+    index: int = Field(description="Position of the paragraph in the article (0-based)")
+    text: str
+    result: FactCheckResult
 
 
 class NewsState(BaseModel):
@@ -61,6 +96,10 @@ class NewsState(BaseModel):
         default="blog",
         description="Desired output format"
     )
+    fast_mode: bool = Field(
+        default_factory=lambda: Config.FAST_MODE,
+        description="Extract research findings and the editorial angle in one LLM call"
+    )
     
     # Research phase
     research_results: Optional[ResearchResults] = None
@@ -73,10 +112,24 @@ class NewsState(BaseModel):
     
     # Fact-checking phase
     fact_check: Optional[FactCheckResult] = None
+    paragraph_fact_checks: List[ParagraphCheck] = Field(
+        default_factory=list,
+        description="Per-paragraph checks from streaming generation (empty when not streaming)"
+    )
+    
+    # Refinement phase
+    refinement_context: Optional[str] = Field(
+        default=None,
+        description="Context retrieved from the vector store for the next revision"
+    )
     
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now)
     iteration_count: int = Field(default=0, description="Number of refinement iterations")
+    limiter_wait_seconds: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Time each node spent waiting on provider rate limiters"
+    )
     
     # Control flow
     needs_refinement: bool = Field(default=False)
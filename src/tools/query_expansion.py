@@ -0,0 +1,68 @@
+"""
+Query expansion for multi-query research.
+Derives several sub-queries from a topic so one research pass covers the
+story from more angles than a single search can.
+"""
+
+import re
+from datetime import datetime
+from typing import List
+
+# Capitalized phrases ("European Union", "OpenAI") and acronyms ("EU", "AI")
+ENTITY_PATTERN = re.compile(r"\b(?:[A-Z][\w&.-]*)(?:\s+[A-Z][\w&.-]*)*\b")
+
+# Words that start a title-cased topic but are not entities on their own
+STOPWORDS = {"Latest", "News", "New", "The", "A", "An", "In", "On", "Of", "And", "Today"}
+
+
+def extract_entities(topic: str) -> List[str]:
+    """
+    Extract capitalized names and acronyms from a topic.
+
+    Returns:
+        Distinct entities in order of appearance
+    """
+    entities = []
+    for match in ENTITY_PATTERN.findall(topic):
+        words = [word for word in match.split() if word not in STOPWORDS]
+        entity = " ".join(words)
+        if entity and entity.lower() != topic.lower() and entity not in entities:
+            entities.append(entity)
+    return entities
+
+
+def expand_queries(topic: str, max_queries: int = 4) -> List[str]:
+    """
+    Derive sub-queries for a topic without an extra LLM round trip.
+
+    The original topic always comes first, followed by a time-bounded query,
+    an opposing-viewpoints query and an entity-focused query.
+
+    Args:
+        topic: The news topic
+        max_queries: Maximum number of queries to return (including the topic)
+
+    Returns:
+        Distinct queries, most important first
+    """
+    month = datetime.now().strftime("%B %Y")
+
+    candidates = [
+        topic,
+        f"{topic} {month}",
+        f"{topic} criticism concerns opposing views",
+    ]
+    entities = extract_entities(topic)
+    if entities:
+        candidates.append(f"{' '.join(entities)} latest news")
+    candidates.append(f"{topic} analysis impact")
+
+    queries = []
+    seen = set()
+    for query in candidates:
+        key = " ".join(query.lower().split())
+        if key not in seen:
+            seen.add(key)
+            queries.append(query)
+
+    return queries[:max(1, max_queries)]
@@ -3,10 +3,23 @@ Tavily search tool integration.
 This demonstrates TOOL CALLING - one of the key MAT496 topics.
 """
 
-from typing import List
-from tavily import TavilyClient
+import asyncio
+import contextvars
+import json
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
 from src.config import Config
+from src.providers import LazyProvider
 from src.state import NewsArticle
+from src.utils.cache import SQLiteCache, make_cache_key
+from src.utils.concurrency import aprovider_slot, provider_slot
+from src.utils.rate_limiter import acall_with_retry, call_with_retry
+
+
+class SearchError(Exception):
+    """The search provider failed (after retries), as opposed to finding nothing."""
 
 
 class TavilySearchTool:
@@ -14,7 +27,26 @@ class TavilySearchTool:
     
     def __init__(self):
         """Initialize the Tavily client."""
+        from tavily import TavilyClient
+
+        Config.validate()
         self.client = TavilyClient(api_key=Config.TAVILY_API_KEY)
+        self._async_clients = weakref.WeakKeyDictionary()
+        
+        # Persistent response cache shared by every run on this machine
+        self.cache: Optional[SQLiteCache] = None
+        if Config.SEARCH_CACHE_ENABLED:
+            self.cache = SQLiteCache(
+                os.path.join(Config.CACHE_DIR, "search_cache.sqlite"),
+                ttl_seconds=Config.SEARCH_CACHE_TTL_SECONDS,
+                max_entries=Config.SEARCH_CACHE_MAX_ENTRIES
+            )
+    
+    @staticmethod
+    def _cache_key(query: str, max_results: int, topic: str, search_depth: str) -> str:
+        """Build the cache key from the normalized query and search options."""
+        normalized_query = " ".join(query.lower().split())
+        return make_cache_key("tavily.search", normalized_query, max_results, topic, search_depth)
     
     def search_news(self, query: str, max_results: int = None) -> List[NewsArticle]:
         """
@@ -25,39 +57,201 @@ class TavilySearchTool:
             max_results: Maximum number of results to return
             
         Returns:
-            List of NewsArticle objects
+            List of NewsArticle objects (empty when nothing matched)
+            
+        Raises:
+            SearchError: Tavily failed and retries were exhausted
         """
-        if max_results is None:
-            max_results = Config.MAX_SEARCH_RESULTS
+        cache_key, params = self._prepare_search(query, max_results)
         
-        try:
+        results = self._cached_results(cache_key, query)
+        
+        if results is None:
             # Perform search with Tavily
-            response = self.client.search(
-                query=query,
-                search_depth="advanced",
-                max_results=max_results,
-                include_domains=[],
-                exclude_domains=[],
-                topic="news"  # Focus on news content
-            )
+            try:
+                with provider_slot("tavily"):
+                    response = call_with_retry("tavily", lambda: self.client.search(**params))
+            except Exception as e:
+                print(f"Error searching with Tavily: {e}")
+                raise SearchError(f"Tavily search failed for '{query}': {e}") from e
+            results = response.get("results", [])
+            self._remember(cache_key, results)
+        
+        return self._to_articles(results)
+    
+    async def asearch_news(self, query: str, max_results: int = None) -> List[NewsArticle]:
+        """
+        Async version of search_news() using Tavily's async client.
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
             
-            # Convert results to NewsArticle objects
-            articles = []
-            for result in response.get("results", []):
-                article = NewsArticle(
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    content=result.get("content", ""),
-                    published_date=result.get("published_date"),
-                    source=result.get("source")
-                )
-                articles.append(article)
+        Returns:
+            List of NewsArticle objects (empty when nothing matched)
             
-            return articles
+        Raises:
+            SearchError: Tavily failed and retries were exhausted
+        """
+        cache_key, params = self._prepare_search(query, max_results)
+        
+        results = self._cached_results(cache_key, query)
+        
+        if results is None:
+            try:
+                async with aprovider_slot("tavily"):
+                    response = await acall_with_retry(
+                        "tavily", lambda: self._get_async_client().search(**params)
+                    )
+            except Exception as e:
+                print(f"Error searching with Tavily: {e}")
+                raise SearchError(f"Tavily search failed for '{query}': {e}") from e
+            results = response.get("results", [])
+            self._remember(cache_key, results)
+        
+        return self._to_articles(results)
+    
+    def search_many(self, queries: List[str], max_results: int = None) -> List[List[NewsArticle]]:
+        """
+        Run several searches concurrently with a bounded thread pool.
+        
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
             
-        except Exception as e:
-            print(f"Error searching with Tavily: {e}")
-            return []
+        Returns:
+            Results per query, in the same order as queries (empty for a
+            query that failed while others succeeded)
+            
+        Raises:
+            SearchError: Every query failed
+        """
+        if len(queries) <= 1:
+            return [self.search_news(query, max_results) for query in queries]
+        
+        def try_search(query: str) -> Union[List[NewsArticle], SearchError]:
+            try:
+                return self.search_news(query, max_results)
+            except SearchError as e:
+                return e
+        
+        # Each worker runs in a copy of the caller's context so per-node
+        # rate-limiter accounting still sees the waits
+        contexts = [contextvars.copy_context() for _ in queries]
+        workers = min(Config.SEARCH_MAX_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(
+                lambda context, query: context.run(try_search, query),
+                contexts, queries
+            ))
+        return self._partial_results(outcomes)
+    
+    async def asearch_many(self, queries: List[str], max_results: int = None) -> List[List[NewsArticle]]:
+        """
+        Async version of search_many(), bounded by a semaphore.
+        
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
+            
+        Returns:
+            Results per query, in the same order as queries (empty for a
+            query that failed while others succeeded)
+            
+        Raises:
+            SearchError: Every query failed
+        """
+        semaphore = asyncio.Semaphore(Config.SEARCH_MAX_WORKERS)
+        
+        async def bounded_search(query: str) -> Union[List[NewsArticle], SearchError]:
+            async with semaphore:
+                try:
+                    return await self.asearch_news(query, max_results)
+                except SearchError as e:
+                    return e
+        
+        return self._partial_results(await asyncio.gather(*(bounded_search(query) for query in queries)))
+    
+    @staticmethod
+    def _partial_results(outcomes: list) -> List[List[NewsArticle]]:
+        """Keep the searches that succeeded; fail only if every one failed."""
+        failures = [outcome for outcome in outcomes if isinstance(outcome, SearchError)]
+        if failures and len(failures) == len(outcomes):
+            raise failures[0]
+        if failures:
+            print(f"⚠️  {len(failures)}/{len(outcomes)} searches failed; continuing with the rest")
+        return [[] if isinstance(outcome, SearchError) else outcome for outcome in outcomes]
+    
+    def _get_async_client(self):
+        """
+        Get the async Tavily client for the running event loop.
+        Async HTTP clients are bound to the loop they were created on.
+        """
+        from tavily import AsyncTavilyClient
+        
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncTavilyClient(api_key=Config.TAVILY_API_KEY)
+            self._async_clients[loop] = client
+        return client
+    
+    def _prepare_search(self, query: str, max_results: Optional[int]) -> tuple[str, dict]:
+        """Build the cache key and Tavily search parameters for a query."""
+        if max_results is None:
+            max_results = Config.MAX_SEARCH_RESULTS
+        
+        search_depth = "advanced"
+        topic = "news"  # Focus on news content
+        
+        params = {
+            "query": query,
+            "search_depth": search_depth,
+            "max_results": max_results,
+            "include_domains": [],
+            "exclude_domains": [],
+            "topic": topic
+        }
+        return self._cache_key(query, max_results, topic, search_depth), params
+    
+    def _cached_results(self, cache_key: str, query: str) -> Optional[list]:
+        """Return cached raw results for a search, if present."""
+        if self.cache is None:
+            return None
+        
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        print(f"⚡ Search cache hit for: {query}")
+        return json.loads(cached)
+    
+    def _remember(self, cache_key: str, results: list) -> None:
+        """Cache raw results; only successful, non-empty responses are worth remembering."""
+        if self.cache is not None and results:
+            self.cache.set(cache_key, json.dumps(results))
+    
+    @staticmethod
+    def _to_articles(results: list) -> List[NewsArticle]:
+        """Convert raw Tavily results to NewsArticle objects."""
+        articles = []
+        for result in results:
+            article = NewsArticle(
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                content=result.get("content", ""),
+                published_date=result.get("published_date"),
+                source=result.get("source")
+            )
+            articles.append(article)
+        
+        return articles
+    
+    def cache_stats(self) -> dict:
+        """Get hit/miss counters for the search response cache."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
     
     def get_context(self, query: str) -> str:
         """
@@ -81,5 +275,5 @@ class TavilySearchTool:
             return ""
 
 
-# Singleton instance
-tavily_search = TavilySearchTool()
+# Shared instance, built on first use
+tavily_search = LazyProvider("tavily_search", TavilySearchTool)
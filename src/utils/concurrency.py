@@ -0,0 +1,166 @@
+"""
+Per-provider concurrency caps.
+Bounds how many OpenAI and Tavily calls a process has in flight at once,
+so batch runs queue work instead of flooding a provider.
+"""
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Deque, Dict, Optional, Union
+from src.config import Config
+
+_limits: Dict[str, Optional[int]] = {
+    "openai": Config.OPENAI_MAX_CONCURRENCY or None,
+    "tavily": Config.TAVILY_MAX_CONCURRENCY or None,
+}
+_lock = threading.Lock()
+
+# Providers whose slot the current call chain already holds (slots are re-entrant,
+# e.g. a chat model's _generate delegating to _stream)
+_held: contextvars.ContextVar[frozenset] = contextvars.ContextVar("provider_slots_held", default=frozenset())
+
+
+class _Slots:
+    """
+    Counting semaphore shared by threads and event loops.
+
+    Waiters are served in arrival order. A thread waits on an Event; a
+    coroutine waits on a future of its own loop, so cancelling it neither
+    ties up a worker thread nor strands a slot.
+    """
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: Deque[Union[threading.Event, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def aacquire(self) -> None:
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+                    raise
+            # The slot was handed over just as the wait was cancelled: pass it on
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the longest waiter, or free it."""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                try:
+                    waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+                    return
+                except RuntimeError:
+                    continue  # the waiter's loop is closed
+            self._free += 1
+
+
+def _wake(future: asyncio.Future) -> None:
+    # A waiter cancelled after the hand-over passes the slot on itself
+    if not future.done():
+        future.set_result(None)
+
+
+_semaphores: Dict[str, _Slots] = {}
+
+
+def set_provider_limit(provider: str, limit: Optional[int]) -> None:
+    """
+    Set the maximum number of concurrent calls for a provider.
+
+    Args:
+        provider: Provider name ("openai", "tavily")
+        limit: Maximum concurrent calls; None or 0 removes the cap
+    """
+    with _lock:
+        _limits[provider] = limit or None
+        _semaphores.pop(provider, None)
+
+
+def get_provider_limit(provider: str) -> Optional[int]:
+    """Get the concurrency cap for a provider (None means uncapped)."""
+    return _limits.get(provider)
+
+
+def _get_semaphore(provider: str) -> Optional[_Slots]:
+    limit = _limits.get(provider)
+    if not limit:
+        return None
+    with _lock:
+        if provider not in _semaphores:
+            _semaphores[provider] = _Slots(limit)
+        return _semaphores[provider]
+
+
+@contextmanager
+def provider_slot(provider: str):
+    """Hold one of the provider's concurrency slots for the duration of a call."""
+    held = _held.get()
+    semaphore = None if provider in held else _get_semaphore(provider)
+    if semaphore is None:
+        yield
+        return
+
+    semaphore.acquire()
+    token = _held.set(held | {provider})
+    try:
+        yield
+    finally:
+        _held.reset(token)
+        semaphore.release()
+
+
+@asynccontextmanager
+async def aprovider_slot(provider: str):
+    """Async version of provider_slot(); waits without blocking the event loop."""
+    held = _held.get()
+    semaphore = None if provider in held else _get_semaphore(provider)
+    if semaphore is None:
+        yield
+        return
+
+    await semaphore.aacquire()
+    token = _held.set(held | {provider})
+    try:
+        yield
+    finally:
+        _held.reset(token)
+        semaphore.release()
+
+
+def detached_context() -> contextvars.Context:
+    """
+    Copy of the current context that holds no provider slots.
+
+    Run work handed to another thread (context.run) or task (context.run(asyncio.create_task, ...))
+    in it when the caller may be inside a slot, e.g. inside a streaming call:
+    the work must queue for its own slots rather than inherit the caller's.
+    """
+    context = contextvars.copy_context()
+    context.run(_held.set, frozenset())
+    return context
@@ -0,0 +1,233 @@
+"""
+Token-budgeted context packing for agent prompts.
+Fills each agent's token budget by priority and relevance: priority sections
+(key facts, summary) first, then the article passages most relevant to the
+task, so prompt size stays predictable however many articles were found.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+from src.config import Config
+from src.state import NewsArticle
+
+STOPWORDS = {
+    "the", "and", "for", "are", "but", "not", "you", "all", "any", "can", "had", "her", "was",
+    "one", "our", "out", "has", "his", "how", "its", "may", "new", "now", "see", "who", "did",
+    "this", "that", "with", "have", "from", "they", "will", "would", "there", "their", "what",
+    "about", "which", "when", "were", "been", "into", "more", "than", "also", "said", "says"
+}
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """tiktoken encoding for the configured model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(Config.OPENAI_MODEL)
+    except KeyError:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+    except Exception:
+        # The encoding file could not be downloaded (e.g. offline)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken, falling back to about four characters per token."""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def content_terms(text: str) -> set:
+    """Lowercased content words of a text (stopwords and short words removed)."""
+    return {word for word in re.findall(r"[a-z0-9]+", text.lower())
+            if len(word) > 2 and word not in STOPWORDS}
+
+
+@dataclass
+class PackedContext:
+    """A packed prompt context plus how much of the input made it in."""
+    text: str
+    tokens_in: int
+    tokens_used: int
+    passages_used: int
+    passages_total: int
+
+    @property
+    def tokens_dropped(self) -> int:
+        return max(0, self.tokens_in - self.tokens_used)
+
+
+@dataclass
+class _Passage:
+    article_index: int
+    position: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+class ContextPacker:
+    """Packs priority sections and article passages into a token budget."""
+
+    def __init__(self, budget: int, passage_tokens: int = None):
+        """
+        Args:
+            budget: Maximum tokens of context to produce
+            passage_tokens: Target passage size (defaults to Config.CONTEXT_PASSAGE_TOKENS)
+        """
+        self.budget = budget
+        self.passage_tokens = passage_tokens or Config.CONTEXT_PASSAGE_TOKENS
+
+    def pack(self, articles: Sequence[NewsArticle], query: str,
+             sections: Sequence[Tuple[str, List[str]]] = (),
+             articles_heading: Optional[str] = None) -> PackedContext:
+        """
+        Build the context.
+
+        Args:
+            articles: Candidate articles, in search-rank order
+            query: Text the passages should be relevant to
+            sections: (heading, items) pairs in priority order; items are kept
+                whole and added until the budget runs out
+            articles_heading: Optional heading above the article passages
+
+        Returns:
+            PackedContext with the text and token accounting
+        """
+        remaining = self.budget
+        tokens_in = 0
+        blocks = []
+
+        # 1. Priority sections, item by item
+        for heading, items in sections:
+            kept = []
+            cost = count_tokens(f"{heading}:\n")
+            tokens_in += cost
+            for item in items:
+                item_tokens = count_tokens(item) + 1
+                tokens_in += item_tokens
+                if cost + item_tokens <= remaining:
+                    kept.append(item)
+                    cost += item_tokens
+            if kept:
+                blocks.append(f"{heading}:\n" + "\n".join(kept))
+                remaining -= cost
+
+        # 2. Article passages, most relevant first
+        passages = self._split(articles)
+        tokens_in += sum(passage.tokens for passage in passages)
+        self._score(passages, query)
+
+        headers = {index: self._article_header(index, article) for index, article in enumerate(articles)}
+        header_tokens = {index: count_tokens(header) for index, header in headers.items()}
+        tokens_in += sum(header_tokens[index] for index in {p.article_index for p in passages})
+        if articles_heading:
+            remaining -= count_tokens(f"{articles_heading}:\n")
+            tokens_in += count_tokens(f"{articles_heading}:\n")
+
+        chosen = []
+        opened = set()
+        for passage in sorted(passages, key=lambda p: p.score, reverse=True):
+            cost = passage.tokens + (0 if passage.article_index in opened else header_tokens[passage.article_index])
+            if cost > remaining:
+                continue
+            chosen.append(passage)
+            opened.add(passage.article_index)
+            remaining -= cost
+
+        if chosen:
+            article_blocks = []
+            for index in sorted(opened):
+                selected = sorted((p for p in chosen if p.article_index == index), key=lambda p: p.position)
+                body = []
+                for previous, passage in zip([None] + selected[:-1], selected):
+                    if previous is not None and passage.position != previous.position + 1:
+                        body.append("[...]")
+                    body.append(passage.text)
+                article_blocks.append(headers[index] + "\n".join(body) + "\n\n---\n")
+            articles_text = "\n".join(article_blocks)
+            blocks.append(f"{articles_heading}:\n{articles_text}" if articles_heading else articles_text)
+
+        text = "\n\n".join(blocks)
+        return PackedContext(
+            text=text,
+            tokens_in=tokens_in,
+            tokens_used=count_tokens(text),
+            passages_used=len(chosen),
+            passages_total=len(passages)
+        )
+
+    def _article_header(self, index: int, article: NewsArticle) -> str:
+        return (f"\nArticle {index + 1}: {article.title}\n"
+                f"Source: {article.source or 'Unknown'}\n"
+                f"URL: {article.url}\n"
+                f"Published: {article.published_date or 'Unknown'}\n\n")
+
+    def _split(self, articles: Sequence[NewsArticle]) -> List[_Passage]:
+        """Split articles into paragraph passages, breaking long paragraphs at sentences."""
+        passages = []
+        for article_index, article in enumerate(articles):
+            position = 0
+            for paragraph in re.split(r"\n\s*\n|\n", article.content or ""):
+                paragraph = paragraph.strip()
+                if not paragraph:
+                    continue
+                current = []
+                current_tokens = 0
+                for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+                    sentence_tokens = count_tokens(sentence)
+                    if current and current_tokens + sentence_tokens > self.passage_tokens:
+                        passages.append(_Passage(article_index, position, " ".join(current), current_tokens))
+                        position += 1
+                        current, current_tokens = [], 0
+                    current.append(sentence)
+                    current_tokens += sentence_tokens
+                if current:
+                    passages.append(_Passage(article_index, position, " ".join(current), current_tokens))
+                    position += 1
+        return passages
+
+    def _score(self, passages: List[_Passage], query: str) -> None:
+        """Score passages by term overlap with the query, favoring leads and top-ranked articles."""
+        query_terms = content_terms(query)
+        for passage in passages:
+            terms = content_terms(passage.text)
+            overlap = len(terms & query_terms) / math.sqrt(len(terms)) if terms else 0.0
+            lead_bonus = 0.3 if passage.position == 0 else 0.0
+            rank_bonus = 0.2 / (passage.article_index + 1)
+            passage.score = overlap + lead_bonus + rank_bonus
+
+
+def pack_for_agent(agent: str, articles: Sequence[NewsArticle], query: str,
+                   sections: Sequence[Tuple[str, List[str]]] = (),
+                   articles_heading: Optional[str] = None) -> PackedContext:
+    """
+    Pack context within an agent's configured budget and report the result.
+
+    Args:
+        agent: Agent name; the budget is Config.<AGENT>_CONTEXT_TOKENS
+        articles: Candidate articles, in search-rank order
+        query: Text the passages should be relevant to
+        sections: (heading, items) pairs in priority order
+        articles_heading: Optional heading above the article passages
+    """
+    budget = getattr(Config, f"{agent.upper()}_CONTEXT_TOKENS")
+    packed = ContextPacker(budget).pack(articles, query, sections, articles_heading)
+    print(f"📦 {agent} context: {packed.tokens_used:,}/{budget:,} tokens "
+          f"({packed.tokens_in:,} in, {packed.tokens_dropped:,} dropped; "
+          f"{packed.passages_used}/{packed.passages_total} passages)")
+    return packed
@@ -0,0 +1,329 @@
+"""
+Deduplication helpers for search results.
+Collapses the same story arriving from several queries or URLs, and
+syndicated copies of one wire story, before any of it reaches an LLM.
+"""
+
+import hashlib
+import random
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from src.state import NewsArticle
+
+# Query parameters that only track the click, not the content
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "cmpid", "ocid"}
+
+WORD_PATTERN = re.compile(r"\w+")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# MinHash: one universal hash (a*x + b) mod p per permutation, fixed seed so
+# signatures are comparable across runs
+MINHASH_PERMUTATIONS = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(MINHASH_PERMUTATIONS)]
+
+# Sentences shorter than this ("He said.") are never treated as repeats
+MIN_SENTENCE_WORDS = 6
+# SimHash fingerprints within this many differing bits are the same sentence
+SIMHASH_MAX_DISTANCE = 3
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different links to one page compare equal.
+
+    Lowercases scheme and host, drops "www.", fragments, trailing slashes
+    and tracking parameters (utm_*, fbclid, ...), and sorts the query.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host, path, urlencode(sorted(query)), ""))
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """Word n-gram shingles of a text, used for near-duplicate detection."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity between two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash(shingle_set: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set; equal positions estimate Jaccard similarity."""
+    if not shingle_set:
+        return ()
+    hashes = [_hash64(shingle) for shingle in shingle_set]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimated_jaccard(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Jaccard similarity estimated from two MinHash signatures."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of a text's words; near-identical texts differ in few bits."""
+    weights = [0] * 64
+    for word in WORD_PATTERN.findall(text.lower()):
+        h = _hash64(word)
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class DedupReport:
+    """What the dedup stage removed."""
+    articles_in: int
+    articles_out: int
+    sentences_removed: int
+    tokens_removed: int
+
+
+def _with_alternates(article: NewsArticle, urls: List[str]) -> NewsArticle:
+    """Copy of an article with extra source URLs recorded for attribution."""
+    known = {canonicalize_url(article.url)} | {canonicalize_url(url) for url in article.alternate_urls}
+    extra = []
+    for url in urls:
+        if url and canonicalize_url(url) not in known:
+            known.add(canonicalize_url(url))
+            extra.append(url)
+    if not extra:
+        return article
+    return article.model_copy(update={"alternate_urls": article.alternate_urls + extra})
+
+
+def collapse_near_duplicates(articles: List[NewsArticle],
+                             similarity_threshold: float = 0.7) -> List[NewsArticle]:
+    """
+    Collapse syndicated copies of the same story into one article.
+
+    Articles are compared by MinHash signature; each copy is folded into the
+    first (highest-ranked) article it matches, which keeps the longest text
+    among the copies and gains the others' URLs in alternate_urls.
+
+    Args:
+        articles: Articles in rank order
+        similarity_threshold: Estimated Jaccard similarity above which two articles are copies
+
+    Returns:
+        One article per distinct story, in rank order
+    """
+    kept: List[NewsArticle] = []
+    signatures: List[Tuple[int, ...]] = []
+
+    for article in articles:
+        signature = minhash(shingles(f"{article.title} {article.content}"))
+        match = next((index for index, other in enumerate(signatures)
+                      if estimated_jaccard(signature, other) >= similarity_threshold), None)
+        if match is None:
+            kept.append(article)
+            signatures.append(signature)
+            continue
+
+        representative = kept[match]
+        urls = [article.url, *article.alternate_urls]
+        if len(article.content) > len(representative.content):
+            # Keep the fullest copy's text, still credited to the first source
+            representative = representative.model_copy(update={"content": article.content})
+        kept[match] = _with_alternates(representative, urls)
+
+    return kept
+
+
+def _sentence_pieces(text: str) -> List[Tuple[str, str]]:
+    """Split text into (sentence, separator that follows it) pairs, keeping the separators."""
+    pieces = []
+    start = 0
+    for match in SENTENCE_PATTERN.finditer(text):
+        pieces.append((text[start:match.start()], match.group()))
+        start = match.end()
+    pieces.append((text[start:], ""))
+    return pieces
+
+
+def _join_kept(pieces: List[Tuple[str, str]], keep: List[bool]) -> str:
+    """
+    Rebuild text from the kept sentences with their original separators.
+
+    A dropped sentence takes its separator with it, except that the stronger
+    break (more newlines) around it survives, so paragraphs stay paragraphs.
+    """
+    parts: List[str] = []
+    pending = ""
+    for (sentence, separator), kept in zip(pieces, keep):
+        if kept:
+            if parts:
+                parts.append(pending)
+            parts.append(sentence)
+            pending = separator
+        elif separator.count("\n") > pending.count("\n"):
+            pending = separator
+    return "".join(parts)
+
+
+def remove_repeated_sentences(articles: List[NewsArticle]) -> Tuple[List[NewsArticle], int]:
+    """
+    Drop sentences that already appeared earlier in the article set.
+
+    Sentences are matched by SimHash so trivial edits (punctuation, a changed
+    word) still count as repeats. An article left with no new sentences is
+    folded into the article it repeated, keeping its URL.
+
+    Returns:
+        Tuple of (articles, number of sentences removed)
+    """
+    seen: List[Tuple[int, int]] = []  # (fingerprint, index in result)
+    result: List[NewsArticle] = []
+    removed = 0
+
+    for article in articles:
+        pieces = _sentence_pieces(article.content or "")
+        keep = [True] * len(pieces)
+        kept_sentences = []
+        repeated_from: Dict[int, int] = {}
+        for position, (sentence, _) in enumerate(pieces):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if len(sentence.split()) < MIN_SENTENCE_WORDS:
+                kept_sentences.append(sentence)
+                continue
+
+            fingerprint = simhash(sentence)
+            owner = next((index for other, index in seen
+                          if _hamming(fingerprint, other) <= SIMHASH_MAX_DISTANCE), None)
+            if owner is None:
+                seen.append((fingerprint, len(result)))
+                kept_sentences.append(sentence)
+            else:
+                keep[position] = False
+                removed += 1
+                repeated_from[owner] = repeated_from.get(owner, 0) + 1
+
+        substantive = [s for s in kept_sentences if len(s.split()) >= MIN_SENTENCE_WORDS]
+        if repeated_from and not substantive:
+            owner = max(repeated_from, key=repeated_from.get)
+            result[owner] = _with_alternates(result[owner], [article.url, *article.alternate_urls])
+            continue
+
+        if repeated_from:
+            # Cut only the repeated sentences so newlines and paragraph breaks survive
+            article = article.model_copy(update={"content": _join_kept(pieces, keep)})
+        result.append(article)
+
+    return result, removed
+
+
+def dedup_articles(articles: List[NewsArticle],
+                   similarity_threshold: float = 0.7) -> Tuple[List[NewsArticle], DedupReport]:
+    """
+    Collapse near-duplicate articles, then remove repeated sentences.
+
+    Every dropped copy's URL survives in the kept article's alternate_urls.
+
+    Args:
+        articles: Articles in rank order
+        similarity_threshold: Estimated Jaccard similarity above which two articles are copies
+
+    Returns:
+        Tuple of (deduplicated articles, DedupReport)
+    """
+    from src.utils.context_packer import count_tokens
+
+    def tokens(items: List[NewsArticle]) -> int:
+        return sum(count_tokens(f"{article.title}\n{article.content}") for article in items)
+
+    before = tokens(articles)
+    collapsed = collapse_near_duplicates(articles, similarity_threshold)
+    deduped, sentences_removed = remove_repeated_sentences(collapsed)
+
+    return deduped, DedupReport(
+        articles_in=len(articles),
+        articles_out=len(deduped),
+        sentences_removed=sentences_removed,
+        tokens_removed=max(0, before - tokens(deduped))
+    )
+
+
+def merge_articles(result_lists: List[List[NewsArticle]], max_results: int,
+                   similarity_threshold: float = 0.8) -> List[NewsArticle]:
+    """
+    Merge results from several queries into one list.
+
+    Results are interleaved round-robin so every query contributes, then
+    duplicate URLs and near-duplicate content are dropped (the first copy,
+    i.e. the one from the earliest query, is kept and records the other
+    copies' URLs in alternate_urls).
+
+    Args:
+        result_lists: Results per query, most important query first
+        max_results: Maximum number of merged articles
+        similarity_threshold: Estimated Jaccard similarity above which content is a duplicate
+
+    Returns:
+        Deduplicated articles
+    """
+    merged: List[NewsArticle] = []
+    seen_urls: Set[str] = set()
+    signatures: List[Tuple[int, ...]] = []
+
+    longest = max((len(results) for results in result_lists), default=0)
+    for rank in range(longest):
+        for results in result_lists:
+            if rank >= len(results) or len(merged) >= max_results:
+                continue
+            article = results[rank]
+
+            url = canonicalize_url(article.url) if article.url else ""
+            if url and url in seen_urls:
+                continue
+            if url:
+                seen_urls.add(url)
+
+            signature = minhash(shingles(f"{article.title} {article.content}"))
+            match = next((index for index, other in enumerate(signatures)
+                          if estimated_jaccard(signature, other) >= similarity_threshold), None)
+            if match is not None:
+                # Same story from another source: keep the URL for attribution
+                merged[match] = _with_alternates(merged[match], [article.url])
+                continue
+
+            signatures.append(signature)
+            merged.append(article)
+
+    return merged
@@ -0,0 +1,163 @@
+"""
+Shared HTTP transport for model clients.
+Every ChatOpenAI client uses the same keep-alive connection pool, so
+concurrent stories reuse warm connections instead of paying TCP and TLS
+setup per call. Connection reuse is counted through httpcore trace events.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Dict
+from src.config import Config
+from src.providers import LazyProvider
+
+
+class ConnectionStats:
+    """Thread-safe counters for requests and new connections."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self._lock = threading.Lock()
+
+    def _record(self, event_name: str) -> None:
+        # One "send_request_headers" per request; connect/TLS events only
+        # fire when the pool has no idle connection to hand out
+        with self._lock:
+            if event_name == "http11.send_request_headers.started" or \
+                    event_name == "http2.send_request_headers.started":
+                self.requests += 1
+            elif event_name == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                self.tls_handshakes += 1
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace callback for sync requests."""
+        self._record(event_name)
+
+    async def atrace(self, event_name: str, info: dict) -> None:
+        """httpcore trace callback for async requests."""
+        self._record(event_name)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get the counters plus the share of requests served on a reused connection."""
+        with self._lock:
+            reused = max(0, self.requests - self.connections_opened)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "tls_handshakes": self.tls_handshakes,
+                "connections_reused": reused,
+                "reuse_rate": reused / self.requests if self.requests else 0.0
+            }
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.requests = self.connections_opened = self.tls_handshakes = 0
+
+
+connection_stats = ConnectionStats()
+
+
+def _limits():
+    import httpx
+
+    return httpx.Limits(
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY_SECONDS
+    )
+
+
+def _timeout():
+    import httpx
+
+    return httpx.Timeout(Config.HTTP_TIMEOUT_SECONDS, connect=Config.HTTP_CONNECT_TIMEOUT_SECONDS)
+
+
+def _create_client():
+    """Build the shared sync client."""
+    import httpx
+
+    def attach_trace(request):
+        request.extensions["trace"] = connection_stats.trace
+
+    return httpx.Client(
+        limits=_limits(),
+        timeout=_timeout(),
+        event_hooks={"request": [attach_trace]}
+    )
+
+
+def _create_async_transport():
+    """
+    Build the shared async transport.
+
+    Async connections belong to the event loop that opened them, so the
+    transport keeps one pool per loop; within a loop every client shares it.
+    Each loop's pool is a plain AsyncClient, so proxy and CA settings from the
+    environment (trust_env) apply exactly as they do on the sync client.
+    """
+    import httpx
+
+    class LoopLocalTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._clients = weakref.WeakKeyDictionary()
+
+        async def handle_async_request(self, request):
+            loop = asyncio.get_running_loop()
+            client = self._clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(limits=_limits(), timeout=_timeout())
+                self._clients[loop] = client
+            return await client.send(request, stream=True)
+
+        async def aclose(self):
+            """Close the running loop's pool; other loops keep theirs."""
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
+
+    return LoopLocalTransport()
+
+
+def _create_async_client():
+    """Build the shared async client on the loop-local transport."""
+    import httpx
+
+    async def attach_trace(request):
+        request.extensions["trace"] = connection_stats.atrace
+
+    return httpx.AsyncClient(
+        transport=http_async_transport.get(),
+        timeout=_timeout(),
+        event_hooks={"request": [attach_trace]}
+    )
+
+
+# Shared clients, built on first use
+http_client = LazyProvider("http_client", _create_client)
+http_async_transport = LazyProvider("http_async_transport", _create_async_transport)
+http_async_client = LazyProvider("http_async_client", _create_async_client)
+
+
+async def aclose_loop_pool() -> None:
+    """
+    Close the running event loop's pooled connections.
+
+    Call it when an asyncio.run() entry point finishes: the pool dies with
+    its loop, and sockets left open are only reclaimed by the garbage
+    collector (with ResourceWarnings). A later request on the loop opens a
+    new pool.
+    """
+    if http_async_transport.initialized:
+        await http_async_transport.get().aclose()
+
+
+def http_stats() -> Dict[str, float]:
+    """Connection reuse counters for the shared clients."""
+    return connection_stats.snapshot()
@@ -0,0 +1,114 @@
+"""
+Content-addressed LLM response cache shared by all agents.
+Exact-match lookups keyed on the model configuration (model, temperature, ...)
+and the rendered prompt messages, persisted in SQLite.
+"""
+
+import json
+import os
+import threading
+import warnings
+from typing import Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+from src.config import Config
+from src.providers import LazyProvider
+from src.utils.cache import SQLiteCache, make_cache_key
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain cache adapter over a shared SQLiteCache.
+
+    One adapter is created per agent ("stage") so that hit rates can be
+    reported separately, while the underlying store is shared.
+    """
+
+    def __init__(self, store: SQLiteCache, stage: str):
+        """
+        Args:
+            store: Shared persistent store
+            stage: Agent name used for per-stage counters
+        """
+        self.store = store
+        self.stage = stage
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Content-addressed key; llm_string carries model and sampling params."""
+        return make_cache_key("llm", llm_string, prompt)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Return cached generations for this prompt and model, if any."""
+        cached = self.store.get(self._key(prompt, llm_string))
+
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return [loads(item, allowed_objects="core") for item in json.loads(cached)]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store generations for this prompt and model."""
+        payload = json.dumps([dumps(generation) for generation in return_val])
+        self.store.set(self._key(prompt, llm_string), payload)
+
+    def clear(self, **kwargs) -> None:
+        """Clear the shared store (affects every stage)."""
+        self.store.clear()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters for this stage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def _create_store() -> SQLiteCache:
+    """Open the persistent store backing every stage cache."""
+    return SQLiteCache(
+        os.path.join(Config.CACHE_DIR, "llm_cache.sqlite"),
+        ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+        max_entries=Config.LLM_CACHE_MAX_ENTRIES
+    )
+
+
+llm_cache_store = LazyProvider("llm_cache_store", _create_store)
+
+_stage_caches: Dict[str, LLMResponseCache] = {}
+_stage_lock = threading.Lock()
+
+
+def get_llm_cache(stage: str) -> Optional[LLMResponseCache]:
+    """
+    Get the cache for an agent, or None if that agent has not opted in.
+
+    Args:
+        stage: Agent name (researcher, editor, journalist, fact_checker)
+    """
+    if not Config.LLM_CACHE_ENABLED or stage not in Config.LLM_CACHE_AGENTS:
+        return None
+
+    with _stage_lock:
+        if stage not in _stage_caches:
+            _stage_caches[stage] = LLMResponseCache(llm_cache_store.get(), stage)
+        return _stage_caches[stage]
+
+
+def llm_cache_stats() -> Dict[str, dict]:
+    """Get per-stage hit/miss counters for every cache in use."""
+    with _stage_lock:
+        return {stage: cache.stats() for stage, cache in _stage_caches.items()}
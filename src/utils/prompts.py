@@ -23,6 +23,29 @@ Search Results:
 {search_results}
 """
 
+# Fast mode: research extraction and editorial angle in one call
+RESEARCHER_FAST_SYSTEM_PROMPT = """You are an expert news researcher and a creative news editor. Your job is to:
+1. Analyze search results about a given topic
+2. Extract key facts and provide a clear summary of the current situation
+3. Find the most interesting angle for a story, grounded in those facts
+4. Suggest the right tone and the key points to emphasize
+
+Be thorough but concise. Facts must come from the search results."""
+
+RESEARCHER_FAST_USER_PROMPT = """Research the following topic and plan a {format_type} piece about it: {topic}
+
+Based on the search results provided, provide:
+- Key facts (at least 5)
+- A brief summary (2-3 sentences)
+- An interesting angle/hook for the story
+- Reasoning for why this angle works
+- Suggested tone (e.g., analytical, enthusiastic, skeptical)
+- 3-5 key points to emphasize
+
+Search Results:
+{search_results}
+"""
+
 # Editor Agent Prompts
 EDITOR_SYSTEM_PROMPT = """You are a creative news editor. Your job is to:
 1. Find the most interesting angle for a story
@@ -107,6 +130,27 @@ Requirements:
 - Write complete, publication-ready content
 """
 
+JOURNALIST_REVISION_PROMPT = """A fact-checker flagged some sections of your {format_type} piece about {topic}.
+Revise ONLY the sections below so they are accurate, keeping the tone, style
+and length of each section.
+
+Flagged Sections:
+{sections}
+
+Issues Found:
+{issues}
+
+Suggestions:
+{suggestions}
+
+Verified Context:
+{context}
+
+Return every section above, revised, in exactly this form and nothing else:
+[S<number>]
+<revised section text>
+"""
+
 # Fact Checker Agent Prompts
 FACT_CHECKER_SYSTEM_PROMPT = """You are a meticulous fact-checker. Your job is to:
 1. Verify that the content matches the source material
@@ -137,6 +181,22 @@ Provide:
 - Confidence score (0.0 to 1.0)
 """
 
+FACT_CHECKER_PARAGRAPH_PROMPT = """Review this paragraph from an article about {topic} for accuracy.
+The rest of the article is still being written, so judge only the claims made here.
+
+Paragraph:
+{paragraph}
+
+Original Source Material:
+{source_material}
+
+Provide:
+- Whether the paragraph is accurate (true/false)
+- List of any issues found
+- Suggestions for improvement
+- Confidence score (0.0 to 1.0)
+"""
+
 
 # Format-specific templates
 FORMAT_TEMPLATES = {
@@ -0,0 +1,285 @@
+"""
+Process-wide rate limiting with retry and backoff for OpenAI and Tavily.
+Bursts of concurrent workflows queue on a token bucket instead of failing,
+and rate-limit errors are retried with jittered exponential backoff.
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+from src.config import Config
+
+# Exception class names worth retrying, matched by name so neither SDK has to be
+# imported here (openai: RateLimitError, ...; tavily: UsageLimitExceededError, ...)
+RETRYABLE_ERRORS = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "UsageLimitExceededError",
+    "TimeoutError",
+    "ConnectionError",
+    "ConnectTimeout",
+    "ReadTimeout",
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that lets callers reserve capacity in advance.
+
+    Reservations may drive the balance negative; each caller then waits for
+    its share to refill, so a burst queues in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: Refill rate; the bucket holds at most one minute's worth
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve capacity.
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return max(0.0, -self.tokens / self.rate)
+
+
+class RateLimiter:
+    """Request and token budgets for one provider."""
+
+    def __init__(self, name: str, requests_per_minute: float, tokens_per_minute: float = 0):
+        """
+        Args:
+            name: Provider name
+            requests_per_minute: Request budget (0 disables)
+            tokens_per_minute: Token budget (0 disables)
+        """
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.total_wait_seconds = 0.0
+        self.total_retries = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens is not None and tokens:
+            wait = max(wait, self.tokens.reserve(tokens))
+        return wait
+
+    def record_wait(self, seconds: float) -> None:
+        """Account time spent waiting (queueing or backing off) on this provider."""
+        with self._lock:
+            self.total_wait_seconds += seconds
+        _add_wait(seconds)
+
+    def record_retry(self) -> None:
+        """Count a retried request."""
+        with self._lock:
+            self.total_retries += 1
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request (and the given tokens) fit the budget.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+            self.record_wait(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async version of acquire()."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            self.record_wait(wait)
+        return wait
+
+    def stats(self) -> dict:
+        """Get cumulative wait and retry counters."""
+        return {
+            "wait_seconds": round(self.total_wait_seconds, 3),
+            "retries": self.total_retries
+        }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_active: contextvars.ContextVar[frozenset] = contextvars.ContextVar("rate_limited_calls", default=frozenset())
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Get the shared limiter for a provider, configured from Config."""
+    with _limiters_lock:
+        if provider not in _limiters:
+            if provider == "openai":
+                limiter = RateLimiter(provider, Config.OPENAI_REQUESTS_PER_MINUTE,
+                                      Config.OPENAI_TOKENS_PER_MINUTE)
+            elif provider == "tavily":
+                limiter = RateLimiter(provider, Config.TAVILY_REQUESTS_PER_MINUTE)
+            else:
+                limiter = RateLimiter(provider, 0)
+            _limiters[provider] = limiter
+        return _limiters[provider]
+
+
+def rate_limiter_stats() -> Dict[str, dict]:
+    """Get counters for every limiter in use."""
+    with _limiters_lock:
+        return {name: limiter.stats() for name, limiter in _limiters.items()}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is a rate limit, timeout or transient server failure."""
+    if type(error).__name__ in RETRYABLE_ERRORS:
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or (isinstance(status, int) and status >= 500)
+
+
+def backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """
+    Jittered exponential backoff ("full jitter"), honoring Retry-After if sent.
+
+    Args:
+        attempt: Zero-based retry number
+        error: The error being retried
+    """
+    ceiling = min(Config.BACKOFF_MAX_SECONDS, Config.BACKOFF_BASE_SECONDS * (2 ** attempt))
+    delay = random.uniform(0, ceiling)
+
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        delay = max(delay, float(headers.get("retry-after", 0)))
+    except (TypeError, ValueError):
+        pass
+    return delay
+
+
+def call_with_retry(provider: str, fn: Callable[[], Any], tokens: int = 0) -> Any:
+    """
+    Call fn under the provider's rate limiter, retrying transient failures.
+
+    Args:
+        provider: Provider name ("openai", "tavily")
+        fn: Zero-argument callable making one request
+        tokens: Estimated tokens the request consumes
+    """
+    if provider in _active.get():
+        # Already counted and retried by an outer call (e.g. _generate -> _stream)
+        return fn()
+
+    limiter = get_rate_limiter(provider)
+    token = _active.set(_active.get() | {provider})
+    try:
+        return _retry_loop(provider, limiter, fn, tokens)
+    finally:
+        _active.reset(token)
+
+
+def _retry_loop(provider: str, limiter: RateLimiter, fn: Callable[[], Any], tokens: int) -> Any:
+    for attempt in range(Config.RATE_LIMIT_MAX_RETRIES + 1):
+        limiter.acquire(tokens)
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= Config.RATE_LIMIT_MAX_RETRIES or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            print(f"⏳ {provider} {type(e).__name__}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{Config.RATE_LIMIT_MAX_RETRIES})")
+            limiter.record_retry()
+            time.sleep(delay)
+            limiter.record_wait(delay)
+
+
+async def acall_with_retry(provider: str, fn: Callable[[], Awaitable[Any]], tokens: int = 0) -> Any:
+    """Async version of call_with_retry(); fn returns an awaitable."""
+    if provider in _active.get():
+        return await fn()
+
+    limiter = get_rate_limiter(provider)
+    token = _active.set(_active.get() | {provider})
+    try:
+        return await _aretry_loop(provider, limiter, fn, tokens)
+    finally:
+        _active.reset(token)
+
+
+async def _aretry_loop(provider: str, limiter: RateLimiter, fn: Callable[[], Awaitable[Any]],
+                       tokens: int) -> Any:
+    for attempt in range(Config.RATE_LIMIT_MAX_RETRIES + 1):
+        await limiter.aacquire(tokens)
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= Config.RATE_LIMIT_MAX_RETRIES or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            print(f"⏳ {provider} {type(e).__name__}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{Config.RATE_LIMIT_MAX_RETRIES})")
+            limiter.record_retry()
+            await asyncio.sleep(delay)
+            limiter.record_wait(delay)
+
+
+# Per-node accounting: a node opens a wait scope and every limiter wait or
+# backoff sleep in that call chain is added to it.
+_wait_scope: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar("limiter_wait_scope", default=None)
+_wait_scope_lock = threading.Lock()
+
+
+def _add_wait(seconds: float) -> None:
+    scope = _wait_scope.get()
+    if scope is not None:
+        # Worker threads of one node (e.g. parallel searches) share the scope
+        with _wait_scope_lock:
+            scope[0] += seconds
+
+
+@contextmanager
+def limiter_wait_scope():
+    """
+    Measure time spent waiting on rate limiters inside a block.
+
+    Yields:
+        Single-element list holding the accumulated wait in seconds
+    """
+    scope = [0.0]
+    token = _wait_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _wait_scope.reset(token)
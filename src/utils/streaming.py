@@ -0,0 +1,33 @@
+"""
+Helpers for consuming streamed LLM output.
+"""
+
+from typing import List
+
+
+class ParagraphSplitter:
+    """
+    Accumulates streamed text and emits paragraphs as soon as they are complete.
+
+    A paragraph is complete once a blank line follows it; whatever remains
+    when the stream ends is emitted by flush().
+    """
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add a chunk of streamed text.
+
+        Returns:
+            Paragraphs completed by this chunk (possibly none)
+        """
+        self._buffer += text
+        *complete, self._buffer = self._buffer.replace("\r\n", "\n").split("\n\n")
+        return [paragraph.strip() for paragraph in complete if paragraph.strip()]
+
+    def flush(self) -> List[str]:
+        """Return the final, unterminated paragraph (if any) and reset."""
+        remainder, self._buffer = self._buffer.strip(), ""
+        return [remainder] if remainder else []
@@ -63,6 +63,32 @@ def test_workflow(topic: str = "Latest developments in AI",
         for idx, url in enumerate(content.sources_used, 1):
             print(f"  {idx}. {url}")
         
+        from src.utils.llm_cache import llm_cache_stats
+        
+        cache_stats = llm_cache_stats()
+        if cache_stats:
+            print("\nLLM Cache Hit Rate:")
+            for stage, stats in cache_stats.items():
+                print(f"  {stage}: {stats['hit_rate']:.0%} ({stats['hits']} hits, {stats['misses']} misses)")
+        
+        from src.agents.structured import structured_output_stats
+        
+        parse_stats = structured_output_stats()
+        if parse_stats:
+            print("\nStructured Output Parse Failures:")
+            for agent, stats in parse_stats.items():
+                print(f"  {agent}: {stats['failure_rate']:.0%} ({stats['failures']}/{stats['calls']} calls)")
+        
+        from src.agents.routing import model_tier_stats
+        
+        tier_stats = model_tier_stats()
+        if tier_stats:
+            print("\nModel Tiers:")
+            for tier, stats in tier_stats.items():
+                print(f"  {tier} ({', '.join(stats['models'])}): {stats['calls']} calls, "
+                      f"{stats['mean_latency_seconds']:.2f}s mean, "
+                      f"{stats['input_tokens'] + stats['output_tokens']:,} tokens, ${stats['cost_usd']:.4f}")
+        
         print("\n✅ Test completed successfully!")
     
     elif final_state and final_state.error_message:
@@ -73,11 +99,46 @@ def test_workflow(topic: str = "Latest developments in AI",
     print("\n" + "=" * 80)
 
 
+def test_multi_format(topic: str = "Latest developments in AI"):
+    """
+    Test generating all formats from a single research pass.
+    
+    Args:
+        topic: News topic to research
+    """
+    from src.graph.workflow import run_multi_format
+    
+    print("=" * 80)
+    print("THE DAILY AI - MULTI-FORMAT TEST")
+    print("=" * 80)
+    print(f"\nTopic: {topic}")
+    print("\n" + "=" * 80 + "\n")
+    
+    results = run_multi_format(topic)
+    
+    print("\n" + "=" * 80)
+    print("RESULTS")
+    print("=" * 80 + "\n")
+    
+    for format_type, content in results.items():
+        print(f"[{format_type}] {content.title} ({content.word_count} words)")
+    
+    if results:
+        print("\n✅ Test completed successfully!")
+    else:
+        print("❌ No content generated")
+    
+    print("\n" + "=" * 80)
+
+
 if __name__ == "__main__":
     import sys
     
     # Allow command-line arguments
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and sys.argv[1] == "--all-formats":
+        topic = " ".join(sys.argv[2:]) or "Latest developments in AI"
+        test_multi_format(topic)
+    elif len(sys.argv) > 1:
         topic = " ".join(sys.argv[1:])
         test_workflow(topic)
     else: